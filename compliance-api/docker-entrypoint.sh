@@ -29,4 +29,4 @@ else
 fi
 
 echo 'starting application'
-gunicorn --bind 0.0.0.0:8080 --timeout 60 --workers 3  wsgi:application
+BACKGROUND_JOBS_ENABLED=${BACKGROUND_JOBS_ENABLED:-true} gunicorn --bind 0.0.0.0:8080 --timeout 60 --workers 3  wsgi:application
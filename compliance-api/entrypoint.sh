@@ -1,2 +1,2 @@
 #!/bin/bash
-flask db upgrade && python wsgi.py
\ No newline at end of file
+flask db upgrade && BACKGROUND_JOBS_ENABLED=${BACKGROUND_JOBS_ENABLED:-true} python wsgi.py
\ No newline at end of file
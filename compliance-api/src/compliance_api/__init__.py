@@ -4,17 +4,19 @@ This module is for the initiation of the flask app.
 """
 
 import os
+import time
 from http import HTTPStatus
 
 import secure
 from flask import Flask, current_app, g, request
 from flask_cors import CORS
-from jose import jwt as jose_jwt
 
 from compliance_api.auth import jwt
+from compliance_api.commands import register_commands
 from compliance_api.config import get_named_config
 from compliance_api.exceptions import PermissionDeniedError
 from compliance_api.models import db, ma, migrate
+from compliance_api.utils import fan_out, metrics, request_memo
 from compliance_api.utils.cache import cache
 from compliance_api.utils.util import allowedorigins
 
@@ -65,14 +67,19 @@ def create_app(run_mode=os.getenv("FLASK_ENV", "development")):
     app.register_blueprint(API_BLUEPRINT)  # Create the database (run once)
     app.register_blueprint(OPS_BLUEPRINT)
     register_shellcontext(app)
+    register_commands(app)
+    start_background_jobs(app)
 
     @app.before_request
     def set_origin():
+        g.request_started = time.perf_counter()
+        metrics.start_request()
+        request_memo.reset()
         g.origin_url = request.environ.get("HTTP_ORIGIN", "localhost")
         auth_header = request.headers.get("Authorization")
         if auth_header and auth_header.startswith("Bearer "):
             token = jwt.get_token_auth_header()
-            token_info = jose_jwt.get_unverified_claims(token)
+            token_info = jwt.get_verified_claims(token)
             is_compliance_in_groups = any(
                 "COMPLIANCE" in group for group in token_info.get("groups", [])
             )
@@ -84,6 +91,7 @@ def create_app(run_mode=os.getenv("FLASK_ENV", "development")):
             g.access_token = None
 
     build_cache(app)
+    fan_out.init_app(app)
 
     @app.after_request
     def set_secure_headers(response):
@@ -94,6 +102,33 @@ def create_app(run_mode=os.getenv("FLASK_ENV", "development")):
         response.headers["Cross-Origin-Embedder-Policy"] = "unsafe-none"
         return response
 
+    @app.after_request
+    def report_memo_hits(response):
+        """Log the request memo hits, and return them in a header in debug mode."""
+        memo_hits = request_memo.get_hit_counts()
+        if memo_hits:
+            current_app.logger.debug(f"Request memo hits for {request.path}: {memo_hits}")
+            if current_app.debug:
+                response.headers["X-Request-Memo-Hits"] = ", ".join(
+                    f"{key}={count}" for key, count in memo_hits.items()
+                )
+        return response
+
+    @app.after_request
+    def log_request(response):
+        """Record the latency of the request by route and log it with its outbound calls."""
+        started = g.pop("request_started", None)
+        if started is None:
+            return response
+        seconds = time.perf_counter() - started
+        route = request.url_rule.rule if request.url_rule else "unmatched"
+        metrics.observe_request(request.method, route, response.status_code, seconds)
+        current_app.logger.info(
+            f"{request.method} {request.path} {response.status_code} {seconds * 1000:.0f}ms "
+            f"outbound: {metrics.get_request_summary() or 'none'}"
+        )
+        return response
+
     @app.errorhandler(Exception)
     def handle_error(err):
         if run_mode != "production":
@@ -121,6 +156,22 @@ def setup_jwt_manager(app_context, jwt_manager):
 
     app_context.config["JWT_ROLE_CALLBACK"] = custom_role_callback
     jwt_manager.init_app(app_context)
+    # Load the signing keys now so that no request waits for them.
+    jwt_manager.prefetch_jwks()
+
+
+def start_background_jobs(app):
+    """Start the scheduled background jobs enabled in the configuration, in serving processes only."""
+    # pylint: disable=import-outside-toplevel
+    from compliance_api.services.project_sync import start_project_sync_scheduler
+    from compliance_api.services.staff_user_group_update import start_group_update_dispatcher
+
+    if not app.config["BACKGROUND_JOBS_ENABLED"]:
+        return
+    if app.config["PROJECT_SYNC_INTERVAL"]:
+        start_project_sync_scheduler(app)
+    if app.config["AUTH_OUTBOX_DISPATCH_INTERVAL"]:
+        start_group_update_dispatcher(app)
 
 
 def register_shellcontext(app):
@@ -16,18 +16,26 @@ from functools import wraps
 from http import HTTPStatus
 
 from flask import g, request
-from flask_jwt_oidc import JwtManager
 
 from compliance_api.exceptions import PermissionDeniedError
 from compliance_api.services import CaseFileService, ComplaintService, InspectionService
+from compliance_api.utils import authorization_cache
 from compliance_api.utils.constant import GROUP_MAP
 from compliance_api.utils.enum import ContextEnum
+from compliance_api.utils.jwt_manager import CachedJwtManager
 
 
 jwt = (
-    JwtManager()
+    CachedJwtManager()
 )  # pylint: disable=invalid-name; lower case name as used by convention in most Flask apps
 
+# The view argument holding the record id and the service checking the assignment, by context.
+CONTEXT_SERVICE_MAP = {
+    ContextEnum.INSPECTION: ("inspection_id", InspectionService),
+    ContextEnum.COMPLAINT: ("complaint_id", ComplaintService),
+    ContextEnum.CASE_FILE: ("case_file_id", CaseFileService),
+}
+
 
 class Auth:  # pylint: disable=too-few-public-methods
     """Extending JwtManager to include additional functionalities."""
@@ -48,36 +56,37 @@ class Auth:  # pylint: disable=too-few-public-methods
 
     @classmethod
     def is_allowed(cls, context: ContextEnum, permissions):
-        """Check to see if user is allowed to access the function."""
+        """Check to see if user is allowed to access the function.
+
+        The user is allowed if the token has one of the groups of the permissions,
+        else if the user is assigned to the record; the assignment decision is
+        cached for a short time.
+        """
+        # Retrieve the corresponding ID and service for the given context
+        id_field, service = CONTEXT_SERVICE_MAP.get(context, (None, None))
+        #  map the permission enum values to the user groups
+        mapped_groups = _map_permission_to_groups(permissions)
 
         def decorated(f):
             @Auth.require
             @wraps(f)
             def wrapper(*args, **kwargs):
-                auth_user_guid = g.token_info["preferred_username"]
-
-                # Create a context-to-service mapping
-                context_service_map = {
-                    ContextEnum.INSPECTION: ("inspection_id", InspectionService),
-                    ContextEnum.COMPLAINT: ("complaint_id", ComplaintService),
-                    ContextEnum.CASE_FILE: ("case_file_id", CaseFileService),
-                }
-
-                # Retrieve the corresponding ID and service for the given context
-                id_field, service = context_service_map.get(context, (None, None))
+                if not (id_field and service):
+                    raise PermissionDeniedError("Invalid Context", HTTPStatus.FORBIDDEN)
 
-                if id_field and service:
-                    is_allowed = service.is_assigned_user(
-                        kwargs[id_field], auth_user_guid
+                if not jwt.contains_role(mapped_groups):
+                    auth_user_guid = g.token_info["preferred_username"]
+                    entity_id = kwargs[id_field]
+                    is_allowed = authorization_cache.get_or_check(
+                        context,
+                        entity_id,
+                        auth_user_guid,
+                        lambda: service.is_assigned_user(entity_id, auth_user_guid),
                     )
-                    #  map the permission enum values to the user groups
-                    mapped_groups = _map_permission_to_groups(permissions)
-                    if not is_allowed and not jwt.contains_role(mapped_groups):
+                    if not is_allowed:
                         raise PermissionDeniedError(
                             "Access Denied", HTTPStatus.FORBIDDEN
                         )
-                else:
-                    raise PermissionDeniedError("Invalid Context", HTTPStatus.FORBIDDEN)
 
                 return f(*args, **kwargs)
 
@@ -92,12 +101,12 @@ class Auth:  # pylint: disable=too-few-public-methods
         Args:
             permissions [str,]: Comma separated list of valid permissions
         """
+        mapped_groups = _map_permission_to_groups(permissions)
 
         def decorated(f):
             @Auth.require
             @wraps(f)
             def wrapper(*args, **kwargs):
-                mapped_groups = _map_permission_to_groups(permissions)
                 if jwt.contains_role(mapped_groups):
                     return f(*args, **kwargs)
 
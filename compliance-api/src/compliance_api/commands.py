@@ -0,0 +1,23 @@
+"""Flask CLI commands of the API."""
+
+import click
+from flask.cli import with_appcontext
+
+
+@click.command("sync-projects")
+@with_appcontext
+def sync_projects_command():
+    """Mirror the EPIC.Track projects into the local projects table, even if synced recently."""
+    # pylint: disable=import-outside-toplevel
+    from compliance_api.services.project_sync import ProjectSyncService
+
+    result = ProjectSyncService.sync(force=True)
+    click.echo(
+        f"Projects created: {result['created']}, updated: {result['updated']}, "
+        f"unchanged: {result['unchanged']}, skipped: {result['skipped']}"
+    )
+
+
+def register_commands(app):
+    """Register the CLI commands."""
+    app.cli.add_command(sync_projects_command)
@@ -21,6 +21,7 @@ rather than reading environment variables directly or by accessing this configur
 
 import os
 import sys
+import tempfile
 
 from dotenv import find_dotenv, load_dotenv
 
@@ -84,6 +85,59 @@ class _Config:  # pylint: disable=too-few-public-methods
     AUTH_BASE_URL = os.getenv("AUTH_BASE_URL")
     EPIC_TRACK_URL = os.getenv("EPIC_TRACK_URL")
 
+    # Outbound HTTP client (EPIC.Track / EPIC.Authorize)
+    # Number of per-host pools and the number of kept-alive connections per host, per worker.
+    OUTBOUND_POOL_CONNECTIONS = int(os.getenv("OUTBOUND_POOL_CONNECTIONS", "4"))
+    OUTBOUND_POOL_MAXSIZE = int(os.getenv("OUTBOUND_POOL_MAXSIZE", "10"))
+    OUTBOUND_CONNECT_TIMEOUT = float(os.getenv("OUTBOUND_CONNECT_TIMEOUT", "3.05"))
+    OUTBOUND_READ_TIMEOUT = float(os.getenv("OUTBOUND_READ_TIMEOUT", "10"))
+    # Total seconds a call may take including retries, unless the endpoint has its own budget.
+    OUTBOUND_DEADLINE = float(os.getenv("OUTBOUND_DEADLINE", "10"))
+    # Retries of GET calls on connection errors, timeouts and 502/503/504, and the backoff base in seconds.
+    OUTBOUND_MAX_RETRIES = int(os.getenv("OUTBOUND_MAX_RETRIES", "2"))
+    OUTBOUND_RETRY_BACKOFF = float(os.getenv("OUTBOUND_RETRY_BACKOFF", "0.2"))
+    # Consecutive failures that open the circuit breaker, and seconds before a trial call.
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD = int(os.getenv("CIRCUIT_BREAKER_FAILURE_THRESHOLD", "5"))
+    CIRCUIT_BREAKER_RESET_TIMEOUT = float(os.getenv("CIRCUIT_BREAKER_RESET_TIMEOUT", "30"))
+    # Thread pool running independent outbound lookups concurrently, per worker.
+    FAN_OUT_MAX_WORKERS = int(os.getenv("FAN_OUT_MAX_WORKERS", "8"))
+    # Upper bound in seconds on waiting for a fan-out; each call also has its own deadline.
+    FAN_OUT_TIMEOUT = float(os.getenv("FAN_OUT_TIMEOUT", "30"))
+
+    # EPIC.Track indigenous nation catalog cache, in seconds.
+    # Entries older than the refresh age are served while a background reload runs.
+    FIRST_NATION_CACHE_TTL = int(os.getenv("FIRST_NATION_CACHE_TTL", "3600"))
+    FIRST_NATION_CACHE_REFRESH_AGE = int(os.getenv("FIRST_NATION_CACHE_REFRESH_AGE", "2700"))
+
+    # Node-local cache shared by the workers (SQLite file).
+    SHARED_CACHE_PATH = os.getenv("SHARED_CACHE_PATH") or os.path.join(
+        tempfile.gettempdir(), "compliance-api-cache.sqlite3"
+    )
+    # EPIC.Track project details: fresh for the ttl, then served stale while revalidated.
+    PROJECT_CACHE_TTL = int(os.getenv("PROJECT_CACHE_TTL", "300"))
+    PROJECT_CACHE_STALE_TTL = int(os.getenv("PROJECT_CACHE_STALE_TTL", "3600"))
+    # EPIC.Authorize user records and app user list, dropped when a user group is updated.
+    AUTH_USER_CACHE_TTL = int(os.getenv("AUTH_USER_CACHE_TTL", "300"))
+    AUTH_USER_CACHE_STALE_TTL = int(os.getenv("AUTH_USER_CACHE_STALE_TTL", "900"))
+    # Outbox of the staff user group updates sent to EPIC.Authorize.
+    # The updates are dispatched right after the commit and every interval seconds (0 disables the schedule).
+    AUTH_OUTBOX_DISPATCH_ON_COMMIT = os.getenv("AUTH_OUTBOX_DISPATCH_ON_COMMIT", "true").lower() == "true"
+    AUTH_OUTBOX_DISPATCH_INTERVAL = int(os.getenv("AUTH_OUTBOX_DISPATCH_INTERVAL", "30"))
+    AUTH_OUTBOX_BATCH_SIZE = int(os.getenv("AUTH_OUTBOX_BATCH_SIZE", "50"))
+    AUTH_OUTBOX_MAX_ATTEMPTS = int(os.getenv("AUTH_OUTBOX_MAX_ATTEMPTS", "10"))
+    AUTH_OUTBOX_RETRY_BACKOFF = int(os.getenv("AUTH_OUTBOX_RETRY_BACKOFF", "30"))
+    AUTH_OUTBOX_MAX_BACKOFF = int(os.getenv("AUTH_OUTBOX_MAX_BACKOFF", "3600"))
+    # Time a dispatcher holds an update while delivering it, longer than the EPIC.Authorize deadline.
+    AUTH_OUTBOX_LEASE = int(os.getenv("AUTH_OUTBOX_LEASE", "120"))
+    # Officer assignment decisions of the permission checks, kept per worker, in seconds. 0 disables the cache.
+    AUTHORIZATION_CACHE_TTL = int(os.getenv("AUTHORIZATION_CACHE_TTL", "30"))
+    AUTHORIZATION_CACHE_SIZE = int(os.getenv("AUTHORIZATION_CACHE_SIZE", "10000"))
+    # Start the scheduled jobs (project sync, group update dispatch) in this process.
+    # Only the serving processes set it, so the flask CLI and the tests never run them.
+    BACKGROUND_JOBS_ENABLED = os.getenv("BACKGROUND_JOBS_ENABLED", "false").lower() == "true"
+    # Seconds between the EPIC.Track project syncs run by each worker. 0 disables the schedule.
+    PROJECT_SYNC_INTERVAL = int(os.getenv("PROJECT_SYNC_INTERVAL", "900"))
+
     JWT_OIDC_WELL_KNOWN_CONFIG = os.getenv("JWT_OIDC_WELL_KNOWN_CONFIG")
     JWT_OIDC_ALGORITHMS = os.getenv("JWT_OIDC_ALGORITHMS", "RS256")
     JWT_OIDC_JWKS_URI = os.getenv("JWT_OIDC_JWKS_URI")
@@ -91,6 +145,8 @@ class _Config:  # pylint: disable=too-few-public-methods
     JWT_OIDC_AUDIENCE = os.getenv("JWT_OIDC_AUDIENCE", "account")
     JWT_OIDC_CACHING_ENABLED = os.getenv("JWT_OIDC_CACHING_ENABLED", "True")
     JWT_OIDC_JWKS_CACHE_TIMEOUT = 300
+    # Number of verified tokens whose claims are kept by each worker until the tokens expire.
+    JWT_CLAIMS_CACHE_SIZE = int(os.getenv("JWT_CLAIMS_CACHE_SIZE", "2048"))
     DB_ECRPT_KEY = os.getenv("DB_ECRPT_KEY")
     SKIPPED_MIGRATIONS = os.getenv("SKIPPED_MIGRATIONS", None)
 
@@ -119,6 +175,12 @@ class TestConfig(_Config):  # pylint: disable=too-few-public-methods
         f"postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{int(DB_PORT)}/{DB_NAME}"
     )
 
+    # A cache file of its own for each test run, not shared with other runs or local workers.
+    SHARED_CACHE_PATH = os.path.join(tempfile.gettempdir(), f"compliance-api-test-cache-{os.getpid()}.sqlite3")
+    PROJECT_SYNC_INTERVAL = 0
+    AUTH_OUTBOX_DISPATCH_ON_COMMIT = False
+    AUTH_OUTBOX_DISPATCH_INTERVAL = 0
+
     JWT_OIDC_TEST_MODE = True
     # JWT_OIDC_ISSUER = _get_config('JWT_OIDC_TEST_ISSUER')
     JWT_OIDC_TEST_AUDIENCE = os.getenv("JWT_OIDC_TEST_AUDIENCE")
@@ -28,6 +28,8 @@ from .inspection import (
 from .position import Position
 from .project import Project
 from .project_status import ProjectStatusOption
+from .project_sync_state import ProjectSyncState
 from .requirement_source import RequirementSource
 from .staff_user import StaffUser
+from .staff_user_group_update import GroupUpdateStatusEnum, StaffUserGroupUpdate
 from .topic import Topic
@@ -5,7 +5,7 @@ Manages the agency
 
 from __future__ import annotations
 
-from sqlalchemy import Column, Integer, String
+from sqlalchemy import Column, Index, Integer, String
 
 from .base_model import BaseModelVersioned
 
@@ -18,6 +18,7 @@ class Agency(BaseModelVersioned):
     id = Column(Integer, primary_key=True, autoincrement=True)
     name = Column(String(150), nullable=False)
     abbreviation = Column(String(10), nullable=True)
+    __table_args__ = (Index("ix_agencies_name", "name"),)
 
     @classmethod
     def get_by_name(cls, agency_name: str) -> Agency:
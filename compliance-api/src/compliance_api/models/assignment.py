@@ -0,0 +1,73 @@
+"""Officer assignment lookups shared by the case file, inspection and complaint models.
+
+An assignment check answers whether a user is the primary officer or one of
+the other officers of a record with a single EXISTS query, without loading the
+record or its officers. The assignment filter restricts a list query to the
+records of an officer the same way.
+"""
+
+from sqlalchemy import and_, exists, or_, select
+
+from .db import db
+from .staff_user import StaffUser
+
+
+def is_assigned_officer(
+    entity_model, entity_id: int, auth_user_guid: str, officer_model=None, officer_fk=None
+) -> bool:
+    """Return whether the user is the primary officer or one of the other officers of the record.
+
+    Args:
+        entity_model: The model of the record, with a primary_officer_id column.
+        entity_id (int): The id of the record.
+        auth_user_guid (str): The unique identifier of the user from the identity provider.
+        officer_model: The model linking the other officers to the record, if the record has any.
+        officer_fk: The column of officer_model holding the id of the record.
+    """
+    live_entity = and_(entity_model.id == entity_id, entity_model.is_deleted.is_(False))
+    primary_officer = exists().where(
+        live_entity,
+        StaffUser.id == entity_model.primary_officer_id,
+        StaffUser.auth_user_guid == auth_user_guid,
+    )
+    if officer_model is None:
+        return db.session.execute(select(primary_officer)).scalar()
+    other_officer = exists().where(
+        officer_fk == entity_id,
+        officer_model.is_deleted.is_(False),
+        StaffUser.id == officer_model.officer_id,
+        StaffUser.auth_user_guid == auth_user_guid,
+        exists().where(live_entity),
+    )
+    return db.session.execute(select(or_(primary_officer, other_officer))).scalar()
+
+
+def assigned_officer_filters(
+    entity_model, officer_id: int = None, auth_user_guid: str = None, officer_model=None, officer_fk=None
+) -> list:
+    """Return the conditions selecting the records whose primary officer or one of the other officers is the officer.
+
+    The officer is given by its staff user id, or by the unique identifier of the
+    user from the identity provider; no conditions are returned when neither is given.
+    """
+    if officer_id is None and auth_user_guid is None:
+        return []
+    if officer_id is None:
+        officer_id = (
+            select(StaffUser.id)
+            .where(StaffUser.auth_user_guid == auth_user_guid, StaffUser.is_deleted.is_(False))
+            .scalar_subquery()
+        )
+    condition = entity_model.primary_officer_id == officer_id
+    if officer_model is None:
+        return [condition]
+    return [
+        or_(
+            condition,
+            exists().where(
+                officer_fk == entity_model.id,
+                officer_model.officer_id == officer_id,
+                officer_model.is_deleted.is_(False),
+            ),
+        )
+    ]
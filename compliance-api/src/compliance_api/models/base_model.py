@@ -16,7 +16,11 @@ from datetime import datetime
 
 from sqlalchemy import Boolean, Column, DateTime, String, asc
 
+from compliance_api.utils.request_memo import memoize
+
 from .db import db
+from .list_query import ListQuery
+from .pagination import PageRequest, paginate, stream_rows
 
 
 class BaseModel(db.Model):
@@ -59,13 +63,50 @@ class BaseModel(db.Model):
         rows = cls.query.filter_by(**query).order_by(asc("id")).all()
         return rows
 
+    @classmethod
+    def get_list(
+        cls,
+        params: dict = None,
+        default_filters=True,
+        filters=None,
+        list_query: ListQuery = None,
+        page: PageRequest = None,
+        stream: bool = False,
+    ):  # pylint: disable=too-many-arguments
+        """Return the rows matching the params, filters (SQL conditions) and list query, sorted on (sort, id).
+
+        The sort is the one of the page, else of the list query, else id. The loader
+        options of the list query are applied: only the columns and relationships of
+        its sparse fieldset are loaded, and those the list schema dumps are eager loaded.
+        With page, only the requested Page is returned; with stream, an iterator
+        fetching the rows in batches.
+        """
+        query = dict(params or {})
+        if default_filters and hasattr(cls, "is_active"):
+            query["is_active"] = True
+        if hasattr(cls, "is_deleted"):
+            query["is_deleted"] = False
+        query_obj = cls.query.filter_by(**query)  # pylint: disable=no-member
+        conditions = [*(filters or []), *(list_query.conditions if list_query else [])]
+        if conditions:
+            query_obj = query_obj.filter(*conditions)
+        if list_query and list_query.options:
+            query_obj = query_obj.options(*list_query.options)
+        if page is not None:
+            return paginate(query_obj, cls, page)
+        list_query = list_query or ListQuery()
+        if stream:
+            return stream_rows(query_obj, cls, list_query.sort_by, list_query.descending)
+        page = PageRequest(limit=None, sort_by=list_query.sort_by, descending=list_query.descending)
+        return paginate(query_obj, cls, page).items
+
     @classmethod
     def find_by_id(cls, identifier: int):
-        """Return model by id."""
+        """Return model by id, memoized for the request."""
         query = cls.query.filter_by(id=identifier)
         if hasattr(cls, "is_deleted"):
             query = query.filter_by(is_deleted=False)
-        return query.first()
+        return memoize("db", cls.__tablename__, identifier, query.first)
 
     @staticmethod
     def commit():
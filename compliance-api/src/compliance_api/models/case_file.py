@@ -14,9 +14,10 @@
 """Case file Model."""
 import enum
 
-from sqlalchemy import Column, DateTime, Enum, ForeignKey, Integer, String, cast, func
+from sqlalchemy import Column, DateTime, Enum, ForeignKey, Index, Integer, String, cast, func
 from sqlalchemy.orm import relationship
 
+from .assignment import assigned_officer_filters, is_assigned_officer
 from .base_model import BaseModelVersioned
 
 
@@ -78,6 +79,10 @@ class CaseFile(BaseModelVersioned):
         comment="The unique case file number",
     )
     case_file_status = Column(Enum(CaseFileStatusEnum), nullable=True)
+    __table_args__ = (
+        Index("ix_case_files_primary_officer_id", "primary_officer_id"),
+        Index("ix_case_files_date_created", "date_created"),
+    )
 
     primary_officer = relationship(
         "StaffUser", foreign_keys=[primary_officer_id], lazy="joined"
@@ -129,6 +134,20 @@ class CaseFile(BaseModelVersioned):
         """Retrieve case files by project."""
         return cls.query.filter_by(project_id=project_id).all()
 
+    @classmethod
+    def is_assigned_officer(cls, case_file_id: int, auth_user_guid: str) -> bool:
+        """Check if the user is the primary officer or one of the other officers of the case file."""
+        return is_assigned_officer(
+            cls, case_file_id, auth_user_guid, CaseFileOfficer, CaseFileOfficer.case_file_id
+        )
+
+    @classmethod
+    def assigned_to(cls, officer_id: int = None, auth_user_guid: str = None) -> list:
+        """Return the conditions selecting the case files of the officer, if any."""
+        return assigned_officer_filters(
+            cls, officer_id, auth_user_guid, CaseFileOfficer, CaseFileOfficer.case_file_id
+        )
+
     @classmethod
     def get_max_case_file_number_by_year(cls, year: int):
         """Get the max case file number generated so far."""
@@ -173,6 +192,10 @@ class CaseFileOfficer(BaseModelVersioned):
         nullable=False,
         comment="The unique identifier of the associated staff user",
     )
+    __table_args__ = (
+        Index("ix_case_file_officers_case_file_id_officer_id", "case_file_id", "officer_id"),
+        Index("ix_case_file_officers_officer_id_case_file_id", "officer_id", "case_file_id"),
+    )
 
     case_file = relationship(
         "CaseFile",
@@ -14,9 +14,10 @@
 """Complaint Model."""
 import enum
 
-from sqlalchemy import Column, DateTime, Enum, ForeignKey, Integer, String, func
+from sqlalchemy import Column, DateTime, Enum, ForeignKey, Index, Integer, String, func
 from sqlalchemy.orm import relationship
 
+from ..assignment import assigned_officer_filters, is_assigned_officer
 from ..base_model import BaseModelVersioned
 
 
@@ -110,6 +111,10 @@ class Complaint(BaseModelVersioned):
         comment="The unique Id of the first nation if the complaint source is selected as first nation",
     )
     status = Column(Enum(ComplaintStatusEnum), nullable=False)
+    __table_args__ = (
+        Index("ix_complaints_primary_officer_id", "primary_officer_id"),
+        Index("ix_complaints_date_received", "date_received"),
+    )
     case_file = relationship("CaseFile", foreign_keys=[case_file_id], lazy="joined")
     requirement_source = relationship(
         "RequirementSource", foreign_keys=[requirement_source_id], lazy="joined"
@@ -156,3 +161,13 @@ class Complaint(BaseModelVersioned):
         else:
             complaint.save()
         return complaint
+
+    @classmethod
+    def is_assigned_officer(cls, complaint_id: int, auth_user_guid: str) -> bool:
+        """Check if the user is the primary officer of the complaint."""
+        return is_assigned_officer(cls, complaint_id, auth_user_guid)
+
+    @classmethod
+    def assigned_to(cls, officer_id: int = None, auth_user_guid: str = None) -> list:
+        """Return the conditions selecting the complaints of the officer, if any."""
+        return assigned_officer_filters(cls, officer_id, auth_user_guid)
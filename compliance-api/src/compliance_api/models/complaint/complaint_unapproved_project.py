@@ -47,3 +47,13 @@ class ComplaintUnapprovedProject(BaseModelVersioned):
         else:
             unapproved_project.save()
         return unapproved_project
+
+    @classmethod
+    def get_by_complaint_ids(cls, complaint_ids):
+        """Return the unapproved project info of the complaints keyed by complaint_id."""
+        if not complaint_ids:
+            return {}
+        rows = cls.query.filter(
+            cls.complaint_id.in_(complaint_ids), cls.is_deleted.is_(False)
+        ).all()
+        return {row.complaint_id: row for row in rows}
@@ -10,6 +10,8 @@ from sqlalchemy import event
 from sqlalchemy_continuum import make_versioned
 from sqlalchemy_continuum.plugins import PropertyModTrackerPlugin
 
+from compliance_api.utils.request_memo import forget
+
 
 # DB initialize in __init__ file
 # db variable use for create models from here
@@ -52,3 +54,17 @@ def before_commit(session, *args):  # pylint: disable=unused-argument
         setattr(new_object, "created_by", username)
     for updated_object in updated_objects:
         setattr(updated_object, "updated_by", username)
+
+
+@event.listens_for(db.session, "after_flush")
+@event.listens_for(db.session, "after_soft_rollback")
+def forget_memoized_rows(session, *args):  # pylint: disable=unused-argument
+    """Drop the rows memoized for the request once the session writes or rolls back."""
+    forget("db")
+
+
+@event.listens_for(db.session, "do_orm_execute")
+def forget_memoized_rows_on_bulk_write(orm_execute_state):
+    """Drop the rows memoized for the request on bulk update and delete statements."""
+    if orm_execute_state.is_update or orm_execute_state.is_delete or orm_execute_state.is_insert:
+        forget("db")
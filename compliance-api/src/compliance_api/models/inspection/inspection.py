@@ -12,9 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Inspection Model."""
-from sqlalchemy import Column, DateTime, Enum, ForeignKey, Integer, String, func
+from sqlalchemy import Column, DateTime, Enum, ForeignKey, Index, Integer, String, func
 from sqlalchemy.orm import relationship
 
+from ..assignment import assigned_officer_filters, is_assigned_officer
 from ..base_model import BaseModelVersioned
 from .inspection_enum import InspectionStatusEnum
 
@@ -97,6 +98,11 @@ class Inspection(BaseModelVersioned):
         nullable=True,
     )
 
+    __table_args__ = (
+        Index("ix_inspections_primary_officer_id", "primary_officer_id"),
+        Index("ix_inspections_start_date", "start_date"),
+    )
+
     initiation = relationship(
         "InspectionInitiationOption", foreign_keys=[initiation_id], lazy="joined"
     )
@@ -137,6 +143,16 @@ class Inspection(BaseModelVersioned):
         "StaffUser", foreign_keys=[primary_officer_id], lazy="joined"
     )
 
+    @classmethod
+    def get_ids_by_case_file(cls, case_file_id: int) -> list:
+        """Return the ids of the active inspections of the case file, in id order."""
+        rows = (
+            cls.query.with_entities(cls.id)
+            .filter_by(case_file_id=case_file_id, is_active=True, is_deleted=False)
+            .order_by(cls.id)
+        )
+        return [row.id for row in rows]
+
     @classmethod
     def get_count_by_project_nd_case_file_id(cls, project_id: int, case_file_id: int):
         """Return the number of inspection based on the project and case file id."""
@@ -183,3 +199,23 @@ class Inspection(BaseModelVersioned):
     def get_by_ir_number(cls, ir_number):
         """Retrieve inspection by ir number."""
         return cls.query.filter_by(ir_number=ir_number, is_deleted=False).first()
+
+    @classmethod
+    def is_assigned_officer(cls, inspection_id: int, auth_user_guid: str) -> bool:
+        """Check if the user is the primary officer or one of the other officers of the inspection."""
+        # pylint: disable=import-outside-toplevel
+        from .inspection_officer import InspectionOfficer
+
+        return is_assigned_officer(
+            cls, inspection_id, auth_user_guid, InspectionOfficer, InspectionOfficer.inspection_id
+        )
+
+    @classmethod
+    def assigned_to(cls, officer_id: int = None, auth_user_guid: str = None) -> list:
+        """Return the conditions selecting the inspections of the officer, if any."""
+        # pylint: disable=import-outside-toplevel
+        from .inspection_officer import InspectionOfficer
+
+        return assigned_officer_filters(
+            cls, officer_id, auth_user_guid, InspectionOfficer, InspectionOfficer.inspection_id
+        )
@@ -1,7 +1,7 @@
 """Model to manage the choosen attendance option for inspection."""
 
 from sqlalchemy import Column, ForeignKey, Integer
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import joinedload, relationship
 
 from ..base_model import BaseModelVersioned
 
@@ -46,6 +46,22 @@ class InspectionAttendance(BaseModelVersioned):
         """Retrieve all attendance option by inspection id."""
         return cls.query.filter_by(inspection_id=inspection_id, is_deleted=False).all()
 
+    @classmethod
+    def get_all_by_inspection_ids(cls, inspection_ids) -> dict:
+        """Return the attendance options, with their option loaded, of the inspections keyed by inspection_id."""
+        result = {inspection_id: [] for inspection_id in inspection_ids}
+        if not inspection_ids:
+            return result
+        rows = (
+            cls.query.options(joinedload(cls.attendance_option))
+            .filter(cls.inspection_id.in_(inspection_ids), cls.is_deleted.is_(False))
+            .order_by(cls.inspection_id, cls.id)
+            .all()
+        )
+        for row in rows:
+            result[row.inspection_id].append(row)
+        return result
+
     @classmethod
     def bulk_delete(cls, inspection_id: int, option_ids: list[int], session=None):
         """Delete attendance ids by id per inspection."""
@@ -33,6 +33,21 @@ class InspectionFirstnation(BaseModelVersioned):
         """Retrieve all firstnations by inspection id."""
         return cls.query.filter_by(inspection_id=inspection_id, is_deleted=False).all()
 
+    @classmethod
+    def get_all_by_inspection_ids(cls, inspection_ids) -> dict:
+        """Return the first nations of the inspections keyed by inspection_id."""
+        result = {inspection_id: [] for inspection_id in inspection_ids}
+        if not inspection_ids:
+            return result
+        rows = (
+            cls.query.filter(cls.inspection_id.in_(inspection_ids), cls.is_deleted.is_(False))
+            .order_by(cls.inspection_id, cls.id)
+            .all()
+        )
+        for row in rows:
+            result[row.inspection_id].append(row)
+        return result
+
     @classmethod
     def bulk_delete(
         cls, inspection_id: int, firstnation_ids: list[int], session=None
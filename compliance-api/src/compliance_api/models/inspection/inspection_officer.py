@@ -12,8 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Inspection Officer Model."""
-from sqlalchemy import Column, ForeignKey, Integer
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, ForeignKey, Index, Integer
+from sqlalchemy.orm import joinedload, relationship
 
 from ..base_model import BaseModelVersioned
 
@@ -43,6 +43,10 @@ class InspectionOfficer(BaseModelVersioned):
         nullable=False,
         comment="The unique identifier of the associated staff user",
     )
+    __table_args__ = (
+        Index("ix_inspection_officers_inspection_id_officer_id", "inspection_id", "officer_id"),
+        Index("ix_inspection_officers_officer_id_inspection_id", "officer_id", "inspection_id"),
+    )
 
     inspection = relationship(
         "Inspection",
@@ -56,6 +60,22 @@ class InspectionOfficer(BaseModelVersioned):
         """Retrieve all case file officers by inspection id."""
         return cls.query.filter_by(inspection_id=inspection_id, is_deleted=False).all()
 
+    @classmethod
+    def get_all_by_inspection_ids(cls, inspection_ids) -> dict:
+        """Return the officers, with their staff user loaded, of the inspections keyed by inspection_id."""
+        result = {inspection_id: [] for inspection_id in inspection_ids}
+        if not inspection_ids:
+            return result
+        rows = (
+            cls.query.options(joinedload(cls.officer))
+            .filter(cls.inspection_id.in_(inspection_ids), cls.is_deleted.is_(False))
+            .order_by(cls.inspection_id, cls.id)
+            .all()
+        )
+        for row in rows:
+            result[row.inspection_id].append(row)
+        return result
+
     @classmethod
     def bulk_delete(
         cls, inspection_id: int, officer_ids: list[int], session=None
@@ -34,6 +34,19 @@ class InspectionOtherAttendance(BaseModelVersioned):
             inspection_id=inspection_id, is_deleted=False
         ).first()
 
+    @classmethod
+    def get_by_inspection_ids(cls, inspection_ids) -> dict:
+        """Return the other attendance of the inspections keyed by inspection_id."""
+        if not inspection_ids:
+            return {}
+        rows = cls.query.filter(
+            cls.inspection_id.in_(inspection_ids), cls.is_deleted.is_(False)
+        ).order_by(cls.id)
+        result = {}
+        for row in rows:
+            result.setdefault(row.inspection_id, row)
+        return result
+
     @classmethod
     def create_attendance(cls, other_attendance_data, session=None):
         """Persist other attendance data in database."""
@@ -54,3 +54,13 @@ class InspectionUnapprovedProject(BaseModelVersioned):
         return cls.query.filter_by(
             inspection_id=inspection_id, is_deleted=False
         ).first()
+
+    @classmethod
+    def get_by_inspection_ids(cls, inspection_ids):
+        """Return the unapproved project info of the inspections keyed by inspection_id."""
+        if not inspection_ids:
+            return {}
+        rows = cls.query.filter(
+            cls.inspection_id.in_(inspection_ids), cls.is_deleted.is_(False)
+        ).all()
+        return {row.inspection_id: row for row in rows}
@@ -0,0 +1,281 @@
+# Copyright © 2024 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Declarative filters and sorts of the list queries.
+
+Each list resource declares a ListQuerySpec: the columns of its model that can
+be filtered, with their operators, and the columns it can be sorted on. The
+query arguments are parsed against the spec into SQL conditions:
+
+    status=OPEN                 eq
+    status__in=OPEN,CLOSED      in
+    start_date__gte=2024-01-01  range, with __gt, __lt and __lte
+    ir_number__prefix=IR-24     case insensitive prefix
+    sort=-start_date            sort, descending with a leading -
+    fields=id,ir_number         sparse fieldset, see below
+
+Only indexed columns can be declared as sorts, so every sort is served by an
+index; the spec raises when it is created otherwise.
+
+A spec declaring the fields of its schema also accepts a sparse fieldset. The
+requested fields limit the schema output, and the query only loads the columns
+and relationships they need: the other columns are deferred with load_only and
+the other relationships are not loaded at all (noload), so the joined
+relationships of the model are left out of the SQL. A field that is neither a
+column nor a relationship of the model names the attributes it reads in the
+field dependencies of the spec.
+"""
+import enum
+from datetime import date, datetime
+
+from sqlalchemy import Date, DateTime, UniqueConstraint, inspect
+from sqlalchemy.orm import load_only, noload
+
+
+EQ = "eq"
+IN = "in"
+RANGE = "range"
+PREFIX = "prefix"
+
+_RANGE_OPERATORS = {
+    "gt": lambda column, value: column > value,
+    "gte": lambda column, value: column >= value,
+    "lt": lambda column, value: column < value,
+    "lte": lambda column, value: column <= value,
+}
+# At most this many values in an in filter.
+MAX_IN_VALUES = 100
+
+
+class FilterField:  # pylint: disable=too-few-public-methods
+    """A filterable column and its operators."""
+
+    def __init__(self, name: str, operators: tuple = (EQ, IN), value_type=None):
+        """Create the field.
+
+        Args:
+            name (str): The query argument, also the column name.
+            operators (tuple): The allowed operators among eq, in, range and prefix.
+            value_type: Converts a query argument value: int, str, date, datetime or an enum
+                class; defaults to the python type of the column.
+        """
+        self.name = name
+        self.operators = operators
+        self.value_type = value_type
+
+
+class ListQuery:  # pylint: disable=too-few-public-methods
+    """The SQL conditions and sort of a list request."""
+
+    def __init__(self, conditions: list = None, sort_by: str = "id", descending: bool = False):
+        """Create the query."""
+        self.conditions = conditions or []
+        self.sort_by = sort_by
+        self.descending = descending
+        # The requested sparse fieldset, None for every field, and the loader options serving it.
+        self.fields = None
+        self.options = []
+
+    def includes(self, *names) -> bool:
+        """Return whether one of the fields is dumped: always, unless a sparse fieldset leaves them all out."""
+        if self.fields is None:
+            return True
+        return any(field.split(".")[0] in names for field in self.fields)
+
+    @property
+    def sort(self) -> str:
+        """Return the sort as written in the query argument, e.g. -start_date."""
+        return f"-{self.sort_by}" if self.descending else self.sort_by
+
+
+class ListQuerySpec:
+    """The filters and sorts a list resource accepts on a model."""
+
+    def __init__(
+        self, model, filters: list = (), sorts: tuple = ("id",), fields: tuple = None, field_dependencies: dict = None
+    ):  # pylint: disable=too-many-arguments
+        """Create the spec, raising ValueError when a sort column is not indexed.
+
+        Args:
+            model: The model listed.
+            filters (list): The FilterField of each filterable column.
+            sorts (tuple): The indexed columns the list can be sorted on.
+            fields (tuple): The fields of the schema that can be requested in a sparse fieldset;
+                without them the fields argument is not accepted.
+            field_dependencies (dict): The model attributes read by each field that is not
+                itself a column or relationship of the model.
+        """
+        self.model = model
+        self.filters = {field.name: field for field in filters}
+        self.sorts = sorts
+        self.fields = fields
+        self.field_dependencies = field_dependencies or {}
+        for field in filters:
+            column = model.__table__.columns[field.name]
+            if field.value_type is None:
+                field.value_type = _python_type(column)
+        for sort_by in sorts:
+            if not is_indexed(model.__table__.columns[sort_by]):
+                raise ValueError(f"{model.__tablename__}.{sort_by} is not indexed and cannot be sorted on")
+
+    def parse(self, args) -> ListQuery:
+        """Return the query of the arguments, raising ValueError on an invalid filter or sort.
+
+        Arguments that are not declared filters are left to the resource.
+        """
+        query = ListQuery()
+        for argument in args:
+            name, _, operator = argument.partition("__")
+            field = self.filters.get(name)
+            if field is None:
+                continue
+            for raw_value in args.getlist(argument):
+                query.conditions.append(self._condition(field, operator or EQ, raw_value))
+        sort = args.get("sort")
+        if sort:
+            query.descending = sort.startswith("-")
+            query.sort_by = sort.lstrip("-")
+            if query.sort_by not in self.sorts:
+                raise ValueError(f"Unsupported sort {sort}. Allowed: {', '.join(self.sorts)}")
+        if self.fields is not None and args.get("fields"):
+            query.fields = self._parse_fields(args.get("fields"))
+            query.options = self.load_options(query.fields, query.sort_by)
+        return query
+
+    def load_options(self, fields: list, sort_by: str = "id") -> list:
+        """Return the loader options loading only what the fields need, and the sort column."""
+        mapper = inspect(self.model)
+        columns = {*mapper.primary_key, mapper.columns[sort_by]}
+        relationships = set()
+        pending = [field.split(".")[0] for field in fields]
+        seen = set()
+        while pending:
+            name = pending.pop()
+            if name in seen:
+                continue
+            seen.add(name)
+            if name in mapper.relationships:
+                relationships.add(name)
+                columns.update(mapper.relationships[name].local_columns)
+            elif name in mapper.column_attrs:
+                columns.update(mapper.column_attrs[name].columns)
+            pending.extend(self.field_dependencies.get(name, ()))
+        column_attributes = [
+            getattr(self.model, attribute.key)
+            for attribute in mapper.column_attrs
+            if any(column in columns for column in attribute.columns)
+        ]
+        return [
+            load_only(*column_attributes),
+            *(
+                noload(getattr(self.model, relationship.key))
+                for relationship in mapper.relationships
+                if relationship.key not in relationships
+            ),
+        ]
+
+    def describe(self) -> dict:
+        """Return the swagger documentation of the query arguments."""
+        params = {
+            "sort": {
+                "description": f"Sort on one of {', '.join(self.sorts)}; prefix with - for descending order",
+                "type": "string",
+                "required": False,
+            }
+        }
+        if self.fields is not None:
+            params["fields"] = {
+                "description": "Comma separated fields to return, parent.child for a nested field",
+                "type": "string",
+                "required": False,
+            }
+        for field in self.filters.values():
+            arguments = []
+            if EQ in field.operators:
+                arguments.append(field.name)
+            if IN in field.operators:
+                arguments.append(f"{field.name}__in")
+            if RANGE in field.operators:
+                arguments.extend(f"{field.name}__{operator}" for operator in _RANGE_OPERATORS)
+            if PREFIX in field.operators:
+                arguments.append(f"{field.name}__prefix")
+            for argument in arguments:
+                params[argument] = {"description": f"Filter on {field.name}", "type": "string", "required": False}
+        return params
+
+    def _parse_fields(self, raw_fields: str) -> list:
+        """Return the requested fields; a nested field is written parent.child."""
+        fields = list(dict.fromkeys(field.strip() for field in raw_fields.split(",") if field.strip()))
+        unknown = sorted({field for field in fields if field.split(".")[0] not in self.fields})
+        if unknown:
+            raise ValueError(f"Unsupported fields: {', '.join(unknown)}. Allowed: {', '.join(self.fields)}")
+        return fields
+
+    def _condition(self, field: FilterField, operator: str, raw_value: str):
+        """Return the SQL condition of a filter argument."""
+        column = getattr(self.model, field.name)
+        if operator == EQ and EQ in field.operators:
+            return column == _convert(field, raw_value)
+        if operator == IN and IN in field.operators:
+            values = [value for value in raw_value.split(",") if value]
+            if not values or len(values) > MAX_IN_VALUES:
+                raise ValueError(f"{field.name}__in takes 1 to {MAX_IN_VALUES} comma separated values")
+            return column.in_([_convert(field, value) for value in values])
+        if operator in _RANGE_OPERATORS and RANGE in field.operators:
+            return _RANGE_OPERATORS[operator](column, _convert(field, raw_value))
+        if operator == PREFIX and PREFIX in field.operators:
+            escaped = raw_value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            return column.ilike(f"{escaped}%", escape="\\")
+        raise ValueError(f"Unsupported filter {field.name}__{operator}")
+
+
+def is_indexed(column) -> bool:
+    """Return whether the column is the primary key or leads an index or unique constraint."""
+    if column.primary_key or column.index or column.unique:
+        return True
+    leading_columns = [index.columns.values()[0] for index in column.table.indexes if index.columns]
+    leading_columns.extend(
+        constraint.columns.values()[0]
+        for constraint in column.table.constraints
+        if isinstance(constraint, UniqueConstraint) and constraint.columns
+    )
+    return any(leading is column for leading in leading_columns)
+
+
+def _python_type(column):
+    """Return the type converting a query argument for the column."""
+    if isinstance(column.type, DateTime):
+        return datetime
+    if isinstance(column.type, Date):
+        return date
+    enum_class = getattr(column.type, "enum_class", None)
+    if enum_class is not None:
+        return enum_class
+    return column.type.python_type
+
+
+def _convert(field: FilterField, raw_value: str):
+    """Return the query argument value as the type of the field."""
+    value_type = field.value_type
+    try:
+        if isinstance(value_type, type) and issubclass(value_type, enum.Enum):
+            if raw_value in value_type.__members__:
+                return value_type[raw_value]
+            return value_type(raw_value)
+        if value_type in (datetime, date):
+            return value_type.fromisoformat(raw_value)
+        if value_type is bool:
+            return {"true": True, "false": False}[raw_value.lower()]
+        return value_type(raw_value)
+    except (KeyError, TypeError, ValueError) as err:
+        raise ValueError(f"Invalid value {raw_value} for {field.name}") from err
@@ -0,0 +1,167 @@
+# Copyright © 2024 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Keyset pagination of the list queries.
+
+A page is sorted on (sort column, id), so the order is stable even when the sort
+column has duplicates. The cursor of the next page holds the sort value and id
+of the last row of the page, and the sort it was made for; the next page starts
+right after that row with an indexed range condition instead of an OFFSET, so
+every page costs the same whatever its position. Null sort values come last.
+
+A streamed list is iterated in the same order with yield_per, so only
+STREAM_BATCH_SIZE rows are held at a time whatever the size of the list.
+"""
+import base64
+import binascii
+import enum
+import json
+from datetime import date, datetime
+
+from sqlalchemy import and_, or_
+
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+# Rows fetched per round trip when a list is streamed.
+STREAM_BATCH_SIZE = 500
+
+
+class PageRequest:  # pylint: disable=too-few-public-methods
+    """The size, start and sort of a page."""
+
+    def __init__(self, limit: int = DEFAULT_PAGE_SIZE, after: tuple = None, sort_by: str = "id", descending=False):
+        """Create the request.
+
+        Args:
+            limit (int): The maximum number of rows of the page; None for all the rows.
+            after (tuple): The (sort value, id) of the last row of the previous page, from decode_cursor.
+            sort_by (str): The column to sort on; id breaks the ties.
+            descending (bool): Sort in descending order.
+        """
+        self.limit = limit
+        self.after = after
+        self.sort_by = sort_by
+        self.descending = descending
+
+    @property
+    def sort(self) -> str:
+        """Return the sort as written in the query argument, e.g. -start_date."""
+        return f"-{self.sort_by}" if self.descending else self.sort_by
+
+
+class Page:  # pylint: disable=too-few-public-methods
+    """The rows of a page and the cursor of the next page, None on the last page."""
+
+    def __init__(self, items: list, next_cursor: str = None):
+        """Create the page."""
+        self.items = items
+        self.next_cursor = next_cursor
+
+
+def paginate(query, model, page: PageRequest) -> Page:
+    """Return the page of the query."""
+    sort_column = getattr(model, page.sort_by)
+    id_column = model.id
+    if page.after is not None:
+        query = query.filter(_after_condition(sort_column, id_column, page.after, page.descending))
+    query = sort_query(query, model, page.sort_by, page.descending)
+    if page.limit is None:
+        return Page(query.all())
+    rows = query.limit(page.limit + 1).all()
+    if len(rows) <= page.limit:
+        return Page(rows)
+    rows = rows[: page.limit]
+    last = rows[-1]
+    return Page(rows, encode_cursor(getattr(last, page.sort_by), last.id, page.sort))
+
+
+def sort_query(query, model, sort_by: str = "id", descending: bool = False):
+    """Return the query sorted on (sort column, id), null sort values last."""
+    sort_column = getattr(model, sort_by)
+    if descending:
+        return query.order_by(sort_column.desc().nulls_last(), model.id.desc())
+    return query.order_by(sort_column.asc().nulls_last(), model.id.asc())
+
+
+def stream_rows(query, model, sort_by: str = "id", descending: bool = False):
+    """Return an iterator over the sorted rows of the query, fetched STREAM_BATCH_SIZE rows at a time."""
+    return iter(sort_query(query, model, sort_by, descending).yield_per(STREAM_BATCH_SIZE))
+
+
+def page_items(result) -> list:
+    """Return the rows of a page, or the list itself."""
+    return result.items if isinstance(result, Page) else result
+
+
+def for_each_batch(result, function):
+    """Call the function with the rows of a list or page, and return the result.
+
+    A streamed result is handled STREAM_BATCH_SIZE rows at a time, as it is iterated.
+    """
+    if isinstance(result, (Page, list)):
+        function(page_items(result))
+        return result
+    return _batches_through(result, function)
+
+
+def _batches_through(rows, function):
+    """Yield the rows, calling the function with each batch before yielding it."""
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == STREAM_BATCH_SIZE:
+            function(batch)
+            yield from batch
+            batch = []
+    if batch:
+        function(batch)
+        yield from batch
+
+
+def encode_cursor(sort_value, identifier: int, sort: str = "id") -> str:
+    """Return the opaque cursor of a row for the sort."""
+    if isinstance(sort_value, (datetime, date)):
+        sort_value = {"datetime": sort_value.isoformat()}
+    elif isinstance(sort_value, enum.Enum):
+        sort_value = sort_value.name
+    payload = json.dumps([sort, sort_value, identifier], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple:
+    """Return the (sort, sort value, id) of a cursor, raising ValueError when it is malformed."""
+    try:
+        payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        sort, sort_value, identifier = json.loads(payload)
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as err:
+        raise ValueError("Malformed cursor") from err
+    if not isinstance(sort, str) or not isinstance(identifier, int) or isinstance(identifier, bool):
+        raise ValueError("Malformed cursor")
+    if isinstance(sort_value, dict):
+        if set(sort_value) != {"datetime"} or not isinstance(sort_value["datetime"], str):
+            raise ValueError("Malformed cursor")
+        sort_value = datetime.fromisoformat(sort_value["datetime"])
+    elif isinstance(sort_value, list):
+        raise ValueError("Malformed cursor")
+    return sort, sort_value, identifier
+
+
+def _after_condition(sort_column, id_column, after: tuple, descending: bool):
+    """Return the condition selecting the rows sorted after the cursor row."""
+    sort_value, identifier = after
+    beyond = id_column < identifier if descending else id_column > identifier
+    if sort_value is None:
+        return and_(sort_column.is_(None), beyond)
+    further = sort_column < sort_value if descending else sort_column > sort_value
+    return or_(further, and_(sort_column == sort_value, beyond), sort_column.is_(None))
@@ -6,15 +6,33 @@ from .base_model import BaseModelVersioned
 
 
 class Project(BaseModelVersioned):
-    """Project Model Class."""
+    """Project Model Class.
+
+    A local mirror of the EPIC.Track projects, written only by the project sync.
+    """
 
     __tablename__ = "projects"
 
     id = Column(Integer, primary_key=True)
     name = Column(String, nullable=False)
+    abbreviation = Column(String(10), nullable=True, comment="The project abbreviation from EPIC.Track")
+    ea_certificate = Column(String(255), nullable=True, comment="The EA certificate number from EPIC.Track")
+    type = Column(String(255), nullable=True, comment="The name of the project type from EPIC.Track")
+    sub_type = Column(String(255), nullable=True, comment="The name of the project sub type from EPIC.Track")
+    proponent = Column(String, nullable=True, comment="The name of the proponent from EPIC.Track")
+    sync_hash = Column(
+        String(64),
+        nullable=True,
+        comment="Hash of the EPIC.Track fields at the last sync. Null until the project is synced",
+    )
 
     def __setattr__(self, key, value):
         """Set attribute value."""
         if hasattr(self, key):
             raise AttributeError(f"Cannot modify {key}. This class is read-only.")
         super().__setattr__(key, value)
+
+    @property
+    def is_synced(self):
+        """Return whether the EPIC.Track fields have been mirrored."""
+        return self.sync_hash is not None
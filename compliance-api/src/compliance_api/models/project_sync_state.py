@@ -0,0 +1,18 @@
+"""Project sync state model class.
+
+A single row recording when the EPIC.Track projects were last mirrored, read by
+the project sync of every worker to skip its run when another one synced recently.
+"""
+
+from sqlalchemy import Column, DateTime, Integer
+
+from .base_model import BaseModel
+
+
+class ProjectSyncState(BaseModel):
+    """Definition of the Project Sync State entity."""
+
+    __tablename__ = "project_sync_state"
+
+    id = Column(Integer, primary_key=True, comment="The identifier of the single state row.")
+    last_synced_at = Column(DateTime, nullable=False, comment="The time the last project sync finished.")
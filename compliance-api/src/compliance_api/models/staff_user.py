@@ -60,6 +60,7 @@ class StaffUser(BaseModelVersioned):
             unique=True,
             postgresql_where=(is_deleted is False),
         ),
+        Index("ix_staff_users_last_name", "last_name"),
     )
 
     @classmethod
@@ -0,0 +1,105 @@
+"""Staff user group update model class.
+
+Outbox of the group changes to deliver to EPIC.Authorize. A row is written in
+the same transaction as the staff user change and delivered afterwards by the
+group update dispatcher, which leases the row while it calls EPIC.Authorize.
+"""
+
+from __future__ import annotations
+
+import enum
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Enum, Index, Integer, String
+
+from .base_model import BaseModel
+
+
+class GroupUpdateStatusEnum(enum.Enum):
+    """Delivery status of a group update."""
+
+    PENDING = "PENDING"
+    DELIVERED = "DELIVERED"
+    SUPERSEDED = "SUPERSEDED"
+    FAILED = "FAILED"
+
+
+class StaffUserGroupUpdate(BaseModel):
+    """Definition of the Staff User Group Update entity."""
+
+    __tablename__ = "staff_user_group_updates"
+
+    id = Column(
+        Integer,
+        primary_key=True,
+        autoincrement=True,
+        comment="The unique identifier of the group update.",
+    )
+    auth_user_guid = Column(
+        String(100),
+        nullable=False,
+        index=True,
+        comment="The unique identifier of the user from the identity provider.",
+    )
+    app_name = Column(String(50), nullable=False, comment="The app of the group.")
+    group_name = Column(String(100), nullable=False, comment="The group to assign to the user.")
+    status = Column(
+        Enum(GroupUpdateStatusEnum),
+        nullable=False,
+        default=GroupUpdateStatusEnum.PENDING,
+        comment="The delivery status of the group update.",
+    )
+    attempts = Column(
+        Integer, nullable=False, default=0, server_default="0", comment="The number of delivery attempts."
+    )
+    next_attempt_at = Column(
+        DateTime,
+        nullable=False,
+        default=datetime.utcnow,
+        comment="The time after which the next delivery attempt is made.",
+    )
+    lease_until = Column(
+        DateTime, nullable=True, comment="The time until which a dispatcher holds the group update to deliver it."
+    )
+    delivered_at = Column(DateTime, nullable=True, comment="The time the group update was delivered.")
+    last_error = Column(String, nullable=True, comment="The error of the last failed attempt.")
+    __table_args__ = (
+        Index("ix_staff_user_group_updates_status_next_attempt_at", "status", "next_attempt_at"),
+    )
+
+    @classmethod
+    def add_pending(cls, auth_user_guid: str, app_name: str, group_name: str, session=None) -> StaffUserGroupUpdate:
+        """Add a pending group update, superseding the pending updates of the user not delivered yet."""
+        cls.query.filter_by(
+            auth_user_guid=auth_user_guid, status=GroupUpdateStatusEnum.PENDING
+        ).update({"status": GroupUpdateStatusEnum.SUPERSEDED}, synchronize_session=False)
+        group_update = StaffUserGroupUpdate(
+            auth_user_guid=auth_user_guid, app_name=app_name, group_name=group_name
+        )
+        if session:
+            session.add(group_update)
+            session.flush()
+        else:
+            group_update.flush()
+        return group_update
+
+    @classmethod
+    def get_pending_groups(cls, auth_user_guids: list) -> dict:
+        """Return the group of the pending update by user guid."""
+        if not auth_user_guids:
+            return {}
+        rows = cls.query.filter(
+            cls.auth_user_guid.in_(auth_user_guids),
+            cls.status == GroupUpdateStatusEnum.PENDING,
+        ).with_entities(cls.auth_user_guid, cls.group_name)
+        return dict(rows.all())
+
+    @classmethod
+    def get_by_status(cls, status: GroupUpdateStatusEnum = None, auth_user_guid: str = None) -> list:
+        """Return the group updates, latest first, optionally filtered by status and user."""
+        query = cls.query
+        if status:
+            query = query.filter(cls.status == status)
+        if auth_user_guid:
+            query = query.filter(cls.auth_user_guid == auth_user_guid)
+        return query.order_by(cls.id.desc()).all()
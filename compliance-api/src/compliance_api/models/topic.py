@@ -5,7 +5,7 @@ Manages the topic
 
 from __future__ import annotations
 
-from sqlalchemy import Column, Integer, String
+from sqlalchemy import Column, Index, Integer, String
 
 from .base_model import BaseModelVersioned
 
@@ -17,6 +17,7 @@ class Topic(BaseModelVersioned):
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     name = Column(String(150), nullable=False)
+    __table_args__ = (Index("ix_topics_name", "name"),)
 
     @classmethod
     def get_by_name(cls, topic: str) -> Topic:
@@ -19,10 +19,13 @@ from flask_restx import Namespace, Resource
 
 from compliance_api.auth import auth
 from compliance_api.exceptions import ResourceNotFoundError
+from compliance_api.models import Agency as AgencyModel
+from compliance_api.models.list_query import EQ, PREFIX, FilterField, ListQuerySpec
 from compliance_api.schemas import AgencyCreateSchema, AgencySchema
 from compliance_api.services import AgencyService
 from compliance_api.utils.util import cors_preflight
 
+from .apihelper import PAGE_RESPONSE_DESCRIPTION, PAGINATION_PARAMS
 from .apihelper import Api as ApiHelper
 
 
@@ -34,6 +37,14 @@ agency_request_model = ApiHelper.convert_ma_schema_to_restx_model(
 agency_list_model = ApiHelper.convert_ma_schema_to_restx_model(
     API, AgencySchema(), "AgencyList"
 )
+agency_page_model = ApiHelper.page_model(API, agency_list_model, "AgencyPage")
+
+
+AGENCY_LIST_QUERY = ListQuerySpec(
+    AgencyModel,
+    filters=[FilterField("name", (PREFIX,)), FilterField("abbreviation", (EQ, PREFIX))],
+    sorts=("id", "name"),
+)
 
 
 @cors_preflight("GET, OPTIONS, POST")
@@ -42,14 +53,16 @@ class Agencies(Resource):
     """Resource for managing agencies."""
 
     @staticmethod
-    @API.response(code=200, description="Success", model=[agency_list_model])
+    @API.doc(params={**PAGINATION_PARAMS, **AGENCY_LIST_QUERY.describe()})
+    @API.response(code=200, description=PAGE_RESPONSE_DESCRIPTION, model=agency_page_model)
     @ApiHelper.swagger_decorators(API, endpoint_description="Fetch all agencies")
     @auth.require
     def get():
         """Fetch all agencies."""
-        agencies = AgencyService.get_all()
+        list_query = ApiHelper.get_list_query(AGENCY_LIST_QUERY)
+        agencies = AgencyService.get_all(list_query, ApiHelper.get_page_args(list_query))
         agency_list_schema = AgencySchema(many=True)
-        return agency_list_schema.dump(agencies), HTTPStatus.OK
+        return ApiHelper.dump_list(agency_list_schema, agencies), HTTPStatus.OK
 
     @staticmethod
     @auth.require
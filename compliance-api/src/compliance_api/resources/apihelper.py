@@ -16,13 +16,65 @@
 to support swagger on http
 """
 from functools import wraps
+from http import HTTPStatus
 
-from flask import url_for
+from flask import Response, g, json, request, stream_with_context, url_for
 from flask_restx import Api as BaseApi
 from flask_restx import apidoc, fields
 from marshmallow import fields as ma_fields
 from marshmallow_enum import EnumField
 
+from compliance_api.exceptions import BadRequestError
+from compliance_api.models.list_query import ListQuery, ListQuerySpec
+from compliance_api.models.pagination import MAX_PAGE_SIZE, Page, PageRequest, decode_cursor
+from compliance_api.schemas.compiled_schema import compile_schema
+
+
+# Swagger documentation of the query arguments read by Api.get_assigned_officer_args.
+ASSIGNED_OFFICER_PARAMS = {
+    "assigned_to": {
+        "description": "Set to 'me' to only return the records the current user is the primary "
+        "or one of the other officers of",
+        "type": "string",
+        "required": False,
+    },
+    "officer_id": {
+        "description": "Only return the records the staff user is the primary or one of the other officers of",
+        "type": "integer",
+        "required": False,
+    },
+}
+
+# Swagger documentation of the query arguments read by Api.get_page_args.
+PAGINATION_PARAMS = {
+    "limit": {
+        "description": f"Return a page of at most limit records (up to {MAX_PAGE_SIZE}) in an envelope "
+        "{items, next}; without limit and after, all the records are returned as a list",
+        "type": "integer",
+        "required": False,
+    },
+    "after": {
+        "description": "The next cursor of the previous page",
+        "type": "string",
+        "required": False,
+    },
+}
+
+# Swagger description of the list responses that Api.dump_list returns as a list or a page.
+PAGE_RESPONSE_DESCRIPTION = (
+    "Success; the {items, next} page envelope when limit or after is given, else the list of all the items"
+)
+
+# Swagger documentation of the query argument read by Api.get_stream_arg.
+STREAM_PARAMS = {
+    "stream": {
+        "description": "Set to 'true' to stream all the records as a JSON array, serialized one at a time; "
+        "cannot be combined with limit or after",
+        "type": "boolean",
+        "required": False,
+    },
+}
+
 
 class Api(BaseApi):
     """Monkey patch Swagger API to return HTTPS URLs."""
@@ -49,6 +101,143 @@ class Api(BaseApi):
 
         return decorator
 
+    @classmethod
+    def get_list_arg(cls, name, allowed_values):
+        """Return the set of comma separated values of a query argument, rejecting unknown values."""
+        values = {
+            value.strip()
+            for value in request.args.get(name, "").split(",")
+            if value.strip()
+        }
+        unknown = values - set(allowed_values)
+        if unknown:
+            raise BadRequestError(
+                f"Unsupported {name} value(s): {', '.join(sorted(unknown))}. "
+                f"Allowed: {', '.join(sorted(allowed_values))}"
+            )
+        return values
+
+    @classmethod
+    def get_assigned_officer_args(cls) -> dict:
+        """Return the officer_id and auth_user_guid filtering a list on its assigned officer.
+
+        Read from the assigned_to=me or officer_id query arguments; both are None when
+        neither is given.
+        """
+        assigned_to = request.args.get("assigned_to")
+        officer_id = request.args.get("officer_id")
+        if assigned_to and officer_id:
+            raise BadRequestError("Only one of assigned_to and officer_id can be given")
+        if assigned_to:
+            if assigned_to != "me":
+                raise BadRequestError("Unsupported assigned_to value. Allowed: me")
+            return {"officer_id": None, "auth_user_guid": g.jwt_oidc_token_info["preferred_username"]}
+        if officer_id:
+            try:
+                return {"officer_id": int(officer_id), "auth_user_guid": None}
+            except ValueError as err:
+                raise BadRequestError("officer_id must be an integer") from err
+        return {"officer_id": None, "auth_user_guid": None}
+
+    @classmethod
+    def get_list_query(cls, spec: ListQuerySpec) -> ListQuery:
+        """Return the filters and sort of the query arguments declared by the spec."""
+        try:
+            return spec.parse(request.args)
+        except ValueError as err:
+            raise BadRequestError(str(err)) from err
+
+    @classmethod
+    def get_page_args(cls, list_query: ListQuery = None) -> PageRequest:
+        """Return the page requested by the limit and after query arguments, None when neither is given.
+
+        The page is sorted as the list query; a cursor made for another sort is rejected.
+        """
+        limit = request.args.get("limit")
+        after = request.args.get("after")
+        if limit is None and after is None:
+            return None
+        page = PageRequest()
+        if list_query:
+            page.sort_by, page.descending = list_query.sort_by, list_query.descending
+        if limit is not None:
+            try:
+                page.limit = int(limit)
+            except ValueError as err:
+                raise BadRequestError(f"limit must be an integer between 1 and {MAX_PAGE_SIZE}") from err
+            if not 0 < page.limit <= MAX_PAGE_SIZE:
+                raise BadRequestError(f"limit must be an integer between 1 and {MAX_PAGE_SIZE}")
+        if after:
+            try:
+                sort, sort_value, identifier = decode_cursor(after)
+            except ValueError as err:
+                raise BadRequestError("Invalid after cursor") from err
+            if sort != page.sort:
+                raise BadRequestError(f"The after cursor was made for sort={sort}")
+            page.after = (sort_value, identifier)
+        return page
+
+    @classmethod
+    def get_stream_arg(cls) -> bool:
+        """Return whether the list is streamed, from the stream query argument."""
+        stream = request.args.get("stream", "false")
+        if stream not in ("true", "false"):
+            raise BadRequestError("stream must be true or false")
+        if stream == "true" and ("limit" in request.args or "after" in request.args):
+            raise BadRequestError("stream cannot be combined with limit or after")
+        return stream == "true"
+
+    @classmethod
+    def stream_list(cls, schema, rows):
+        """Return a response streaming the rows as a JSON array, dumping one row at a time with the many schema.
+
+        The rows are read while the response is sent, so only the rows of the current
+        batch are held in memory; the request context is kept until the last row.
+        """
+        def generate():
+            yield "["
+            for index, row in enumerate(rows):
+                yield ("," if index else "") + json.dumps(schema.dump(row, many=False))
+            yield "]\n"
+
+        return Response(stream_with_context(generate()), status=HTTPStatus.OK, mimetype="application/json")
+
+    @classmethod
+    def list_schema(cls, schema_class, list_query: ListQuery = None):
+        """Return the compiled many schema dumping the sparse fieldset of the list query, else every field.
+
+        The options eager loading the relationships the schema dumps are added to the
+        list query, so the schema is to be built before the list is queried.
+        """
+        if list_query is None or list_query.fields is None:
+            schema = compile_schema(schema_class)
+        else:
+            try:
+                schema = compile_schema(schema_class, only=list_query.fields, context={"sparse_fields": True})
+            except ValueError as err:
+                raise BadRequestError(str(err)) from err
+        if list_query is not None:
+            list_query.options = [*list_query.options, *schema.load_options]
+        return schema
+
+    @classmethod
+    def dump_list(cls, schema, result):
+        """Dump a list, or a page in the {items, next} envelope, with the many schema."""
+        if isinstance(result, Page):
+            return {"items": schema.dump(result.items), "next": result.next_cursor}
+        return schema.dump(result)
+
+    @classmethod
+    def page_model(cls, api, item_model, name):
+        """Return the model of the {items, next} envelope of a page of the item model."""
+        return api.model(
+            name,
+            {
+                "items": fields.List(fields.Nested(item_model)),
+                "next": fields.String(description="The after cursor of the next page, null on the last page"),
+            },
+        )
+
     @classmethod
     def convert_ma_schema_to_restx_model(cls, api, schema, name):
         """Convert Marshmallow schema to Flask-RESTX model."""
@@ -20,11 +20,15 @@ from flask_restx import Namespace, Resource
 
 from compliance_api.auth import auth
 from compliance_api.exceptions import ResourceNotFoundError
+from compliance_api.models import CaseFile as CaseFileModel
+from compliance_api.models.list_query import EQ, PREFIX, RANGE, FilterField, ListQuerySpec
 from compliance_api.schemas import (
-    CaseFileCreateSchema, CaseFileOfficerSchema, CaseFileSchema, CaseFileUpdateSchema, KeyValueSchema, StaffUserSchema)
-from compliance_api.services import CaseFileService
+    CaseFileCreateSchema, CaseFileOfficerSchema, CaseFileSchema, CaseFileUpdateSchema, InspectionAttendanceSchema,
+    KeyValueSchema, StaffUserSchema)
+from compliance_api.services import CaseFileService, InspectionService
 from compliance_api.utils.util import cors_preflight
 
+from .apihelper import ASSIGNED_OFFICER_PARAMS, PAGE_RESPONSE_DESCRIPTION, PAGINATION_PARAMS, STREAM_PARAMS
 from .apihelper import Api as ApiHelper
 
 
@@ -39,6 +43,7 @@ case_file_create_model = ApiHelper.convert_ma_schema_to_restx_model(
 case_file_list_model = ApiHelper.convert_ma_schema_to_restx_model(
     API, CaseFileSchema(), "CaseFileList"
 )
+case_file_page_model = ApiHelper.page_model(API, case_file_list_model, "CaseFilePage")
 case_file_officer_model = ApiHelper.convert_ma_schema_to_restx_model(
     API, CaseFileOfficerSchema(), "OtherOfficers"
 )
@@ -48,6 +53,23 @@ staff_list_model = ApiHelper.convert_ma_schema_to_restx_model(
 case_file_update_model = ApiHelper.convert_ma_schema_to_restx_model(
     API, CaseFileSchema(), "CaseFileUpdate"
 )
+inspection_attendance_model = ApiHelper.convert_ma_schema_to_restx_model(
+    API, InspectionAttendanceSchema(), "InspectionAttendance"
+)
+
+
+CASE_FILE_LIST_QUERY = ListQuerySpec(
+    CaseFileModel,
+    filters=[
+        FilterField("case_file_number", (EQ, PREFIX)),
+        FilterField("primary_officer_id"),
+        FilterField("initiation_id"),
+        FilterField("case_file_status"),
+        FilterField("date_created", (RANGE,)),
+    ],
+    sorts=("id", "case_file_number", "date_created"),
+    fields=tuple(CaseFileSchema().dump_fields),
+)
 
 
 @cors_preflight("GET, OPTIONS")
@@ -80,21 +102,33 @@ class CaseFiles(Resource):
                 "description": "The unique identifier of the project",
                 "type": "integer",
                 "required": False,
-            }
+            },
+            **ASSIGNED_OFFICER_PARAMS,
+            **PAGINATION_PARAMS,
+            **STREAM_PARAMS,
+            **CASE_FILE_LIST_QUERY.describe(),
         }
     )
-    @API.response(code=200, description="Success", model=[case_file_list_model])
+    @API.response(code=200, description=PAGE_RESPONSE_DESCRIPTION, model=case_file_page_model)
     @ApiHelper.swagger_decorators(API, endpoint_description="Fetch all case files")
     @auth.require
     def get():
         """Fetch all casefiles."""
         project_id = request.args.get("project_id", None)
+        assigned_officer = ApiHelper.get_assigned_officer_args()
+        list_query = ApiHelper.get_list_query(CASE_FILE_LIST_QUERY)
+        stream = ApiHelper.get_stream_arg()
+        page = ApiHelper.get_page_args(list_query)
+        case_file_list_schema = ApiHelper.list_schema(CaseFileSchema, list_query)
         if project_id:
-            case_files = CaseFileService.get_by_project(project_id)
+            case_files = CaseFileService.get_by_project(
+                project_id, **assigned_officer, list_query=list_query, page=page, stream=stream
+            )
         else:
-            case_files = CaseFileService.get_all()
-        case_file_list_schema = CaseFileSchema(many=True)
-        return case_file_list_schema.dump(case_files), HTTPStatus.OK
+            case_files = CaseFileService.get_all(**assigned_officer, list_query=list_query, page=page, stream=stream)
+        if stream:
+            return ApiHelper.stream_list(case_file_list_schema, case_files)
+        return ApiHelper.dump_list(case_file_list_schema, case_files), HTTPStatus.OK
 
     @staticmethod
     @auth.require
@@ -179,3 +213,23 @@ class CaseFileOtherOfficers(Resource):
         """Update a CaseFile by id."""
         officers = CaseFileService.get_other_officers(case_file_id)
         return StaffUserSchema().dump(officers, many=True), HTTPStatus.OK
+
+
+@cors_preflight("GET, OPTIONS")
+@API.route("/<int:case_file_id>/inspection-attendance-options", methods=["GET", "OPTIONS"])
+@API.doc(params={"case_file_id": "The unique identifier for the case file"})
+class CaseFileInspectionAttendances(Resource):
+    """Attendance of the inspections of a case file."""
+
+    @staticmethod
+    @auth.require
+    @ApiHelper.swagger_decorators(
+        API, endpoint_description="Get the attendance of all the inspections of a case file"
+    )
+    @API.response(code=200, model=[inspection_attendance_model], description="Success")
+    def get(case_file_id):
+        """Fetch the attendance options of the inspections of a case file, by inspection then option."""
+        if not CaseFileService.get_by_id(case_file_id):
+            raise ResourceNotFoundError(f"CaseFile with {case_file_id} not found")
+        attendances = InspectionService.get_attendance_options_by_case_file(case_file_id)
+        return InspectionAttendanceSchema(many=True).dump(attendances), HTTPStatus.OK
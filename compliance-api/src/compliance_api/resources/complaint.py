@@ -6,13 +6,19 @@ from flask import current_app, request
 from flask_restx import Namespace, Resource
 
 from compliance_api.auth import auth
+from compliance_api.models import Complaint as ComplaintModel
+from compliance_api.models.list_query import EQ, PREFIX, RANGE, FilterField, ListQuerySpec
 from compliance_api.schemas import ComplaintCreateSchema, ComplaintSchema, KeyValueSchema
 from compliance_api.services import ComplaintService
+from compliance_api.services.project_enrichment import PROJECT_PARAMETER_FIELDS
 from compliance_api.utils.util import cors_preflight
 
+from .apihelper import ASSIGNED_OFFICER_PARAMS, PAGE_RESPONSE_DESCRIPTION, PAGINATION_PARAMS, STREAM_PARAMS
 from .apihelper import Api as ApiHelper
 
 
+ENRICH_OPTIONS = ("project",)
+
 API = Namespace("complaints", description="Endpoints for Complaints")
 
 keyvalue_list_schema = ApiHelper.convert_ma_schema_to_restx_model(
@@ -26,6 +32,26 @@ complaint_create_model = ApiHelper.convert_ma_schema_to_restx_model(
 complaint_list_model = ApiHelper.convert_ma_schema_to_restx_model(
     API, ComplaintSchema(), "ComplaintList"
 )
+complaint_page_model = ApiHelper.page_model(API, complaint_list_model, "ComplaintPage")
+
+
+COMPLAINT_LIST_QUERY = ListQuerySpec(
+    ComplaintModel,
+    filters=[
+        FilterField("complaint_number", (EQ, PREFIX)),
+        FilterField("project_id"),
+        FilterField("primary_officer_id"),
+        FilterField("source_type_id"),
+        FilterField("status"),
+        FilterField("date_received", (RANGE,)),
+    ],
+    sorts=("id", "complaint_number", "date_received"),
+    fields=tuple(ComplaintSchema().dump_fields),
+    field_dependencies={
+        "source_first_nation": ("source_first_nation_id",),
+        **{field: ("project_id", "project") for field in PROJECT_PARAMETER_FIELDS},
+    },
+)
 
 
 @cors_preflight("GET, OPTIONS")
@@ -52,14 +78,24 @@ class Complaints(Resource):
     """Resource for managing complaints."""
 
     @staticmethod
-    @API.response(code=200, description="Success", model=[complaint_list_model])
+    @API.response(code=200, description=PAGE_RESPONSE_DESCRIPTION, model=complaint_page_model)
     @API.doc(
         params={
             "case_file_id": {
                 "description": "The unique identifier of the case file",
                 "type": "integer",
                 "required": False,
-            }
+            },
+            "enrich": {
+                "description": "Set to 'project' to include the authorization, type, sub_type "
+                "and regulated_party of the project",
+                "type": "string",
+                "required": False,
+            },
+            **ASSIGNED_OFFICER_PARAMS,
+            **PAGINATION_PARAMS,
+            **STREAM_PARAMS,
+            **COMPLAINT_LIST_QUERY.describe(),
         }
     )
     @ApiHelper.swagger_decorators(API, endpoint_description="Fetch all complaints")
@@ -67,12 +103,25 @@ class Complaints(Resource):
     def get():
         """Fetch all complaints."""
         case_file_id = request.args.get("case_file_id")
+        list_query = ApiHelper.get_list_query(COMPLAINT_LIST_QUERY)
+        enrich_project = "project" in ApiHelper.get_list_arg("enrich", ENRICH_OPTIONS) and list_query.includes(
+            *PROJECT_PARAMETER_FIELDS
+        )
+        assigned_officer = ApiHelper.get_assigned_officer_args()
+        stream = ApiHelper.get_stream_arg()
+        page = ApiHelper.get_page_args(list_query)
+        complaint_list_schema = ApiHelper.list_schema(ComplaintSchema, list_query)
         if case_file_id:
-            complaints = ComplaintService.get_by_case_file_id(case_file_id)
+            complaints = ComplaintService.get_by_case_file_id(
+                case_file_id, enrich_project, **assigned_officer, list_query=list_query, page=page, stream=stream
+            )
         else:
-            complaints = ComplaintService.get_all()
-        complaint_list_schema = ComplaintSchema(many=True)
-        return complaint_list_schema.dump(complaints), HTTPStatus.OK
+            complaints = ComplaintService.get_all(
+                enrich_project, **assigned_officer, list_query=list_query, page=page, stream=stream
+            )
+        if stream:
+            return ApiHelper.stream_list(complaint_list_schema, complaints)
+        return ApiHelper.dump_list(complaint_list_schema, complaints), HTTPStatus.OK
 
     @staticmethod
     @auth.require
@@ -19,15 +19,22 @@ from flask import current_app, request
 from flask_restx import Namespace, Resource
 
 from compliance_api.auth import auth
+from compliance_api.models import Inspection as InspectionModel
+from compliance_api.models.list_query import EQ, PREFIX, RANGE, FilterField, ListQuerySpec
 from compliance_api.schemas import (
-    InspectionAttendanceSchema, InspectionCreateSchema, InspectionOfficerSchema, InspectionSchema,
-    InspectionUpdateSchema, KeyValueSchema, StaffUserSchema)
+    InspectionAttendanceSchema, InspectionCreateSchema, InspectionOfficerSchema, InspectionProfileSchema,
+    InspectionSchema, InspectionUpdateSchema, KeyValueSchema, StaffUserSchema)
 from compliance_api.services import InspectionService
+from compliance_api.services.inspection import PROFILE_SECTIONS
+from compliance_api.services.project_enrichment import PROJECT_PARAMETER_FIELDS
 from compliance_api.utils.util import cors_preflight
 
+from .apihelper import ASSIGNED_OFFICER_PARAMS, PAGE_RESPONSE_DESCRIPTION, PAGINATION_PARAMS, STREAM_PARAMS
 from .apihelper import Api as ApiHelper
 
 
+ENRICH_OPTIONS = ("project",)
+
 API = Namespace("inspections", description="Endpoints for Inspection Management")
 
 keyvalue_list_schema = ApiHelper.convert_ma_schema_to_restx_model(
@@ -40,6 +47,7 @@ inspection_create_model = ApiHelper.convert_ma_schema_to_restx_model(
 inspection_list_model = ApiHelper.convert_ma_schema_to_restx_model(
     API, InspectionSchema(), "InspectionList"
 )
+inspection_page_model = ApiHelper.page_model(API, inspection_list_model, "InspectionPage")
 inspection_officer_model = ApiHelper.convert_ma_schema_to_restx_model(
     API, InspectionOfficerSchema(), "InspectionOfficer"
 )
@@ -51,6 +59,27 @@ inspection_update_model = ApiHelper.convert_ma_schema_to_restx_model(
 )
 
 
+INSPECTION_LIST_QUERY = ListQuerySpec(
+    InspectionModel,
+    filters=[
+        FilterField("ir_number", (EQ, PREFIX)),
+        FilterField("project_id"),
+        FilterField("primary_officer_id"),
+        FilterField("initiation_id"),
+        FilterField("ir_status_id"),
+        FilterField("inspection_status"),
+        FilterField("start_date", (RANGE,)),
+        FilterField("end_date", (RANGE,)),
+    ],
+    sorts=("id", "ir_number", "start_date"),
+    fields=tuple(InspectionSchema().dump_fields),
+    field_dependencies={
+        "types_text": ("types",),
+        **{field: ("project_id", "project") for field in PROJECT_PARAMETER_FIELDS},
+    },
+)
+
+
 @cors_preflight("GET, OPTIONS")
 @API.route("/attendance-options", methods=["GET", "OPTIONS"])
 class AttendanceOptions(Resource):
@@ -129,14 +158,24 @@ class Inspections(Resource):
     """Resource for managing inspections."""
 
     @staticmethod
-    @API.response(code=200, description="Success", model=[inspection_list_model])
+    @API.response(code=200, description=PAGE_RESPONSE_DESCRIPTION, model=inspection_page_model)
     @API.doc(
         params={
             "case_file_id": {
                 "description": "The unique identifier of the case file",
                 "type": "integer",
                 "required": False,
-            }
+            },
+            "enrich": {
+                "description": "Set to 'project' to include the authorization, type, sub_type "
+                "and regulated_party of the project",
+                "type": "string",
+                "required": False,
+            },
+            **ASSIGNED_OFFICER_PARAMS,
+            **PAGINATION_PARAMS,
+            **STREAM_PARAMS,
+            **INSPECTION_LIST_QUERY.describe(),
         }
     )
     @ApiHelper.swagger_decorators(API, endpoint_description="Fetch all inspections")
@@ -144,12 +183,25 @@ class Inspections(Resource):
     def get():
         """Fetch all inspections."""
         case_file_id = request.args.get("case_file_id")
+        list_query = ApiHelper.get_list_query(INSPECTION_LIST_QUERY)
+        enrich_project = "project" in ApiHelper.get_list_arg("enrich", ENRICH_OPTIONS) and list_query.includes(
+            *PROJECT_PARAMETER_FIELDS
+        )
+        assigned_officer = ApiHelper.get_assigned_officer_args()
+        stream = ApiHelper.get_stream_arg()
+        page = ApiHelper.get_page_args(list_query)
+        inspection_list_schema = ApiHelper.list_schema(InspectionSchema, list_query)
         if case_file_id:
-            inspections = InspectionService.get_by_case_file_id(case_file_id)
+            inspections = InspectionService.get_by_case_file_id(
+                case_file_id, enrich_project, **assigned_officer, list_query=list_query, page=page, stream=stream
+            )
         else:
-            inspections = InspectionService.get_all()
-        inspection_list_schema = InspectionSchema(many=True)
-        return inspection_list_schema.dump(inspections), HTTPStatus.OK
+            inspections = InspectionService.get_all(
+                enrich_project, **assigned_officer, list_query=list_query, page=page, stream=stream
+            )
+        if stream:
+            return ApiHelper.stream_list(inspection_list_schema, inspections)
+        return ApiHelper.dump_list(inspection_list_schema, inspections), HTTPStatus.OK
 
     @staticmethod
     @auth.require
@@ -212,6 +264,35 @@ class Inspection(Resource):
         return InspectionSchema().dump(updated_inspection), HTTPStatus.CREATED
 
 
+@cors_preflight("GET, OPTIONS")
+@API.route("/<int:inspection_id>/profile", methods=["GET", "OPTIONS"])
+class InspectionProfile(Resource):
+    """Inspection profile resource."""
+
+    @staticmethod
+    @API.doc(
+        params={
+            "include": {
+                "description": f"Comma separated sections to return among {', '.join(PROFILE_SECTIONS)}; "
+                "all of them by default",
+                "type": "string",
+                "required": False,
+            }
+        }
+    )
+    @API.response(code=200, description="Success")
+    @ApiHelper.swagger_decorators(
+        API, endpoint_description="Fetch the inspection with its attendance, types, officers and project info"
+    )
+    @auth.require
+    def get(inspection_id):
+        """Fetch the sections of the profile of an inspection in one request."""
+        include = ApiHelper.get_list_arg("include", PROFILE_SECTIONS) or set(PROFILE_SECTIONS)
+        sections = [section for section in PROFILE_SECTIONS if section in include]
+        profile = InspectionService.get_profile(inspection_id, sections)
+        return InspectionProfileSchema(only=sections).dump(profile), HTTPStatus.OK
+
+
 @cors_preflight("GET, OPTIONS")
 @API.route("/ir-numbers/<string:ir_number>", methods=["GET", "OPTIONS"])
 class InspectionByIRNumber(Resource):
@@ -12,10 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Endpoints to check and manage the health of the service."""
-from flask import current_app
+from flask import Response, current_app
 from flask_restx import Namespace, Resource
 from sqlalchemy import exc, text
 
+from compliance_api.services.http_client import get_breaker_states
+from compliance_api.utils import metrics
+
 
 API = Namespace('ops', description='Service - OPS checks')
 
@@ -50,3 +53,23 @@ class Readyz(Resource):
         """Return a JSON object that identifies if the service is setupAnd ready to work."""
         # TODO: add a poll to the DB when called
         return {'message': 'api is ready'}, 200
+
+
+@API.route('circuit-breakers')
+class CircuitBreakers(Resource):
+    """Exposes the state of the circuit breakers of the upstream services."""
+
+    @staticmethod
+    def get():
+        """Return the circuit breaker state of every upstream, as seen by the worker answering."""
+        return {'circuit_breakers': get_breaker_states()}, 200
+
+
+@API.route('metrics')
+class Metrics(Resource):
+    """Exposes the metrics of the API and of its calls to the upstream services."""
+
+    @staticmethod
+    def get():
+        """Return the metrics of the worker answering in the Prometheus text format."""
+        return Response(metrics.render(), mimetype='text/plain; version=0.0.4')
@@ -0,0 +1,90 @@
+# Copyright © 2024 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the 'License');
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an 'AS IS' BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""API endpoint returning all the reference data lists at once.
+
+Each worker keeps a snapshot of the lists: the JSON body and its hash, sent as
+ETag. Every request checks the version of the reference data tables, a single
+query, and the snapshot is rebuilt only when the version changed. A request
+carrying the ETag of the snapshot in If-None-Match is answered 304.
+"""
+
+import hashlib
+import threading
+from http import HTTPStatus
+
+from flask import Response, json, request
+from flask_restx import Namespace, Resource
+
+from compliance_api.auth import auth
+from compliance_api.schemas import AgencySchema, KeyValueSchema, TopicSchema
+from compliance_api.services.reference_data import REFERENCE_DATA, ReferenceDataService
+from compliance_api.utils.util import cors_preflight
+
+from .apihelper import Api as ApiHelper
+
+
+API = Namespace("reference-data", description="Endpoints for the reference data lists")
+
+# The schema dumping each list; the lists not listed are key/value lists.
+_LIST_SCHEMAS = {"agencies": AgencySchema, "topics": TopicSchema}
+
+
+class _Snapshot:  # pylint: disable=too-few-public-methods
+    """The dumped reference data lists of a version of the tables."""
+
+    def __init__(self):
+        """Create the snapshot, built on the first request."""
+        self.version = None
+        self.body = None
+        self.etag = None
+        self._lock = threading.Lock()
+
+    def get(self) -> tuple:
+        """Return the body and ETag of the current version of the tables, rebuilding them if it changed."""
+        version = ReferenceDataService.get_version()
+        with self._lock:
+            if version != self.version:
+                rows = ReferenceDataService.get_all()
+                body = json.dumps(
+                    {
+                        name: _LIST_SCHEMAS.get(name, KeyValueSchema)(many=True).dump(rows[name])
+                        for name in REFERENCE_DATA
+                    }
+                )
+                self.body = body
+                self.etag = hashlib.sha256(body.encode("utf-8")).hexdigest()
+                self.version = version
+            return self.body, self.etag
+
+
+_snapshot = _Snapshot()
+
+
+@cors_preflight("GET, OPTIONS")
+@API.route("", methods=["GET", "OPTIONS"])
+class ReferenceData(Resource):
+    """Resource for the reference data lists."""
+
+    @staticmethod
+    @API.response(code=200, description="Success")
+    @API.response(code=304, description="Not modified since the ETag in If-None-Match")
+    @ApiHelper.swagger_decorators(API, endpoint_description="Fetch all the reference data lists keyed by name")
+    @auth.require
+    def get():
+        """Fetch all the option lists, agencies and topics keyed by name."""
+        body, etag = _snapshot.get()
+        response = Response(body, status=HTTPStatus.OK, mimetype="application/json")
+        response.set_etag(etag)
+        response.cache_control.no_cache = True
+        return response.make_conditional(request)
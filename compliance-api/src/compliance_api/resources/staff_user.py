@@ -15,14 +15,20 @@
 
 from http import HTTPStatus
 
+from flask import request
 from flask_restx import Namespace, Resource
 
 from compliance_api.auth import auth
-from compliance_api.exceptions import ResourceNotFoundError
-from compliance_api.schemas import KeyValueSchema, StaffUserCreateSchema, StaffUserSchema, StaffUserUpdateSchema
-from compliance_api.services import StaffUserService
+from compliance_api.exceptions import BadRequestError, ResourceNotFoundError
+from compliance_api.models import GroupUpdateStatusEnum
+from compliance_api.models import StaffUser as StaffUserModel
+from compliance_api.models.list_query import PREFIX, FilterField, ListQuerySpec
+from compliance_api.schemas import (
+    KeyValueSchema, StaffUserCreateSchema, StaffUserGroupUpdateSchema, StaffUserSchema, StaffUserUpdateSchema)
+from compliance_api.services import StaffUserGroupUpdateService, StaffUserService
 from compliance_api.utils.util import cors_preflight
 
+from .apihelper import PAGE_RESPONSE_DESCRIPTION, PAGINATION_PARAMS
 from .apihelper import Api as ApiHelper
 
 
@@ -37,9 +43,26 @@ user_update_model = ApiHelper.convert_ma_schema_to_restx_model(
 user_list_model = ApiHelper.convert_ma_schema_to_restx_model(
     API, StaffUserSchema(), "StaffUserList"
 )
+user_page_model = ApiHelper.page_model(API, user_list_model, "StaffUserPage")
 key_value_list_model = ApiHelper.convert_ma_schema_to_restx_model(
     API, KeyValueSchema(), "List"
 )
+group_update_list_model = ApiHelper.convert_ma_schema_to_restx_model(
+    API, StaffUserGroupUpdateSchema(), "StaffUserGroupUpdate"
+)
+
+
+STAFF_USER_LIST_QUERY = ListQuerySpec(
+    StaffUserModel,
+    filters=[
+        FilterField("first_name", (PREFIX,)),
+        FilterField("last_name", (PREFIX,)),
+        FilterField("position_id"),
+        FilterField("supervisor_id"),
+        FilterField("deputy_director_id"),
+    ],
+    sorts=("id", "last_name"),
+)
 
 
 @cors_preflight("GET, OPTIONS, POST")
@@ -48,14 +71,16 @@ class StaffUsers(Resource):
     """Resource for managing users."""
 
     @staticmethod
-    @API.response(code=200, description="Success", model=[user_list_model])
+    @API.doc(params={**PAGINATION_PARAMS, **STAFF_USER_LIST_QUERY.describe()})
+    @API.response(code=200, description=PAGE_RESPONSE_DESCRIPTION, model=user_page_model)
     @ApiHelper.swagger_decorators(API, endpoint_description="Fetch all users")
     @auth.require
     def get():
         """Fetch all users."""
-        users = StaffUserService.get_all_staff_users()
-        user_list_schema = StaffUserSchema(many=True)
-        return user_list_schema.dump(users), HTTPStatus.OK
+        list_query = ApiHelper.get_list_query(STAFF_USER_LIST_QUERY)
+        user_list_schema = ApiHelper.list_schema(StaffUserSchema, list_query)
+        users = StaffUserService.get_all_staff_users(list_query, ApiHelper.get_page_args(list_query))
+        return ApiHelper.dump_list(user_list_schema, users), HTTPStatus.OK
 
     @staticmethod
     @auth.require
@@ -130,3 +155,38 @@ class StaffUserPermissions(Resource):
         """Fetch the permission levels."""
         permissions = StaffUserService.get_permission_levels()
         return KeyValueSchema(many=True).dump(permissions), HTTPStatus.OK
+
+
+@cors_preflight("GET")
+@API.route("/group-updates", methods=["GET"])
+class StaffUserGroupUpdates(Resource):
+    """Resources to track the group updates sent to EPIC.Authorize."""
+
+    @staticmethod
+    @auth.require
+    @API.doc(
+        params={
+            "status": {
+                "description": "The delivery status: PENDING, DELIVERED, SUPERSEDED or FAILED",
+                "type": "string",
+                "required": False,
+            },
+            "auth_user_guid": {
+                "description": "The unique identifier of the user from the identity provider",
+                "type": "string",
+                "required": False,
+            },
+        }
+    )
+    @ApiHelper.swagger_decorators(API, endpoint_description="Fetch the group updates")
+    @API.response(code=200, model=[group_update_list_model], description="Success")
+    @API.response(400, "Bad Request")
+    def get():
+        """Fetch the group updates, latest first."""
+        status = request.args.get("status")
+        if status and status not in GroupUpdateStatusEnum.__members__:
+            raise BadRequestError(f"Unsupported status {status}")
+        group_updates = StaffUserGroupUpdateService.get_group_updates(
+            status, request.args.get("auth_user_guid")
+        )
+        return StaffUserGroupUpdateSchema(many=True).dump(group_updates), HTTPStatus.OK
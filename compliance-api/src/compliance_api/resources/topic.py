@@ -19,10 +19,13 @@ from flask_restx import Namespace, Resource
 
 from compliance_api.auth import auth
 from compliance_api.exceptions import ResourceNotFoundError
+from compliance_api.models import Topic as TopicModel
+from compliance_api.models.list_query import PREFIX, FilterField, ListQuerySpec
 from compliance_api.schemas import TopicCreateSchema, TopicSchema
 from compliance_api.services import TopicService
 from compliance_api.utils.util import cors_preflight
 
+from .apihelper import PAGE_RESPONSE_DESCRIPTION, PAGINATION_PARAMS
 from .apihelper import Api as ApiHelper
 
 
@@ -34,6 +37,12 @@ topic_request_model = ApiHelper.convert_ma_schema_to_restx_model(
 topic_list_model = ApiHelper.convert_ma_schema_to_restx_model(
     API, TopicSchema(), "TopicList"
 )
+topic_page_model = ApiHelper.page_model(API, topic_list_model, "TopicPage")
+
+
+TOPIC_LIST_QUERY = ListQuerySpec(
+    TopicModel, filters=[FilterField("name", (PREFIX,))], sorts=("id", "name")
+)
 
 
 @cors_preflight("GET, OPTIONS, POST")
@@ -42,14 +51,16 @@ class Topics(Resource):
     """Resource for managing topics."""
 
     @staticmethod
-    @API.response(code=200, description="Success", model=[topic_list_model])
+    @API.doc(params={**PAGINATION_PARAMS, **TOPIC_LIST_QUERY.describe()})
+    @API.response(code=200, description=PAGE_RESPONSE_DESCRIPTION, model=topic_page_model)
     @ApiHelper.swagger_decorators(API, endpoint_description="Fetch all topics")
     @auth.require
     def get():
         """Fetch all topics."""
-        topics = TopicService.get_all()
+        list_query = ApiHelper.get_list_query(TOPIC_LIST_QUERY)
+        topics = TopicService.get_all(list_query, ApiHelper.get_page_args(list_query))
         topic_list_schema = TopicSchema(many=True)
-        return topic_list_schema.dump(topics), HTTPStatus.OK
+        return ApiHelper.dump_list(topic_list_schema, topics), HTTPStatus.OK
 
     @staticmethod
     @auth.require
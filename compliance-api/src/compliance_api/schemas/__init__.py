@@ -20,8 +20,8 @@ from .continuation_report import (
     ContinuationReportCreateSchema, ContinuationReportKeyCreateSchema, ContinuationReportKeySchema,
     ContinuationReportSchema)
 from .inspection import (
-    InspectionAttendanceSchema, InspectionCreateSchema, InspectionOfficerSchema, InspectionSchema,
-    InspectionUpdateSchema)
+    InspectionAttendanceSchema, InspectionCreateSchema, InspectionOfficerSchema, InspectionProfileSchema,
+    InspectionSchema, InspectionUnapprovedProjectSchema, InspectionUpdateSchema)
 from .project import ProjectSchema
-from .staff_user import StaffUserCreateSchema, StaffUserSchema, StaffUserUpdateSchema
+from .staff_user import StaffUserCreateSchema, StaffUserGroupUpdateSchema, StaffUserSchema, StaffUserUpdateSchema
 from .topic import TopicCreateSchema, TopicSchema
@@ -98,3 +98,11 @@ class AutoSchemaBase(ma.SQLAlchemyAutoSchema):  # pylint: disable=too-many-ances
             field_obj.metadata["description"] = column.comment
 
         super().on_bind_field(field_name, field_obj)
+
+    def dumps_field(self, field_name) -> bool:
+        """Return whether the field is in the output: always, unless a sparse fieldset leaves it out.
+
+        A schema dumping a sparse fieldset is created with the sparse_fields context, which
+        its nested schemas share.
+        """
+        return not self.context.get("sparse_fields") or field_name in self.dump_fields
@@ -63,9 +63,9 @@ class CaseFileSchema(AutoSchemaBase):  # pylint: disable=too-many-ancestors
             data["case_file_status"] = CaseFileStatusEnum(
                 data["case_file_status"]
             ).value
-        else:
+        elif self.dumps_field("case_file_status"):
             data["case_file_status"] = ""
-        if data.get("project", None) is None:
+        if data.get("project", None) is None and self.dumps_field("project"):
             data["project"] = {
                 "name": UNAPPROVED_PROJECT_NAME,
                 "abbreviation": UNAPPROVED_PROJECT_CODE,
@@ -0,0 +1,192 @@
+# Copyright © 2024 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Dump functions compiled from the marshmallow schemas.
+
+compile_schema builds the schema once for a set of only, exclude and context,
+and generates a dump function from its fields: the integer, string, boolean,
+date, enum and nested fields are read with getattr and formatted inline, the
+other fields (Method, Function, List...) call the field as marshmallow does.
+The pre_dump and post_dump hooks of the schema are invoked as in Schema.dump,
+so the output is the same as the one of the schema, key order included. The
+compiled schemas are cached per worker and shared by the requests, with the
+loader options eager loading the relationships they dump.
+"""
+from functools import lru_cache, partial
+
+from marshmallow import Schema, fields, missing
+from marshmallow.decorators import POST_DUMP, PRE_DUMP
+from marshmallow.utils import ensure_text_type
+
+from .eager_load import eager_load_options
+
+
+# At most this many compiled schemas are kept; a sparse fieldset compiles its own.
+COMPILED_SCHEMA_CACHE_SIZE = 256
+
+_PASSTHROUGH_FIELDS = (fields.Field, fields.Raw)
+
+
+class CompiledSchema:
+    """A schema and the dump function compiled from its fields; dump is a drop-in for Schema.dump.
+
+    load_options eager loads the relationships dumped from the model of the schema, if it has one.
+    """
+
+    def __init__(self, schema: Schema):
+        """Compile the dump function and the eager loading plan of the schema."""
+        self.schema = schema
+        self.many = schema.many
+        model = getattr(schema.opts, "model", None)
+        self.load_options = eager_load_options(schema, model) if model is not None else []
+        self._serialize = _compile_serializer(schema)
+        self._has_pre_dump = schema._has_processors(PRE_DUMP)  # pylint: disable=protected-access
+        self._has_post_dump = schema._has_processors(POST_DUMP)  # pylint: disable=protected-access
+
+    def dump(self, obj, *, many: bool = None):
+        """Serialize the object, or the objects with many, as the schema does."""
+        many = self.many if many is None else bool(many)
+        schema = self.schema
+        processed = obj
+        if self._has_pre_dump:
+            processed = schema._invoke_dump_processors(  # pylint: disable=protected-access
+                PRE_DUMP, obj, many=many, original_data=obj
+            )
+        if many and processed is not None:
+            serialize = self._serialize
+            result = [serialize(item) for item in processed]
+        else:
+            result = self._serialize(processed)
+        if self._has_post_dump:
+            result = schema._invoke_dump_processors(  # pylint: disable=protected-access
+                POST_DUMP, result, many=many, original_data=obj
+            )
+        return result
+
+
+def compile_schema(schema_class, only=None, exclude=(), context: dict = None, many=True) -> CompiledSchema:
+    """Return the compiled schema of the class for the only and exclude fields and the context.
+
+    Raises ValueError, as the schema does, when only or exclude name an unknown field.
+    """
+    return _compile(
+        schema_class,
+        # The keys follow the order of only, so it is kept in the cache key.
+        None if only is None else tuple(dict.fromkeys(only)),
+        tuple(sorted(set(exclude))),
+        tuple(sorted((context or {}).items())),
+        many,
+    )
+
+
+@lru_cache(maxsize=COMPILED_SCHEMA_CACHE_SIZE)
+def _compile(schema_class, only, exclude, context, many) -> CompiledSchema:
+    """Build and compile the schema; the arguments are hashable for the cache."""
+    return CompiledSchema(schema_class(many=many, only=only, exclude=exclude, context=dict(context)))
+
+
+def _compile_serializer(schema: Schema):
+    """Return the function serializing one object with the fields of the schema."""
+    namespace = {
+        "missing": missing,
+        "ensure_text_type": ensure_text_type,
+        "generic_serialize": partial(schema._serialize, many=False),  # pylint: disable=protected-access
+        "get_attribute": schema.get_attribute,
+        "dict_class": schema.dict_class,
+    }
+    # An object read by key (e.g. a dict) goes through the accessor of the schema.
+    lines = [
+        "def serialize(obj):",
+        "    if hasattr(obj, '__getitem__'):",
+        "        return generic_serialize(obj)",
+        "    ret = dict_class()",
+    ]
+    default_accessor = type(schema).get_attribute is Schema.get_attribute
+    for index, (name, field) in enumerate(schema.dump_fields.items()):
+        key = field.data_key if field.data_key is not None else name
+        attribute = name if field.attribute is None else field.attribute
+        namespace[f"field_{index}"] = field
+        expression = _inline_expression(field, index, namespace) if default_accessor else None
+        if expression is None or "." in attribute or field.dump_default is not missing:
+            lines.append(f"    value = field_{index}.serialize({name!r}, obj, accessor=get_attribute)")
+            lines.append("    if value is not missing:")
+            lines.append(f"        ret[{key!r}] = value")
+            continue
+        lines.append(f"    value = getattr(obj, {attribute!r}, missing)")
+        lines.append("    if value is not missing:")
+        lines.append(f"        ret[{key!r}] = {expression}")
+    lines.append("    return ret")
+    exec("\n".join(lines), namespace)  # pylint: disable=exec-used # nosec
+    return namespace["serialize"]
+
+
+def _inline_expression(field, index: int, namespace: dict):
+    """Return the expression formatting the value of the field as its _serialize does, None if not inlined."""
+    inline = _INLINERS.get(type(field))
+    return inline(field, index, namespace) if inline else None
+
+
+def _inline_integer(field, index: int, namespace: dict):  # pylint: disable=unused-argument
+    """Return the expression of an integer field, None for an integer dumped as string."""
+    return None if field.as_string else "None if value is None else int(value)"
+
+
+def _inline_string(field, index: int, namespace: dict):  # pylint: disable=unused-argument
+    """Return the expression of a string field."""
+    return "None if value is None else value if value.__class__ is str else ensure_text_type(value)"
+
+
+def _inline_boolean(field, index: int, namespace: dict):  # pylint: disable=unused-argument
+    """Return the expression of a boolean field, deferring to the field for the truthy and falsy values."""
+    return (
+        "value if value is None or value is True or value is False "
+        f"else field_{index}._serialize(value, None, None)"
+    )
+
+
+def _inline_datetime(field, index: int, namespace: dict):
+    """Return the expression of a date or datetime field, calling the formatting function of its format."""
+    data_format = field.format or field.DEFAULT_FORMAT
+    format_function = field.SERIALIZATION_FUNCS.get(data_format)
+    namespace[f"format_{index}"] = format_function or partial(_strftime, data_format=data_format)
+    return f"None if value is None else format_{index}(value)"
+
+
+def _inline_passthrough(field, index: int, namespace: dict):  # pylint: disable=unused-argument
+    """Return the expression of a field dumping its value as is."""
+    return "value"
+
+
+def _inline_nested(field, index: int, namespace: dict):
+    """Return the expression of a nested field, calling the compiled dump of the nested schema."""
+    nested_schema = field.schema
+    nested = CompiledSchema(nested_schema)
+    namespace[f"nested_{index}"] = partial(nested.dump, many=nested_schema.many or field.many)
+    return f"None if value is None else nested_{index}(value)"
+
+
+# The function returning the inlined expression of each field type; the other types are not inlined.
+_INLINERS = {
+    fields.Integer: _inline_integer,
+    fields.String: _inline_string,
+    fields.Boolean: _inline_boolean,
+    fields.DateTime: _inline_datetime,
+    fields.Date: _inline_datetime,
+    fields.Nested: _inline_nested,
+    **{field_type: _inline_passthrough for field_type in _PASSTHROUGH_FIELDS},
+}
+
+
+def _strftime(value, data_format: str) -> str:
+    """Format the date with the format."""
+    return value.strftime(data_format)
@@ -269,6 +269,19 @@ class ComplaintSchema(AutoSchemaBase):  # pylint: disable=too-many-ancestors
     source_type = fields.Nested(KeyValueSchema)
     requirement_source = fields.Nested(KeyValueSchema)
     requirement_detail = fields.Nested(RequirementSoruceDetailSchema, only=["topic"])
+    authorization = fields.Str(
+        metadata={"description": "The authorization information of the project"}
+    )
+    regulated_party = fields.Str(
+        metadata={"description": "The regulated party of the project"}
+    )
+    type = fields.Str(metadata={"description": "The type of the project"})
+    sub_type = fields.Str(metadata={"description": "The subtype of the project"})
+    source_first_nation = fields.Nested(
+        KeyValueSchema,
+        dump_only=True,
+        metadata={"description": "The first nation from EPIC.track the complaint came from."},
+    )
 
     @post_dump
     def post_dump_actions(
@@ -277,9 +290,9 @@ class ComplaintSchema(AutoSchemaBase):  # pylint: disable=too-many-ancestors
         """Extract the value of the inspection status enum."""
         if "status" in data and data.get("status", None) is not None:
             data["status"] = ComplaintStatusEnum(data["status"]).value
-        else:
+        elif self.dumps_field("status"):
             data["status"] = ""
-        if data.get("project", None) is None:
+        if data.get("project", None) is None and self.dumps_field("project"):
             data["project"] = {
                 "name": UNAPPROVED_PROJECT_NAME,
                 "abbreviation": UNAPPROVED_PROJECT_CODE,
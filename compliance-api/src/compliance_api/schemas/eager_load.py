@@ -0,0 +1,93 @@
+# Copyright © 2024 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Eager loading plans derived from the marshmallow schemas.
+
+eager_load_options walks the fields a schema dumps and returns the loader
+options loading, with the rows, every relationship those fields read: the
+relationship of a nested field, and the relationships a Method or Function
+field declares as dotted paths in its "loads" metadata, e.g. "types.type".
+The relationships dumped by the nested schemas are planned the same way.
+
+A collection is loaded with selectinload, one query per relationship whatever
+the number of rows, which also works on the batches of a streamed list; a
+many-to-one is joined to the query with joinedload. A list thus runs the same
+number of queries for one row or a thousand.
+"""
+from marshmallow import fields
+from sqlalchemy import inspect
+from sqlalchemy.orm import joinedload, selectinload
+
+
+# Relationships loaded as queries (dynamic, write only) or never loaded are left out of the plans.
+_UNPLANNED_LOADERS = ("dynamic", "write_only", "noload", "raise", "raise_on_sql")
+
+
+def eager_load_options(schema, model=None) -> list:
+    """Return the loader options of the relationships the schema dumps from the model, Meta.model by default."""
+    mapper = inspect(model or schema.opts.model)
+    return _options(mapper, _plan(mapper, schema, ()))
+
+
+def _plan(mapper, schema, planned: tuple) -> dict:
+    """Return the tree of the relationships the schema reads, keyed by relationship name.
+
+    planned holds the (mapper, schema class) pairs being planned above, so that
+    a schema nesting itself is planned once.
+    """
+    tree = {}
+    if (mapper, type(schema)) in planned:
+        return tree
+    planned = (*planned, (mapper, type(schema)))
+    for name, field in schema.dump_fields.items():
+        for path in field.metadata.get("loads", ()):
+            _add_path(tree, mapper, path.split("."))
+        attribute = field.attribute or name
+        relationship = mapper.relationships.get(attribute)
+        if relationship is None:
+            continue
+        children = tree.setdefault(attribute, {})
+        if isinstance(field, fields.Nested):
+            _merge(children, _plan(relationship.mapper, field.schema, planned))
+    return tree
+
+
+def _add_path(tree: dict, mapper, names: list):
+    """Add the relationships of the dotted path to the tree, raising ValueError on an unknown one."""
+    for name in names:
+        if name not in mapper.relationships:
+            raise ValueError(f"{mapper.class_.__name__}.{name} is not a relationship")
+        tree = tree.setdefault(name, {})
+        mapper = mapper.relationships[name].mapper
+
+
+def _merge(tree: dict, other: dict):
+    """Merge the other tree into the tree."""
+    for name, children in other.items():
+        _merge(tree.setdefault(name, {}), children)
+
+
+def _options(mapper, tree: dict) -> list:
+    """Return the loader options of the relationships of the tree, their children as sub-options."""
+    options = []
+    for name, children in tree.items():
+        relationship = mapper.relationships[name]
+        if relationship.lazy in _UNPLANNED_LOADERS:
+            continue
+        loader = selectinload if relationship.uselist else joinedload
+        option = loader(relationship.class_attribute)
+        sub_options = _options(relationship.mapper, children)
+        if sub_options:
+            option = option.options(*sub_options)
+        options.append(option)
+    return options
@@ -15,7 +15,8 @@
 from marshmallow import EXCLUDE, ValidationError, fields, post_dump, validates_schema
 
 from compliance_api.models.inspection import (
-    Inspection, InspectionAttendance, InspectionAttendanceOptionEnum, InspectionOfficer, InspectionStatusEnum)
+    Inspection, InspectionAttendance, InspectionAttendanceOptionEnum, InspectionOfficer, InspectionStatusEnum,
+    InspectionUnapprovedProject)
 from compliance_api.utils.constant import INPUT_DATE_TIME_FORMAT, UNAPPROVED_PROJECT_CODE, UNAPPROVED_PROJECT_NAME
 
 from .base_schema import AutoSchemaBase, BaseSchema
@@ -337,8 +338,8 @@ class InspectionSchema(AutoSchemaBase):  # pylint: disable=too-many-ancestors
     )
     ir_status = fields.Nested(KeyValueSchema)
     initiation = fields.Nested(KeyValueSchema)
-    types = fields.Method("get_inspection_types")
-    types_text = fields.Method("get_inspection_type_names")
+    types = fields.Method("get_inspection_types", metadata={"loads": ("types.type",)})
+    types_text = fields.Method("get_inspection_type_names", metadata={"loads": ("types.type",)})
     authorization = fields.Str(
         metadata={"description": "The authorization information of the project"}
     )
@@ -358,9 +359,9 @@ class InspectionSchema(AutoSchemaBase):  # pylint: disable=too-many-ancestors
             data["inspection_status"] = InspectionStatusEnum(
                 data["inspection_status"]
             ).value
-        else:
+        elif self.dumps_field("inspection_status"):
             data["inspection_status"] = ""
-        if data.get("project", None) is None:
+        if data.get("project", None) is None and self.dumps_field("project"):
             data["project"] = {
                 "name": UNAPPROVED_PROJECT_NAME,
                 "abbreviation": UNAPPROVED_PROJECT_CODE,
@@ -382,3 +383,30 @@ class InspectionSchema(AutoSchemaBase):  # pylint: disable=too-many-ancestors
         if obj.types:
             return ", ".join([o.type.name for o in obj.types])
         return []
+
+
+class InspectionUnapprovedProjectSchema(AutoSchemaBase):  # pylint: disable=too-many-ancestors
+    """Schema for the project info of an inspection without approved project."""
+
+    class Meta(AutoSchemaBase.Meta):  # pylint: disable=too-few-public-methods
+        """Meta."""
+
+        unknown = EXCLUDE
+        model = InspectionUnapprovedProject
+        include_fk = True
+
+
+class InspectionProfileSchema(BaseSchema):
+    """Schema for the profile of an inspection, one field per section."""
+
+    inspection = fields.Nested(InspectionSchema, metadata={"description": "The inspection"})
+    attendance = fields.Nested(
+        InspectionAttendanceSchema, many=True, metadata={"description": "The attendance options and attendees"}
+    )
+    types = fields.Nested(KeyValueSchema, many=True, metadata={"description": "The inspection types"})
+    officers = fields.Nested(StaffUserSchema, many=True, metadata={"description": "The other officers"})
+    unapproved_project = fields.Nested(
+        InspectionUnapprovedProjectSchema,
+        allow_none=True,
+        metadata={"description": "The project info when the project is not approved yet"},
+    )
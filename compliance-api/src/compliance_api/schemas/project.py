@@ -28,3 +28,4 @@ class ProjectSchema(AutoSchemaBase):  # pylint: disable=too-many-ancestors
         unknown = EXCLUDE
         model = ProjectModel
         include_fk = True
+        exclude = ("sync_hash",)
@@ -16,6 +16,7 @@ from marshmallow import EXCLUDE, fields, post_dump, post_load
 from marshmallow_enum import EnumField
 
 from compliance_api.models.staff_user import StaffUser
+from compliance_api.models.staff_user_group_update import GroupUpdateStatusEnum, StaffUserGroupUpdate
 from compliance_api.utils.enum import PermissionEnum
 
 from .base_schema import AutoSchemaBase, BaseSchema
@@ -47,9 +48,9 @@ class StaffUserSchemaSkeleton(AutoSchemaBase):  # pylint: disable=too-many-ances
         self, data, **kwargs
     ):  # pylint: disable=no-self-use, unused-argument
         """Make nested objects null if the referenced ID is null."""
-        if data.get("deputy_director_id") is None:
+        if data.get("deputy_director_id") is None and self.dumps_field("deputy_director"):
             data["deputy_director"] = None
-        if data.get("supervisor_id") is None:
+        if data.get("supervisor_id") is None and self.dumps_field("supervisor"):
             data["supervisor"] = None
         if data.get("permission", None):
             print(f"PERMISSION {data.get('permission', None)}")
@@ -144,3 +145,20 @@ class StaffUserCreateSchema(BaseSchema):
         if permission_enum:
             data["permission"] = permission_enum.name
         return data
+
+
+class StaffUserGroupUpdateSchema(AutoSchemaBase):  # pylint: disable=too-many-ancestors
+    """Schema of a group update delivered to EPIC.Authorize."""
+
+    class Meta(AutoSchemaBase.Meta):  # pylint: disable=too-few-public-methods
+        """Meta."""
+
+        unknown = EXCLUDE
+        model = StaffUserGroupUpdate
+        exclude = ("is_active", "is_deleted")
+
+    status = EnumField(
+        GroupUpdateStatusEnum,
+        metadata={"description": "The delivery status of the group update."},
+        dump_only=True,
+    )
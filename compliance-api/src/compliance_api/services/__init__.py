@@ -22,4 +22,5 @@ from .project import ProjectService
 from .project_status import ProjectStatusService
 from .requirement_source import RequirementSourceService
 from .staff_user import StaffUserService
+from .staff_user_group_update import StaffUserGroupUpdateService
 from .topic import TopicService
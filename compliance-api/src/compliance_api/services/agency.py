@@ -3,6 +3,8 @@
 from compliance_api.exceptions import ResourceExistsError
 from compliance_api.models import db
 from compliance_api.models.agency import Agency as AgencyModel
+from compliance_api.models.list_query import ListQuery
+from compliance_api.models.pagination import PageRequest
 
 
 class AgencyService:
@@ -15,10 +17,9 @@ class AgencyService:
         return agency
 
     @classmethod
-    def get_all(cls):
-        """Get all agencies."""
-        users = AgencyModel.get_all(default_filters=False)
-        return users
+    def get_all(cls, list_query: ListQuery = None, page: PageRequest = None):
+        """Get all agencies matching the list query, or only the requested page."""
+        return AgencyModel.get_list(default_filters=False, list_query=list_query, page=page)
 
     @classmethod
     def create(cls, agency_data: dict, commit=True):
@@ -1,13 +1,31 @@
-"""Service to call epic.authorize endpoints."""
+"""Service to call epic.authorize endpoints.
 
-import requests
-from flask import current_app, g
+The user records and the user list of the app are kept in the node-local
+shared cache, so the staff user screens do not call epic.authorize on every
+request. The entries are dropped as soon as a group of a user is updated
+through this service; changes made in epic.authorize directly show up once
+the entries expire (AUTH_USER_CACHE_TTL).
+"""
+
+from flask import g
 
 from compliance_api.exceptions import BusinessError
+from compliance_api.services.http_client import OutboundClient
 from compliance_api.utils.constant import AUTH_APP
 from compliance_api.utils.enum import HttpMethod
+from compliance_api.utils.request_memo import forget, memoize
+from compliance_api.utils.shared_cache import SharedCache
+
+from .constant import API_PATH_PREFIX, BASE_URL_CONFIG, ENDPOINT_DEADLINES, UPSTREAM_NAME
+
 
-from .constant import API_REQUEST_TIMEOUT
+AUTH_CLIENT = OutboundClient(
+    UPSTREAM_NAME, BASE_URL_CONFIG, API_PATH_PREFIX, ENDPOINT_DEADLINES
+)
+USER_CACHE = SharedCache("authorize_user", "AUTH_USER_CACHE_TTL", "AUTH_USER_CACHE_STALE_TTL")
+APP_USERS_CACHE = SharedCache(
+    "authorize_app_users", "AUTH_USER_CACHE_TTL", "AUTH_USER_CACHE_STALE_TTL"
+)
 
 
 class AuthService:
@@ -15,64 +33,92 @@ class AuthService:
 
     @staticmethod
     def get_epic_user_by_guid(auth_user_guid: str):
-        """Return the user representation from epic.authorize."""
-        auth_user_response = _request_auth_service(f"users/{auth_user_guid}")
-        if auth_user_response.status_code != 200:
-            raise BusinessError(
-                f"Error finding user with ID {auth_user_guid} from auth server"
-            )
-        return auth_user_response.json()
+        """Return the user representation from epic.authorize, through the shared user cache."""
+        token = getattr(g, "access_token", None)
+        return memoize(
+            UPSTREAM_NAME,
+            "users",
+            auth_user_guid,
+            lambda: USER_CACHE.get_or_load(
+                auth_user_guid, lambda: _fetch_user(auth_user_guid, token)
+            ),
+        )
 
     @staticmethod
     def get_epic_users_by_app():
-        """Return the users belong to COMPLIANCE app in identity server."""
-        auth_users_response = _request_auth_service(f"users?app_name={AUTH_APP}")
-        if auth_users_response.status_code != 200:
-            raise BusinessError(f"Error fetching users for the app {AUTH_APP}")
-        return auth_users_response.json()
+        """Return the users belong to COMPLIANCE app in identity server, through the shared user cache."""
+        token = getattr(g, "access_token", None)
+        return memoize(
+            UPSTREAM_NAME,
+            "app_users",
+            AUTH_APP,
+            lambda: APP_USERS_CACHE.get_or_load(AUTH_APP, lambda: _fetch_app_users(token)),
+        )
 
     @staticmethod
-    def update_user_group(auth_user_guid: str, payload: dict):
-        """Update the group of the user in the identity server."""
-        update_group_response = _request_auth_service(
-            f"users/{auth_user_guid}/groups", HttpMethod.PUT, payload
-        )
+    def update_user_group(auth_user_guid: str, payload: dict, token: str = None):
+        """Update the group of the user in the identity server.
+
+        The token of the current request is used unless one is given. The cached
+        records of the user and the user list of the app are dropped whatever the
+        outcome, as the group may have changed even when the call failed.
+        """
+        try:
+            update_group_response = _request_auth_service(
+                f"users/{auth_user_guid}/groups", HttpMethod.PUT, payload, token
+            )
+        finally:
+            AuthService.invalidate_user(auth_user_guid)
         if update_group_response.status_code != 204:
             raise BusinessError(
                 f"Update group in the auth server failed for user : {auth_user_guid}"
             )
         return update_group_response
 
+    @staticmethod
+    def invalidate_user(auth_user_guid: str):
+        """Drop the cached record of the user and the cached user list of the app."""
+        forget(UPSTREAM_NAME, "users", auth_user_guid)
+        forget(UPSTREAM_NAME, "app_users")
+        USER_CACHE.invalidate(auth_user_guid)
+        APP_USERS_CACHE.invalidate(AUTH_APP)
+
+
+def _fetch_user(auth_user_guid: str, token: str):
+    """Fetch the user from epic.authorize."""
+    auth_user_response = _request_auth_service(f"users/{auth_user_guid}", token=token)
+    if auth_user_response.status_code != 200:
+        raise BusinessError(
+            f"Error finding user with ID {auth_user_guid} from auth server"
+        )
+    return auth_user_response.json()
+
+
+def _fetch_app_users(token: str):
+    """Fetch the users of the app from epic.authorize."""
+    auth_users_response = _request_auth_service(f"users?app_name={AUTH_APP}", token=token)
+    if auth_users_response.status_code != 200:
+        raise BusinessError(f"Error fetching users for the app {AUTH_APP}")
+    return auth_users_response.json()
+
 
 def _request_auth_service(
-    relative_url, http_method: HttpMethod = HttpMethod.GET, data=None
+    relative_url, http_method: HttpMethod = HttpMethod.GET, data=None, token=None
 ):
-    """REST Api call to authorize service."""
-    token = getattr(g, "access_token", None)
+    """REST Api call to authorize service.
+
+    The token of the current request is used unless one is given explicitly,
+    e.g. by a loader that revalidates the shared cache in the background.
+    """
+    token = token or getattr(g, "access_token", None)
     if not token:
         raise BusinessError("No access token found", 401)
-    auth_base_url = current_app.config["AUTH_BASE_URL"]
     headers = {
         "Content-Type": "application/json",
         "Authorization": f"Bearer {token}",
         "App-Id": AUTH_APP,
     }
 
-    url = f"{auth_base_url}/api/{relative_url}"
-
-    if http_method == HttpMethod.GET:
-        response = requests.get(url, headers=headers, timeout=API_REQUEST_TIMEOUT)
-    elif http_method == HttpMethod.PUT:
-        response = requests.put(
-            url, headers=headers, json=data, timeout=API_REQUEST_TIMEOUT
-        )
-    elif http_method == HttpMethod.PATCH:
-        response = requests.patch(
-            url, headers=headers, json=data, timeout=API_REQUEST_TIMEOUT
-        )
-    elif http_method == HttpMethod.DELETE:
-        response = requests.delete(url, headers=headers, timeout=API_REQUEST_TIMEOUT)
-    else:
-        raise ValueError("Invalid HTTP method")
+    response = AUTH_CLIENT.request(relative_url, http_method, headers, data)
     response.raise_for_status()
     return response
@@ -1,3 +1,9 @@
 """Constant used for authorize service."""
 
-API_REQUEST_TIMEOUT = 60
+UPSTREAM_NAME = "epic_authorize"
+BASE_URL_CONFIG = "AUTH_BASE_URL"
+API_PATH_PREFIX = "api"
+# Deadline budget in seconds of the endpoints that may take longer than OUTBOUND_DEADLINE.
+ENDPOINT_DEADLINES = {
+    "users": 20,
+}
@@ -8,6 +8,10 @@ from compliance_api.models import CaseFileInitiationOption as CaseFileInitiation
 from compliance_api.models import CaseFileOfficer as CaseFileOfficerModel
 from compliance_api.models import CaseFileStatusEnum
 from compliance_api.models.db import session_scope
+from compliance_api.models.list_query import ListQuery
+from compliance_api.models.pagination import PageRequest
+from compliance_api.utils import authorization_cache
+from compliance_api.utils.enum import ContextEnum
 
 
 class CaseFileService:
@@ -19,9 +23,26 @@ class CaseFileService:
         return CaseFileInitiationOptionModel.get_all(sort_by="sort_order")
 
     @classmethod
-    def get_all(cls):
-        """Return all the case files."""
-        return CaseFileModel.get_all(default_filters=False)
+    def get_all(
+        cls,
+        officer_id: int = None,
+        auth_user_guid: str = None,
+        list_query: ListQuery = None,
+        page: PageRequest = None,
+        stream: bool = False,
+    ):  # pylint: disable=too-many-arguments
+        """Return all the case files matching the list query.
+
+        With officer_id or auth_user_guid, only the case files assigned to the officer are returned.
+        With page, only the requested page is returned; with stream, an iterator over the rows.
+        """
+        return CaseFileModel.get_list(
+            default_filters=False,
+            filters=CaseFileModel.assigned_to(officer_id, auth_user_guid),
+            list_query=list_query,
+            page=page,
+            stream=stream,
+        )
 
     @classmethod
     def get_by_id(cls, case_file_id: int):
@@ -59,6 +80,8 @@ class CaseFileService:
             cls.insert_or_update_officers(
                 case_file_id, case_file_data.get("officer_ids", []), session
             )
+        # The primary officer may have changed; drop the decisions read before the commit.
+        authorization_cache.invalidate(ContextEnum.CASE_FILE, case_file_id)
         return updated_case_file
 
     @classmethod
@@ -92,30 +115,36 @@ class CaseFileService:
                 CaseFileOfficerModel.bulk_insert(
                     case_file_id, list(officer_ids_to_be_added), session
                 )
+            authorization_cache.invalidate(ContextEnum.CASE_FILE, case_file_id)
 
     @classmethod
-    def get_by_project(cls, project_id: int):
-        """Return case files based on project id."""
-        case_files = CaseFileModel.get_by_project(project_id)
-        return [
-            case_file
-            for case_file in case_files
-            if case_file.case_file_status == CaseFileStatusEnum.OPEN
-        ]
+    def get_by_project(
+        cls,
+        project_id: int,
+        officer_id: int = None,
+        auth_user_guid: str = None,
+        list_query: ListQuery = None,
+        page: PageRequest = None,
+        stream: bool = False,
+    ):  # pylint: disable=too-many-arguments
+        """Return the open case files based on project id matching the list query.
+
+        With officer_id or auth_user_guid, only the case files assigned to the officer are returned.
+        With page, only the requested page is returned; with stream, an iterator over the rows.
+        """
+        return CaseFileModel.get_list(
+            {"project_id": project_id, "case_file_status": CaseFileStatusEnum.OPEN},
+            default_filters=False,
+            filters=CaseFileModel.assigned_to(officer_id, auth_user_guid),
+            list_query=list_query,
+            page=page,
+            stream=stream,
+        )
 
     @classmethod
     def is_assigned_user(cls, case_file_id, auth_user_guid):
         """Check if the given user is an assigned user of the given case file."""
-        case_file = CaseFileModel.find_by_id(case_file_id)
-
-        if not case_file:
-            return False
-
-        # Check if the user is the primary officer or part of other officers
-        return case_file.primary_officer.auth_user_guid == auth_user_guid or any(
-            officer.officer.auth_user_guid == auth_user_guid
-            for officer in case_file.case_file_officers
-        )
+        return CaseFileModel.is_assigned_officer(case_file_id, auth_user_guid)
 
 
 def _create_case_file_object(case_file_data: dict):
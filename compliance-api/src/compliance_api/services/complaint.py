@@ -1,6 +1,7 @@
 """Service for managing complaint."""
 
 from compliance_api.exceptions import ResourceNotFoundError, UnprocessableEntityError
+from compliance_api.models import Project as ProjectModel
 from compliance_api.models.complaint import Complaint as ComplaintModel
 from compliance_api.models.complaint import ComplaintReqEACDetail as ComplaintReqEACDetailModel
 from compliance_api.models.complaint import ComplaintReqOrderDetail as ComplaintReqOrderDetailModel
@@ -12,8 +13,12 @@ from compliance_api.models.complaint import ComplaintSourceContact as ComplaintS
 from compliance_api.models.complaint import ComplaintStatusEnum
 from compliance_api.models.complaint import ComplaintUnapprovedProject as ComplaintUnapprovedProjectModel
 from compliance_api.models.db import session_scope
+from compliance_api.models.list_query import ListQuery
+from compliance_api.models.pagination import PageRequest, for_each_batch
 from compliance_api.services.case_file import CaseFileService
+from compliance_api.services.epic_track_service.first_nation_catalog import FIRST_NATION_CATALOG
 from compliance_api.services.epic_track_service.track_service import TrackService
+from compliance_api.services.project_enrichment import set_project_parameters
 from compliance_api.utils.constant import UNAPPROVED_PROJECT_CODE, UNAPPROVED_PROJECT_NAME
 
 
@@ -26,14 +31,53 @@ class ComplaintService:
         return ComplaintSourceModel.get_all(sort_by="sort_order")
 
     @classmethod
-    def get_all(cls):
-        """Get all complaints."""
-        return ComplaintModel.get_all(default_filters=False)
+    def get_all(
+        cls,
+        enrich_project=False,
+        officer_id: int = None,
+        auth_user_guid: str = None,
+        list_query: ListQuery = None,
+        page: PageRequest = None,
+        stream: bool = False,
+    ):  # pylint: disable=too-many-arguments
+        """Get all complaints matching the list query, with the project parameters set when enrich_project is set.
+
+        With officer_id or auth_user_guid, only the complaints assigned to the officer are returned.
+        With page, only the requested page is returned; with stream, an iterator enriching the rows in batches.
+        """
+        complaints = ComplaintModel.get_list(
+            default_filters=False,
+            filters=ComplaintModel.assigned_to(officer_id, auth_user_guid),
+            list_query=list_query,
+            page=page,
+            stream=stream,
+        )
+        return for_each_batch(complaints, lambda batch: _enrich_complaints(batch, enrich_project, list_query))
 
     @classmethod
-    def get_by_case_file_id(cls, case_file_id):
-        """Get all complaints by case file id."""
-        return ComplaintModel.get_by_params({"case_file_id": case_file_id})
+    def get_by_case_file_id(
+        cls,
+        case_file_id,
+        enrich_project=False,
+        officer_id: int = None,
+        auth_user_guid: str = None,
+        list_query: ListQuery = None,
+        page: PageRequest = None,
+        stream: bool = False,
+    ):  # pylint: disable=too-many-arguments
+        """Get all complaints by case file id matching the list query.
+
+        With officer_id or auth_user_guid, only the complaints assigned to the officer are returned.
+        With page, only the requested page is returned; with stream, an iterator enriching the rows in batches.
+        """
+        complaints = ComplaintModel.get_list(
+            {"case_file_id": case_file_id},
+            filters=ComplaintModel.assigned_to(officer_id, auth_user_guid),
+            list_query=list_query,
+            page=page,
+            stream=stream,
+        )
+        return for_each_batch(complaints, lambda batch: _enrich_complaints(batch, enrich_project, list_query))
 
     @classmethod
     def create(cls, complaint_data: dict):
@@ -69,11 +113,33 @@ class ComplaintService:
     @classmethod
     def is_assigned_user(cls, complaint_id, auth_user_guid):
         """Check if the given user is an assigned user of the given complaint."""
-        complaint = ComplaintModel.find_by_id(complaint_id)
+        return ComplaintModel.is_assigned_officer(complaint_id, auth_user_guid)
 
-        if not complaint:
-            return False
-        return complaint.primary_officer.auth_user_guid == auth_user_guid
+
+def _enrich_complaints(complaints, enrich_project, list_query: ListQuery = None):
+    """Set the source first nations, unless left out of the fields, and the project parameters if asked to."""
+    if enrich_project:
+        set_project_parameters(
+            complaints, ComplaintUnapprovedProjectModel.get_by_complaint_ids
+        )
+    if list_query and not list_query.includes("source_first_nation"):
+        return complaints
+    return _set_source_first_nations(complaints)
+
+
+def _set_source_first_nations(complaints):
+    """Set the source first nation of the complaints from the epic.track nation catalog."""
+    nations = FIRST_NATION_CATALOG.resolve(
+        complaint.source_first_nation_id for complaint in complaints
+    )
+    for complaint in complaints:
+        if complaint.source_first_nation_id is not None:
+            setattr(
+                complaint,
+                "source_first_nation",
+                nations[complaint.source_first_nation_id],
+            )
+    return complaints
 
 
 def _has_project(complaint_data):
@@ -190,6 +256,9 @@ def _get_project_abbreviation(
 ):  # pylint: disable=inconsistent-return-statements
     """Return the project abbreviation."""
     if project_id:
+        project = ProjectModel.find_by_id(project_id)
+        if project and project.is_synced:
+            return project.abbreviation
         project = TrackService.get_project_by_id(project_id)
         return project.get("abbreviation")
     return UNAPPROVED_PROJECT_CODE
@@ -1,3 +1,10 @@
 """Constant for track service."""
 
-API_REQUEST_TIMEOUT = 60
+UPSTREAM_NAME = "epic_track"
+BASE_URL_CONFIG = "EPIC_TRACK_URL"
+API_PATH_PREFIX = "api/v1"
+# Deadline budget in seconds of the endpoints that may take longer than OUTBOUND_DEADLINE.
+ENDPOINT_DEADLINES = {
+    "projects": 30,
+    "indigenous-nations": 20,
+}
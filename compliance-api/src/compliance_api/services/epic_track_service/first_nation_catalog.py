@@ -0,0 +1,153 @@
+"""Cached catalog of the indigenous nations held in EPIC.Track.
+
+The nation list is small and rarely changes, so instead of asking EPIC.Track
+for every nation that is displayed, the whole list is fetched once per worker
+and kept for FIRST_NATION_CACHE_TTL seconds. Once the catalog is older than
+FIRST_NATION_CACHE_REFRESH_AGE it keeps being served while a background thread
+reloads it, so requests only wait on EPIC.Track when the catalog is cold or
+expired.
+"""
+
+import threading
+import time
+from functools import partial
+
+from flask import current_app, g
+
+from compliance_api.exceptions import UpstreamUnavailableError
+from compliance_api.utils import metrics
+from compliance_api.utils.fan_out import fan_out
+
+from .track_service import TrackService
+
+
+class FirstNationCatalog:
+    """Per-process catalog of EPIC.Track indigenous nations."""
+
+    def __init__(self):
+        """Create an empty catalog."""
+        self._nations = {}
+        self._loaded_at = None
+        self._refreshing = False
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+
+    def resolve(self, first_nation_ids) -> dict:
+        """Return the nations for the given ids keyed by id.
+
+        All the ids are resolved against the same catalog snapshot. Ids that are
+        not in the catalog (nations added after the last load) are fetched
+        concurrently and added to it.
+        """
+        ids = {
+            int(first_nation_id)
+            for first_nation_id in first_nation_ids
+            if first_nation_id is not None
+        }
+        if not ids:
+            return {}
+        nations = self._get_nations()
+        result = {
+            first_nation_id: nations[first_nation_id]
+            for first_nation_id in ids
+            if first_nation_id in nations
+        }
+        metrics.count_cache("first_nations", "hit", len(result))
+        metrics.count_cache("first_nations", "miss", len(ids) - len(result))
+        missing = fan_out(
+            {
+                first_nation_id: partial(TrackService.get_first_nation_by_id, first_nation_id)
+                for first_nation_id in ids - result.keys()
+            }
+        )
+        for first_nation_id, nation in missing.items():
+            result[first_nation_id] = self._add(nation)
+        return result
+
+    def get(self, first_nation_id: int) -> dict:
+        """Return a single nation."""
+        return self.resolve([first_nation_id]).get(int(first_nation_id))
+
+    def invalidate(self):
+        """Drop the catalog so that the next lookup reloads it."""
+        with self._lock:
+            self._nations = {}
+            self._loaded_at = None
+
+    def _get_nations(self) -> dict:
+        """Return the catalog, loading or refreshing it as needed."""
+        config = current_app.config
+        with self._lock:
+            nations, loaded_at = self._nations, self._loaded_at
+        age = None if loaded_at is None else time.monotonic() - loaded_at
+        if age is None or age >= config["FIRST_NATION_CACHE_TTL"]:
+            try:
+                return self._load(max_age=config["FIRST_NATION_CACHE_TTL"])
+            except UpstreamUnavailableError:
+                if not nations:
+                    raise
+                current_app.logger.warning(
+                    "Serving the expired first nation catalog as EPIC.Track is unavailable"
+                )
+                return nations
+        if age >= config["FIRST_NATION_CACHE_REFRESH_AGE"]:
+            self._refresh_in_background()
+        return nations
+
+    def _load(self, token: str = None, max_age: int = None) -> dict:
+        """Fetch the nation list from EPIC.Track and replace the catalog.
+
+        Only one thread loads at a time; a thread that waited for another
+        thread's load uses its result when it is younger than max_age.
+        """
+        with self._load_lock:
+            if max_age is not None:
+                with self._lock:
+                    if (
+                        self._loaded_at is not None
+                        and time.monotonic() - self._loaded_at < max_age
+                    ):
+                        return self._nations
+            nations = {
+                nation["id"]: {"id": nation["id"], "name": nation.get("name")}
+                for nation in TrackService.get_first_nations(token)
+            }
+            with self._lock:
+                self._nations = nations
+                self._loaded_at = time.monotonic()
+            return nations
+
+    def _add(self, nation: dict) -> dict:
+        """Add a single nation to the catalog."""
+        entry = {"id": nation.get("id"), "name": nation.get("name")}
+        with self._lock:
+            self._nations = {**self._nations, entry["id"]: entry}
+        return entry
+
+    def _refresh_in_background(self):
+        """Reload the catalog in a background thread unless one is running."""
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+        app = current_app._get_current_object()  # pylint: disable=protected-access
+        token = getattr(g, "access_token", None)
+        threading.Thread(
+            target=self._refresh, args=(app, token), daemon=True
+        ).start()
+
+    def _refresh(self, app, token):
+        """Reload the catalog within the app context, keeping the old one on failure."""
+        with app.app_context():
+            try:
+                self._load(token)
+            except Exception as err:  # noqa: B902 pylint: disable=broad-except
+                current_app.logger.error(
+                    f"Refreshing the first nation catalog failed: {err}"
+                )
+            finally:
+                with self._lock:
+                    self._refreshing = False
+
+
+FIRST_NATION_CATALOG = FirstNationCatalog()
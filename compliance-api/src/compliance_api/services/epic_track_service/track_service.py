@@ -1,12 +1,22 @@
 """Class to manage epictrack services."""
 
-import requests
-from flask import current_app, g
+from http import HTTPStatus
+
+from flask import g
 
 from compliance_api.exceptions import BusinessError
+from compliance_api.services.http_client import OutboundClient
 from compliance_api.utils.enum import HttpMethod
+from compliance_api.utils.request_memo import forget, memoize
+from compliance_api.utils.shared_cache import SharedCache
+
+from .constant import API_PATH_PREFIX, BASE_URL_CONFIG, ENDPOINT_DEADLINES, UPSTREAM_NAME
 
-from .constant import API_REQUEST_TIMEOUT
+
+TRACK_CLIENT = OutboundClient(
+    UPSTREAM_NAME, BASE_URL_CONFIG, API_PATH_PREFIX, ENDPOINT_DEADLINES
+)
+PROJECT_CACHE = SharedCache("track_project", "PROJECT_CACHE_TTL", "PROJECT_CACHE_STALE_TTL")
 
 
 class TrackService:
@@ -14,43 +24,96 @@ class TrackService:
 
     @staticmethod
     def get_project_by_id(project_id: int):
-        """Return project details from track."""
-        project_response = _request_track_service(f"projects/{project_id}")
-        if project_response.status_code != 200:
+        """Return project details from track, through the shared project cache."""
+        token = getattr(g, "access_token", None)
+        return memoize(
+            UPSTREAM_NAME,
+            "projects",
+            project_id,
+            lambda: PROJECT_CACHE.get_or_load(
+                project_id, lambda: _fetch_project(project_id, token)
+            ),
+        )
+
+    @staticmethod
+    def get_projects(token: str = None):
+        """Return all the projects from track."""
+        projects_response = _request_track_service("projects", token=token)
+        if projects_response.status_code != 200:
             raise BusinessError(
-                f"Error finding project with ID {project_id} from EPIC.track server"
+                "Error fetching the projects from EPIC.track server",
+                HTTPStatus.BAD_GATEWAY,
             )
-        return project_response.json()
+        return projects_response.json()
+
+    @staticmethod
+    def invalidate_project(project_id: int):
+        """Drop the cached project details so that the next read goes to track."""
+        forget(UPSTREAM_NAME, "projects", project_id)
+        PROJECT_CACHE.invalidate(project_id)
 
     @staticmethod
     def get_first_nation_by_id(first_nation_id: int):
         """Return firstnation by id."""
-        first_nation_response = _request_track_service(f"indigenous-nations/{first_nation_id}")
-        if first_nation_response.status_code != 200:
+        return memoize(
+            UPSTREAM_NAME,
+            "indigenous-nations",
+            first_nation_id,
+            lambda: _fetch_first_nation(first_nation_id),
+        )
+
+    @staticmethod
+    def get_first_nations(token: str = None):
+        """Return all the first nations from track."""
+        first_nations_response = _request_track_service(
+            "indigenous-nations", token=token
+        )
+        if first_nations_response.status_code != 200:
             raise BusinessError(
-                f"Error finding the first nation with ID {first_nation_id} from EPIC.track server"
+                "Error fetching the first nations from EPIC.track server",
+                HTTPStatus.BAD_GATEWAY,
             )
-        return first_nation_response.json()
+        return first_nations_response.json()
+
+
+def _fetch_project(project_id: int, token: str):
+    """Fetch project details from track."""
+    project_response = _request_track_service(f"projects/{project_id}", token=token)
+    if project_response.status_code != 200:
+        raise BusinessError(
+            f"Error finding project with ID {project_id} from EPIC.track server"
+        )
+    return project_response.json()
+
+
+def _fetch_first_nation(first_nation_id: int):
+    """Fetch a first nation from track."""
+    first_nation_response = _request_track_service(f"indigenous-nations/{first_nation_id}")
+    if first_nation_response.status_code != 200:
+        raise BusinessError(
+            f"Error finding the first nation with ID {first_nation_id} from EPIC.track server"
+        )
+    return first_nation_response.json()
 
 
 def _request_track_service(
-    relative_url, http_method: HttpMethod = HttpMethod.GET, data=None
+    relative_url, http_method: HttpMethod = HttpMethod.GET, data=None, token=None
 ):
-    """REST Api call to track service."""
-    token = getattr(g, "access_token", None)
+    """REST Api call to track service.
+
+    The token of the current request is used unless one is given explicitly,
+    which is the case for calls made outside of a request.
+    """
+    token = token or getattr(g, "access_token", None)
     if not token:
         raise BusinessError("No access token found", 401)
-    auth_base_url = current_app.config["EPIC_TRACK_URL"]
     headers = {
         "Content-Type": "application/json",
         "Authorization": f"Bearer {token}",
     }
 
-    url = f"{auth_base_url}/api/v1/{relative_url}"
-
-    if http_method == HttpMethod.GET:
-        response = requests.get(url, headers=headers, timeout=API_REQUEST_TIMEOUT)
-    else:
+    if http_method != HttpMethod.GET:
         raise ValueError("Invalid HTTP method")
+    response = TRACK_CLIENT.request(relative_url, http_method, headers, data)
     response.raise_for_status()
     return response
@@ -0,0 +1,2 @@
+"""Shared outbound HTTP client used to talk to the upstream EPIC services."""
+from .client import OutboundClient, get_breaker_states, get_endpoint
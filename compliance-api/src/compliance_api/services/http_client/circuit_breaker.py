@@ -0,0 +1,93 @@
+"""Circuit breaker for the calls to an upstream service.
+
+The breaker opens after CIRCUIT_BREAKER_FAILURE_THRESHOLD consecutive failures
+(connection errors, timeouts and 5xx responses). While it is open, calls fail
+fast without touching the network. After CIRCUIT_BREAKER_RESET_TIMEOUT seconds
+a single trial call is let through (half open); its outcome closes or re-opens
+the breaker. The state is kept per worker process.
+"""
+
+import threading
+import time
+from datetime import datetime, timezone
+
+from flask import current_app
+
+
+class BreakerState:  # pylint: disable=too-few-public-methods
+    """States of the circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Circuit breaker of one upstream."""
+
+    def __init__(self, name: str):
+        """Create a closed breaker."""
+        self.name = name
+        self._state = BreakerState.CLOSED
+        self._failures = 0
+        self._opened_at = None
+        self._opened_on = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """Return the current state, moving from open to half open once the reset timeout passed."""
+        with self._lock:
+            return self._get_state()
+
+    def allow_request(self) -> bool:
+        """Return whether a call may be sent to the upstream."""
+        with self._lock:
+            state = self._get_state()
+            if state == BreakerState.CLOSED:
+                return True
+            if state == BreakerState.HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def record_success(self):
+        """Close the breaker after a successful call."""
+        with self._lock:
+            self._state = BreakerState.CLOSED
+            self._failures = 0
+            self._opened_at = None
+            self._opened_on = None
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        """Count a failed call, opening the breaker at the threshold or after a failed trial."""
+        with self._lock:
+            self._failures += 1
+            threshold = current_app.config["CIRCUIT_BREAKER_FAILURE_THRESHOLD"]
+            if self._state == BreakerState.HALF_OPEN or self._failures >= threshold:
+                self._state = BreakerState.OPEN
+                self._opened_at = time.monotonic()
+                self._opened_on = datetime.now(timezone.utc)
+            self._trial_in_flight = False
+
+    def snapshot(self) -> dict:
+        """Return the breaker state for the ops endpoint."""
+        with self._lock:
+            return {
+                "name": self.name,
+                "state": self._get_state(),
+                "consecutive_failures": self._failures,
+                "opened_at": self._opened_on.isoformat() if self._opened_on else None,
+            }
+
+    def _get_state(self) -> str:
+        """Return the state; the lock must be held."""
+        if (
+            self._state == BreakerState.OPEN
+            and time.monotonic() - self._opened_at
+            >= current_app.config["CIRCUIT_BREAKER_RESET_TIMEOUT"]
+        ):
+            self._state = BreakerState.HALF_OPEN
+        return self._state
@@ -0,0 +1,222 @@
+"""Pooled keep-alive HTTP client for the upstream EPIC services.
+
+Each upstream (EPIC.Track, EPIC.Authorize) gets an OutboundClient. The client
+owns a requests session whose adapter keeps a connection pool per host, so the
+TCP/TLS handshake is paid once per worker instead of once per call.
+
+Every call has a deadline budget, taken from the per-endpoint deadlines of the
+upstream or OUTBOUND_DEADLINE, that bounds the total time spent including
+retries. GET calls are retried on request errors (connection errors, timeouts,
+broken responses) and 502/503/504 with jittered exponential backoff. Failures feed the circuit breaker of the
+upstream; while it is open calls fail fast with UpstreamUnavailableError.
+Every attempt is recorded in the outbound metrics of the upstream endpoint.
+"""
+
+import os
+import random
+import re
+import threading
+import time
+
+import requests
+from flask import current_app
+from requests.adapters import HTTPAdapter
+
+from compliance_api.exceptions import UpstreamUnavailableError
+from compliance_api.utils import metrics
+from compliance_api.utils.enum import HttpMethod
+
+from .circuit_breaker import CircuitBreaker
+
+
+RETRYABLE_STATUS_CODES = (502, 503, 504)
+# Path segments that identify a resource: numeric ids and guids.
+_ID_SEGMENT = re.compile(r"^(\d+|[0-9a-fA-F-]{32,36})$")
+
+BREAKERS = {}
+
+
+# The upstream settings, its breaker and the per-process session state belong together.
+class OutboundClient:  # pylint: disable=too-many-instance-attributes
+    """HTTP client for one upstream service."""
+
+    def __init__(
+        self, name: str, base_url_config: str, path_prefix: str = "", deadlines: dict = None
+    ):
+        """Create the client.
+
+        Args:
+            name (str): Short name of the upstream, used for logging and the circuit breaker.
+            base_url_config (str): The app config key holding the upstream base url.
+            path_prefix (str): Path appended to the base url for every call.
+            deadlines (dict): Deadline budget in seconds by endpoint, e.g. {"projects": 30}.
+        """
+        self.name = name
+        self.base_url_config = base_url_config
+        self.path_prefix = path_prefix
+        self.deadlines = deadlines or {}
+        self.breaker = BREAKERS.setdefault(name, CircuitBreaker(name))
+        self._session = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    @property
+    def session(self) -> requests.Session:
+        """Return the keep-alive session of the current worker process.
+
+        The session is created lazily and re-created after a fork so that
+        gunicorn workers never share sockets inherited from the master.
+        """
+        pid = os.getpid()
+        if self._session is None or self._pid != pid:
+            with self._lock:
+                if self._session is None or self._pid != pid:
+                    self._session = _create_session()
+                    self._pid = pid
+        return self._session
+
+    @property
+    def base_url(self) -> str:
+        """Return the base url of the upstream including the path prefix."""
+        base_url = current_app.config[self.base_url_config]
+        if self.path_prefix:
+            return f"{base_url}/{self.path_prefix}"
+        return base_url
+
+    def request(
+        self,
+        relative_url: str,
+        http_method: HttpMethod = HttpMethod.GET,
+        headers: dict = None,
+        data=None,
+    ) -> requests.Response:
+        """Send the request through the pooled session within the deadline budget of the endpoint."""
+        if http_method not in (
+            HttpMethod.GET,
+            HttpMethod.PUT,
+            HttpMethod.PATCH,
+            HttpMethod.DELETE,
+        ):
+            raise ValueError("Invalid HTTP method")
+        config = current_app.config
+        url = f"{self.base_url}/{relative_url}"
+        endpoint = get_endpoint(relative_url)
+        deadline = time.monotonic() + self.deadlines.get(endpoint, config["OUTBOUND_DEADLINE"])
+        attempts = 1 + (config["OUTBOUND_MAX_RETRIES"] if http_method == HttpMethod.GET else 0)
+        response, error = None, None
+        for attempt in range(attempts):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            if not self.breaker.allow_request():
+                metrics.observe_outbound(self.name, endpoint, http_method.value, "circuit_open", 0)
+                break
+            response, error = self._send(http_method, url, endpoint, headers, data, remaining)
+            if error is None and response.status_code not in RETRYABLE_STATUS_CODES:
+                return response
+            backoff = random.uniform(0, config["OUTBOUND_RETRY_BACKOFF"] * 2**attempt)  # nosec
+            if attempt + 1 == attempts or time.monotonic() + backoff >= deadline:
+                break
+            time.sleep(backoff)
+        if response is not None and error is None:
+            return response
+        raise UpstreamUnavailableError(f"{self.name} is unavailable for {endpoint}") from error
+
+    def _send(
+        self, http_method, url, endpoint, headers, data, remaining
+    ):  # pylint: disable=too-many-arguments
+        """Send one attempt and record its outcome in the circuit breaker and the metrics.
+
+        Returns the response and the request error, if any. Any error, not only
+        connection errors and timeouts, counts as a failure of the upstream so
+        that a half-open trial always settles the breaker.
+        """
+        connect_timeout, read_timeout = _get_timeout()
+        started = time.perf_counter()
+        try:
+            response = self.session.request(
+                http_method.value,
+                url,
+                headers=headers,
+                json=data,
+                timeout=(min(connect_timeout, remaining), min(read_timeout, remaining)),
+            )
+        except requests.RequestException as err:
+            self.breaker.record_failure()
+            metrics.observe_outbound(
+                self.name,
+                endpoint,
+                http_method.value,
+                _get_error_outcome(err),
+                time.perf_counter() - started,
+            )
+            return None, err
+        except Exception:  # noqa: B902
+            self.breaker.record_failure()
+            raise
+        metrics.observe_outbound(
+            self.name,
+            endpoint,
+            http_method.value,
+            response.status_code,
+            time.perf_counter() - started,
+            sent_bytes=len(response.request.body or b"") if response.request else 0,
+            received_bytes=len(response.content or b""),
+        )
+        if response.status_code >= 500:
+            self.breaker.record_failure()
+        else:
+            self.breaker.record_success()
+        return response, None
+
+    def close(self):
+        """Close the pooled connections of this process."""
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+            self._session = None
+            self._pid = None
+
+
+def get_endpoint(relative_url: str) -> str:
+    """Return the endpoint of a relative url, with the query and the resource ids left out.
+
+    e.g. "projects/12" -> "projects/{id}", "users?app_name=x" -> "users".
+    """
+    path = relative_url.split("?", 1)[0].strip("/")
+    return "/".join(
+        "{id}" if _ID_SEGMENT.match(segment) else segment for segment in path.split("/")
+    )
+
+
+def get_breaker_states() -> list:
+    """Return the circuit breaker state of every upstream."""
+    return [breaker.snapshot() for breaker in BREAKERS.values()]
+
+
+def _create_session() -> requests.Session:
+    """Create a session with per-host connection pools sized from the config."""
+    config = current_app.config
+    adapter = HTTPAdapter(
+        pool_connections=config["OUTBOUND_POOL_CONNECTIONS"],
+        pool_maxsize=config["OUTBOUND_POOL_MAXSIZE"],
+    )
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def _get_error_outcome(err: requests.RequestException) -> str:
+    """Return the metrics outcome of a request error."""
+    if isinstance(err, requests.Timeout):
+        return "timeout"
+    if isinstance(err, requests.ConnectionError):
+        return "connection_error"
+    return "error"
+
+
+def _get_timeout():
+    """Return the (connect, read) timeout tuple."""
+    config = current_app.config
+    return (config["OUTBOUND_CONNECT_TIMEOUT"], config["OUTBOUND_READ_TIMEOUT"])
@@ -13,12 +13,23 @@ from compliance_api.models import InspectionType as InspectionTypeModel
 from compliance_api.models import InspectionTypeOption as InspectionTypeOptionModel
 from compliance_api.models import InspectionUnapprovedProject as InspectionUnapprovedProjectModel
 from compliance_api.models import IRStatusOption as IRStatusOptionModel
+from compliance_api.models import Project as ProjectModel
 from compliance_api.models.db import session_scope
 from compliance_api.models.inspection.inspection_enum import InspectionAttendanceOptionEnum, InspectionStatusEnum
+from compliance_api.models.list_query import ListQuery
+from compliance_api.models.pagination import PageRequest, for_each_batch
+from compliance_api.utils import authorization_cache
 from compliance_api.utils.constant import UNAPPROVED_PROJECT_CODE, UNAPPROVED_PROJECT_NAME
+from compliance_api.utils.enum import ContextEnum
 
 from .case_file import CaseFileService
 from .epic_track_service.track_service import TrackService
+from .inspection_attendance import load_attendance
+from .project_enrichment import set_project_parameters
+
+
+# The sections of the inspection profile, in the order they are returned.
+PROFILE_SECTIONS = ("inspection", "attendance", "types", "officers", "unapproved_project")
 
 
 class InspectionService:
@@ -45,14 +56,53 @@ class InspectionService:
         return IRStatusOptionModel.get_all(sort_by="sort_order")
 
     @classmethod
-    def get_all(cls):
-        """Get all inspections."""
-        return InspectionModel.get_all(default_filters=False)
+    def get_all(
+        cls,
+        enrich_project=False,
+        officer_id: int = None,
+        auth_user_guid: str = None,
+        list_query: ListQuery = None,
+        page: PageRequest = None,
+        stream: bool = False,
+    ):  # pylint: disable=too-many-arguments
+        """Get all inspections matching the list query, with the project parameters set when enrich_project is set.
+
+        With officer_id or auth_user_guid, only the inspections assigned to the officer are returned.
+        With page, only the requested page is returned; with stream, an iterator enriching the rows in batches.
+        """
+        inspections = InspectionModel.get_list(
+            default_filters=False,
+            filters=InspectionModel.assigned_to(officer_id, auth_user_guid),
+            list_query=list_query,
+            page=page,
+            stream=stream,
+        )
+        return for_each_batch(inspections, lambda batch: _enrich_inspections(batch, enrich_project))
 
     @classmethod
-    def get_by_case_file_id(cls, case_file_id):
-        """Get all inspections by case file id."""
-        return InspectionModel.get_by_params({"case_file_id": case_file_id})
+    def get_by_case_file_id(
+        cls,
+        case_file_id,
+        enrich_project=False,
+        officer_id: int = None,
+        auth_user_guid: str = None,
+        list_query: ListQuery = None,
+        page: PageRequest = None,
+        stream: bool = False,
+    ):  # pylint: disable=too-many-arguments
+        """Get all inspections by case file id matching the list query.
+
+        With officer_id or auth_user_guid, only the inspections assigned to the officer are returned.
+        With page, only the requested page is returned; with stream, an iterator enriching the rows in batches.
+        """
+        inspections = InspectionModel.get_list(
+            {"case_file_id": case_file_id},
+            filters=InspectionModel.assigned_to(officer_id, auth_user_guid),
+            list_query=list_query,
+            page=page,
+            stream=stream,
+        )
+        return for_each_batch(inspections, lambda batch: _enrich_inspections(batch, enrich_project))
 
     @classmethod
     def get_by_id(cls, inspection_id):
@@ -64,6 +114,39 @@ class InspectionService:
             )
         return _set_inspection_project_parameters(inspection)
 
+    @classmethod
+    def get_profile(cls, inspection_id, sections) -> dict:
+        """Return the sections of the profile of the inspection, each entity being loaded once.
+
+        sections is a subset of PROFILE_SECTIONS. The unapproved project info serves both
+        the project parameters of the inspection and its own section; the officers serve
+        both the officers section and the attending officers of the attendance.
+        """
+        inspection = InspectionModel.find_by_id(inspection_id)
+        if not inspection:
+            raise ResourceNotFoundError(
+                f"No inspection found for the given ID : {inspection_id}"
+            )
+        unapproved_projects = {}
+        if not inspection.project_id and {"inspection", "unapproved_project"} & set(sections):
+            unapproved_projects = InspectionUnapprovedProjectModel.get_by_inspection_ids([inspection_id])
+        officers = None
+        if "officers" in sections:
+            officers = InspectionOfficerModel.get_all_by_inspection_ids([inspection_id])
+        profile = {}
+        if "inspection" in sections:
+            set_project_parameters([inspection], lambda inspection_ids: unapproved_projects)
+            profile["inspection"] = inspection
+        if "attendance" in sections:
+            profile["attendance"] = load_attendance([inspection_id], officers=officers)[inspection_id]
+        if "types" in sections:
+            profile["types"] = [inspection_type.type for inspection_type in inspection.types]
+        if "officers" in sections:
+            profile["officers"] = [officer.officer for officer in officers[inspection_id]]
+        if "unapproved_project" in sections:
+            profile["unapproved_project"] = unapproved_projects.get(inspection_id)
+        return profile
+
     @classmethod
     def get_by_ir_number(cls, ir_number):
         """Return inspection by ir number."""
@@ -79,63 +162,13 @@ class InspectionService:
     @classmethod
     def get_attendance_options(cls, inspection_id):
         """Return attendances by inspection."""
-        attendance_options = InspectionAttendanceModel.get_all_by_inspection(
-            inspection_id
-        )
-        if attendance_options:
-            other_attendances = InspectionOtherAttendanceModel.get_by_inspection(
-                inspection_id
-            )
-            for option in attendance_options:
-                setattr(option, "data", [])
-                data = ""
-                if (
-                    option.attendance_option_id
-                    == InspectionAttendanceOptionEnum.AGENCIES.value
-                ):
-                    agencies = InspectionAgencyModel.get_all_by_inspection(
-                        inspection_id
-                    )
-                    data = [
-                        {"id": agency.agency_id, "name": agency.agency.name}
-                        for agency in agencies
-                    ]
-                if (
-                    option.attendance_option_id
-                    == InspectionAttendanceOptionEnum.ATTENDING_OFFICERS.value
-                ):
-                    officers = InspectionOfficerModel.get_all_by_inspection(
-                        inspection_id
-                    )
-                    data = [
-                        {
-                            "id": officer.officer.id,
-                            "name": f"{officer.officer.first_name} {officer.officer.last_name}",
-                        }
-                        for officer in officers
-                    ]
-                if (
-                    option.attendance_option_id
-                    == InspectionAttendanceOptionEnum.FIRSTNATIONS.value
-                ):
-                    first_nations = InspectionFirstnationModel.get_all_by_inspection(
-                        inspection_id
-                    )
-                    data = _set_first_nation_names(first_nations)
-                if (
-                    option.attendance_option_id
-                    == InspectionAttendanceOptionEnum.MUNICIPAL.value
-                ):
-                    if other_attendances:
-                        data = other_attendances.municipal
-                if (
-                    option.attendance_option_id
-                    == InspectionAttendanceOptionEnum.OTHER.value
-                ):
-                    if other_attendances:
-                        data = other_attendances.other
-                setattr(option, "data", data)
-        return attendance_options
+        return load_attendance([inspection_id])[inspection_id]
+
+    @classmethod
+    def get_attendance_options_by_case_file(cls, case_file_id):
+        """Return the attendances of all the inspections of the case file, by inspection then option."""
+        attendances = load_attendance(InspectionModel.get_ids_by_case_file(case_file_id))
+        return [attendance for entries in attendances.values() for attendance in entries]
 
     @classmethod
     def create(cls, inspection_data: dict):
@@ -255,50 +288,34 @@ class InspectionService:
                 "firstnation_id",
                 session,
             )
+        # The primary officer may have changed; drop the decisions read before the commit.
+        authorization_cache.invalidate(ContextEnum.INSPECTION, inspection_id)
         return updated_case_file
 
     @classmethod
     def is_assigned_user(cls, inspection_id, auth_user_guid):
         """Check if the given user is an assigned user of the given inspection."""
-        inspection = InspectionModel.find_by_id(inspection_id)
+        return InspectionModel.is_assigned_officer(inspection_id, auth_user_guid)
 
-        if not inspection:
-            return False
 
-        # Check if the user is the primary officer or part of other officers
-        return inspection.primary_officer.auth_user_guid == auth_user_guid or any(
-            officer.officer.auth_user_guid == auth_user_guid
-            for officer in inspection.other_officers
+def _enrich_inspections(inspections, enrich_project):
+    """Set the project parameters of the inspections in bulk if asked to."""
+    if enrich_project:
+        set_project_parameters(
+            inspections, InspectionUnapprovedProjectModel.get_by_inspection_ids
         )
+    return inspections
 
 
 def _set_inspection_project_parameters(inspection):
     """Set inspection project parameters."""
-    project_id = inspection.project_id
-    if project_id:
-        project = TrackService.get_project_by_id(project_id)
-        setattr(inspection, "authorization", project.get("ea_certificate", None))
-        setattr(inspection, "type", project.get("type").get("name"))
-        setattr(inspection, "sub_type", project.get("sub_type").get("name"))
-        setattr(inspection, "regulated_party", project.get("proponent").get("name"))
-    if not project_id:
-        project = InspectionUnapprovedProjectModel.get_by_inspection_id(inspection.id)
-        setattr(inspection, "authorization", project.authorization)
-        setattr(inspection, "type", project.type)
-        setattr(inspection, "sub_type", project.sub_type)
-        setattr(inspection, "regulated_party", project.regulated_party)
+    if inspection:
+        set_project_parameters(
+            [inspection], InspectionUnapprovedProjectModel.get_by_inspection_ids
+        )
     return inspection
 
 
-def _set_first_nation_names(first_nation_list: list):
-    """Set the name of the first nations from epic.track."""
-    result = []
-    for first_nation in first_nation_list:
-        response = TrackService.get_first_nation_by_id(first_nation.firstnation_id)
-        result.append({"id": response.get("id"), "name": response.get("name")})
-    return result
-
-
 # pylint: disable=too-many-arguments
 def _insert_or_update_inspection_relationship(
     inspection_id: int,
@@ -339,6 +356,9 @@ def _insert_or_update_inspection_relationship(
     if entity_ids_to_be_added:
         model_class.bulk_insert(inspection_id, list(entity_ids_to_be_added), session)
 
+    if model_class is InspectionOfficerModel:
+        authorization_cache.invalidate(ContextEnum.INSPECTION, inspection_id)
+
 
 def _create_unapproved_project_object(inspection_data: dict, inspection_id: int):
     """Create inspection unapproved project object."""
@@ -411,6 +431,9 @@ def _get_project_abbreviation(
 ):  # pylint: disable=inconsistent-return-statements
     """Return the project abbreviation."""
     if project_id:
+        project = ProjectModel.find_by_id(project_id)
+        if project and project.is_synced:
+            return project.abbreviation
         project = TrackService.get_project_by_id(project_id)
         return project.get("abbreviation")
     return UNAPPROVED_PROJECT_CODE
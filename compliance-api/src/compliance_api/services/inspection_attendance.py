@@ -0,0 +1,117 @@
+"""Loader of the attendance of the inspections.
+
+load_attendance reads the attendance of any number of inspections in a fixed
+number of queries, whatever the number of inspections and attendees: the
+chosen attendance options with their names, then, only for the options chosen
+by at least one inspection, the agencies, officers, first nations and other
+attendance of all the inspections at once, each joined to its names. The names
+of the first nations are resolved from the epic.track catalog in a single call
+while the database is read.
+
+Each attendance option of an inspection is returned as an AttendanceEntry
+carrying its attendees as plain data, ready to be dumped with the inspection
+attendance schema.
+"""
+
+from compliance_api.models import InspectionAgency as InspectionAgencyModel
+from compliance_api.models import InspectionAttendance as InspectionAttendanceModel
+from compliance_api.models import InspectionFirstnation as InspectionFirstnationModel
+from compliance_api.models import InspectionOfficer as InspectionOfficerModel
+from compliance_api.models import InspectionOtherAttendance as InspectionOtherAttendanceModel
+from compliance_api.models.inspection.inspection_enum import InspectionAttendanceOptionEnum
+from compliance_api.utils import fan_out
+
+from .epic_track_service.first_nation_catalog import FIRST_NATION_CATALOG
+
+
+class AttendanceEntry:  # pylint: disable=too-few-public-methods
+    """An attendance option chosen for an inspection and the attendees under it."""
+
+    __slots__ = ("id", "inspection_id", "attendance_option_id", "attendance_option", "is_active", "data")
+
+    def __init__(self, attendance: InspectionAttendanceModel, data):
+        """Create the entry of the attendance mapping, with the attendees in data."""
+        self.id = attendance.id
+        self.inspection_id = attendance.inspection_id
+        self.attendance_option_id = attendance.attendance_option_id
+        self.attendance_option = attendance.attendance_option
+        self.is_active = attendance.is_active
+        self.data = data
+
+
+def load_attendance(inspection_ids, officers: dict = None) -> dict:
+    """Return the attendance entries of the inspections keyed by inspection id, every inspection being a key.
+
+    officers, the inspection officers keyed by inspection id, is read instead of
+    querying them again when the caller already loaded them.
+    """
+    inspection_ids = list(dict.fromkeys(inspection_ids))
+    attendances = InspectionAttendanceModel.get_all_by_inspection_ids(inspection_ids)
+    chosen = {}
+    for rows in attendances.values():
+        for attendance in rows:
+            chosen.setdefault(attendance.attendance_option_id, []).append(attendance.inspection_id)
+
+    first_nation_names = None
+    if InspectionAttendanceOptionEnum.FIRSTNATIONS.value in chosen:
+        first_nations = InspectionFirstnationModel.get_all_by_inspection_ids(
+            chosen[InspectionAttendanceOptionEnum.FIRSTNATIONS.value]
+        )
+        # Resolve the names from epic.track while the rest is read from the database.
+        first_nation_names = fan_out.submit(
+            FIRST_NATION_CATALOG.resolve,
+            [row.firstnation_id for rows in first_nations.values() for row in rows],
+        )
+    agencies = InspectionAgencyModel.get_all_by_inspection_ids(
+        chosen.get(InspectionAttendanceOptionEnum.AGENCIES.value, [])
+    )
+    if officers is None:
+        officers = InspectionOfficerModel.get_all_by_inspection_ids(
+            chosen.get(InspectionAttendanceOptionEnum.ATTENDING_OFFICERS.value, [])
+        )
+    other_attendances = InspectionOtherAttendanceModel.get_by_inspection_ids(
+        list(
+            {
+                *chosen.get(InspectionAttendanceOptionEnum.MUNICIPAL.value, []),
+                *chosen.get(InspectionAttendanceOptionEnum.OTHER.value, []),
+            }
+        )
+    )
+    facets = {
+        InspectionAttendanceOptionEnum.AGENCIES.value: lambda inspection_id: [
+            {"id": agency.agency_id, "name": agency.agency.name} for agency in agencies[inspection_id]
+        ],
+        InspectionAttendanceOptionEnum.ATTENDING_OFFICERS.value: lambda inspection_id: [
+            {"id": officer.officer.id, "name": f"{officer.officer.first_name} {officer.officer.last_name}"}
+            for officer in officers[inspection_id]
+        ],
+        InspectionAttendanceOptionEnum.MUNICIPAL.value: lambda inspection_id: _other_attendance(
+            other_attendances, inspection_id, "municipal"
+        ),
+        InspectionAttendanceOptionEnum.OTHER.value: lambda inspection_id: _other_attendance(
+            other_attendances, inspection_id, "other"
+        ),
+    }
+    if first_nation_names is not None:
+        nations = fan_out.result(first_nation_names)
+        facets[InspectionAttendanceOptionEnum.FIRSTNATIONS.value] = lambda inspection_id: [
+            nations[row.firstnation_id] for row in first_nations[inspection_id]
+        ]
+    return {
+        inspection_id: [
+            AttendanceEntry(
+                attendance,
+                facets[attendance.attendance_option_id](inspection_id)
+                if attendance.attendance_option_id in facets
+                else "",
+            )
+            for attendance in rows
+        ]
+        for inspection_id, rows in attendances.items()
+    }
+
+
+def _other_attendance(other_attendances: dict, inspection_id: int, attribute: str):
+    """Return the municipal or other attendance of the inspection, empty when not recorded."""
+    other_attendance = other_attendances.get(inspection_id)
+    return getattr(other_attendance, attribute) if other_attendance else ""
@@ -0,0 +1,84 @@
+"""Set the project parameters of inspections and complaints in bulk.
+
+The authorization, type, sub_type and regulated_party of an entity come from
+its project. Projects mirrored from EPIC.Track are read from the joined
+project row; projects not synced yet are fetched from EPIC.Track concurrently,
+once per distinct project; entities without a project read their unapproved
+project info with a single IN query.
+"""
+
+from functools import partial
+
+from compliance_api.utils.fan_out import fan_out
+
+from .epic_track_service.track_service import TrackService
+
+
+# The fields set from the project.
+PROJECT_PARAMETER_FIELDS = ("authorization", "type", "sub_type", "regulated_party")
+
+
+def set_project_parameters(entities: list, get_unapproved_projects):
+    """Set the project parameters of the entities and return them.
+
+    Args:
+        entities (list): Inspections or complaints, with their project joined.
+        get_unapproved_projects: Returns the unapproved project info keyed by entity id
+            for a list of entity ids.
+    """
+    unsynced_project_ids = {
+        entity.project_id
+        for entity in entities
+        if entity.project_id and not entity.project.is_synced
+    }
+    track_projects = fan_out(
+        {
+            project_id: partial(TrackService.get_project_by_id, project_id)
+            for project_id in unsynced_project_ids
+        }
+    )
+    unapproved_projects = get_unapproved_projects(
+        [entity.id for entity in entities if not entity.project_id]
+    )
+    for entity in entities:
+        if entity.project_id in track_projects:
+            _set_from_track_project(entity, track_projects[entity.project_id])
+        elif entity.project_id:
+            _set_parameters(
+                entity,
+                entity.project.ea_certificate,
+                entity.project.type,
+                entity.project.sub_type,
+                entity.project.proponent,
+            )
+        elif entity.id in unapproved_projects:
+            project = unapproved_projects[entity.id]
+            _set_parameters(
+                entity,
+                project.authorization,
+                project.type,
+                project.sub_type,
+                project.regulated_party,
+            )
+    return entities
+
+
+def _set_from_track_project(entity, project: dict):
+    """Set the parameters from an EPIC.Track project representation."""
+    _set_parameters(
+        entity,
+        project.get("ea_certificate", None),
+        (project.get("type") or {}).get("name"),
+        (project.get("sub_type") or {}).get("name"),
+        (project.get("proponent") or {}).get("name"),
+    )
+
+
+def _set_parameters(
+    entity, authorization, project_type, sub_type, regulated_party
+):  # pylint: disable=too-many-arguments
+    """Set the project parameters of the entity."""
+    setattr(entity, "authorization", authorization)
+    setattr(entity, "type", project_type)
+    setattr(entity, "sub_type", sub_type)
+    setattr(entity, "regulated_party", regulated_party)
@@ -0,0 +1,158 @@
+"""Service to mirror the EPIC.Track projects into the local projects table.
+
+The projects table is read-only for the application, so the sync writes it with
+core insert/update statements. Every synced row keeps a hash of the mirrored
+fields; a run only writes the projects that are new or whose hash changed, and
+drops those projects from the shared project cache.
+
+A run first takes the sync lock, then skips when another worker synced within
+PROJECT_SYNC_INTERVAL, so only one worker per interval downloads the projects
+from EPIC.Track whatever the timers of the workers.
+"""
+
+import hashlib
+import json
+import random
+import threading
+import time
+from datetime import datetime, timedelta
+
+from flask import current_app
+from sqlalchemy import func, insert, select, update
+
+from compliance_api.models import Project as ProjectModel
+from compliance_api.models import ProjectSyncState as ProjectSyncStateModel
+from compliance_api.models.db import session_scope
+
+from .epic_track_service.track_service import TrackService
+from .service_account import ServiceAccountService
+
+
+# Postgres advisory lock key, so that only one worker syncs at a time.
+PROJECT_SYNC_LOCK_KEY = 4_301_001
+SYNC_STATE_ID = 1
+SYNC_USER = "system"
+MIRRORED_FIELDS = ("name", "abbreviation", "ea_certificate", "type", "sub_type", "proponent")
+
+
+class ProjectSyncService:
+    """Project sync service class."""
+
+    @classmethod
+    def sync(cls, token: str = None, force: bool = False) -> dict:
+        """Mirror the EPIC.Track projects and return the number of created/updated/unchanged rows.
+
+        The service account token is used unless one is given. The run is skipped
+        when another worker holds the sync lock or, unless forced, when the
+        projects were synced within PROJECT_SYNC_INTERVAL.
+        """
+        table = ProjectModel.__table__
+        state_table = ProjectSyncStateModel.__table__
+        result = {"created": 0, "updated": 0, "unchanged": 0, "skipped": False}
+        changed_ids = []
+        with session_scope() as session:
+            if not session.execute(
+                select(func.pg_try_advisory_xact_lock(PROJECT_SYNC_LOCK_KEY))
+            ).scalar():
+                result["skipped"] = True
+                return result
+            last_synced_at = session.execute(
+                select(state_table.c.last_synced_at).where(state_table.c.id == SYNC_STATE_ID)
+            ).scalar()
+            if not force and _is_recent(last_synced_at):
+                result["skipped"] = True
+                return result
+            token = token or ServiceAccountService.get_access_token()
+            track_projects = TrackService.get_projects(token)
+            local_hashes = dict(session.execute(select(table.c.id, table.c.sync_hash)).all())
+            now = datetime.utcnow()
+            for track_project in track_projects:
+                project_id = track_project["id"]
+                values = _get_mirrored_values(track_project)
+                values["sync_hash"] = _get_hash(values)
+                if project_id not in local_hashes:
+                    session.execute(
+                        insert(table).values(
+                            id=project_id, created_by=SYNC_USER, created_date=now, **values
+                        )
+                    )
+                    result["created"] += 1
+                elif local_hashes[project_id] != values["sync_hash"]:
+                    session.execute(
+                        update(table)
+                        .where(table.c.id == project_id)
+                        .values(updated_by=SYNC_USER, updated_date=now, **values)
+                    )
+                    changed_ids.append(project_id)
+                    result["updated"] += 1
+                else:
+                    result["unchanged"] += 1
+            _record_sync(session, last_synced_at, datetime.utcnow())
+        for project_id in changed_ids:
+            TrackService.invalidate_project(project_id)
+        current_app.logger.info(f"Project sync finished: {result}")
+        return result
+
+
+def start_project_sync_scheduler(app):
+    """Run the project sync every PROJECT_SYNC_INTERVAL seconds in a background thread."""
+    interval = app.config["PROJECT_SYNC_INTERVAL"]
+
+    def run():
+        while True:
+            # Jitter so that the workers do not all ask EPIC.Track at the same moment.
+            time.sleep(interval + random.uniform(0, interval / 10))  # nosec
+            with app.app_context():
+                try:
+                    ProjectSyncService.sync()
+                except Exception as err:  # noqa: B902 pylint: disable=broad-except
+                    current_app.logger.error(f"Project sync failed: {err}")
+
+    thread = threading.Thread(target=run, name="project-sync", daemon=True)
+    thread.start()
+    return thread
+
+
+def _is_recent(last_synced_at: datetime) -> bool:
+    """Return whether the last sync finished within the sync interval."""
+    interval = current_app.config["PROJECT_SYNC_INTERVAL"]
+    return bool(
+        interval
+        and last_synced_at
+        and datetime.utcnow() - last_synced_at < timedelta(seconds=interval)
+    )
+
+
+def _record_sync(session, last_synced_at: datetime, now: datetime):
+    """Store the time of the sync in the sync state row, creating it on the first sync."""
+    state_table = ProjectSyncStateModel.__table__
+    if last_synced_at is None:
+        session.execute(
+            insert(state_table).values(
+                id=SYNC_STATE_ID, last_synced_at=now, created_by=SYNC_USER, created_date=now
+            )
+        )
+    else:
+        session.execute(
+            update(state_table)
+            .where(state_table.c.id == SYNC_STATE_ID)
+            .values(last_synced_at=now, updated_by=SYNC_USER, updated_date=now)
+        )
+
+
+def _get_mirrored_values(track_project: dict) -> dict:
+    """Return the local column values of an EPIC.Track project."""
+    return {
+        "name": track_project.get("name"),
+        "abbreviation": track_project.get("abbreviation"),
+        "ea_certificate": track_project.get("ea_certificate"),
+        "type": (track_project.get("type") or {}).get("name"),
+        "sub_type": (track_project.get("sub_type") or {}).get("name"),
+        "proponent": (track_project.get("proponent") or {}).get("name"),
+    }
+
+
+def _get_hash(values: dict) -> str:
+    """Return the hash of the mirrored values."""
+    payload = json.dumps([values[field] for field in MIRRORED_FIELDS])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
@@ -0,0 +1,73 @@
+"""Service for the reference data lists loaded together by the web client.
+
+Each list is read as its own endpoint reads it. get_version returns, in a
+single query, the row count and the latest created and updated dates of every
+table behind the lists: it changes whenever a row is added, updated or deleted,
+so a snapshot of the lists only needs rebuilding when it does.
+"""
+
+from sqlalchemy import func, literal, select, union_all
+
+from compliance_api.models import Agency as AgencyModel
+from compliance_api.models import CaseFileInitiationOption as CaseFileInitiationOptionModel
+from compliance_api.models import ComplaintSource as ComplaintSourceModel
+from compliance_api.models import InspectionAttendanceOption as InspectionAttendanceOptionModel
+from compliance_api.models import InspectionInitiationOption as InspectionInitiationOptionModel
+from compliance_api.models import InspectionTypeOption as InspectionTypeOptionModel
+from compliance_api.models import IRStatusOption as IRStatusOptionModel
+from compliance_api.models import Position as PositionModel
+from compliance_api.models import ProjectStatusOption as ProjectStatusOptionModel
+from compliance_api.models import RequirementSource as RequirementSourceModel
+from compliance_api.models import Topic as TopicModel
+from compliance_api.models.db import db
+
+from .agency import AgencyService
+from .case_file import CaseFileService
+from .complaint import ComplaintService
+from .inspection import InspectionService
+from .position import PositionService
+from .project_status import ProjectStatusService
+from .requirement_source import RequirementSourceService
+from .topic import TopicService
+
+
+# The model behind each reference data list, and the service method reading the list.
+REFERENCE_DATA = {
+    "inspection_type_options": (InspectionTypeOptionModel, InspectionService.get_inspection_type_options),
+    "inspection_initiation_options": (InspectionInitiationOptionModel, InspectionService.get_initiation_options),
+    "ir_status_options": (IRStatusOptionModel, InspectionService.get_ir_status_options),
+    "attendance_options": (InspectionAttendanceOptionModel, InspectionService.get_all_attendance_options),
+    "project_status_options": (ProjectStatusOptionModel, ProjectStatusService.get_all_project_status_options),
+    "case_file_initiation_options": (CaseFileInitiationOptionModel, CaseFileService.get_initiation_options),
+    "complaint_sources": (ComplaintSourceModel, ComplaintService.get_complaint_sources),
+    "requirement_sources": (RequirementSourceModel, RequirementSourceService.get_requirement_sources),
+    "positions": (PositionModel, PositionService.get_all_positions),
+    "agencies": (AgencyModel, AgencyService.get_all),
+    "topics": (TopicModel, TopicService.get_all),
+}
+
+
+class ReferenceDataService:
+    """Reference data service."""
+
+    @classmethod
+    def get_all(cls) -> dict:
+        """Return the rows of every reference data list keyed by list name."""
+        return {name: get_rows() for name, (_, get_rows) in REFERENCE_DATA.items()}
+
+    @classmethod
+    def get_version(cls) -> tuple:
+        """Return the row count and latest created and updated dates of each reference data table."""
+        statement = union_all(
+            *(
+                select(
+                    literal(name).label("name"),
+                    func.count().label("row_count"),  # pylint: disable=not-callable
+                    func.max(model.created_date).label("created_date"),
+                    func.max(model.updated_date).label("updated_date"),
+                )
+                for name, (model, _) in REFERENCE_DATA.items()
+            )
+        )
+        rows = db.session.execute(statement).all()
+        return tuple(sorted(tuple(row) for row in rows))
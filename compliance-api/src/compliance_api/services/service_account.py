@@ -0,0 +1,51 @@
+"""Service account access token for calls made outside of a user request."""
+
+import threading
+import time
+from http import HTTPStatus
+
+from flask import current_app
+
+from compliance_api.exceptions import BusinessError
+
+from .http_client import OutboundClient
+
+
+KEYCLOAK_CLIENT = OutboundClient("keycloak", "KEYCLOAK_BASE_URL", "auth/realms")
+# Renew the token this many seconds before it expires.
+TOKEN_EXPIRY_MARGIN = 30
+
+_token_lock = threading.Lock()
+_token = {"access_token": None, "expires_at": 0}
+
+
+class ServiceAccountService:  # pylint: disable=too-few-public-methods
+    """Service account service class."""
+
+    @staticmethod
+    def get_access_token() -> str:
+        """Return an access token of the API service account, reusing it until it expires."""
+        with _token_lock:
+            if _token["access_token"] and time.monotonic() < _token["expires_at"]:
+                return _token["access_token"]
+            config = current_app.config
+            response = KEYCLOAK_CLIENT.session.post(
+                f"{KEYCLOAK_CLIENT.base_url}/{config['KEYCLOAK_REALMNAME']}/protocol/openid-connect/token",
+                data={
+                    "grant_type": "client_credentials",
+                    "client_id": config["KEYCLOAK_SERVICE_ACCOUNT_ID"],
+                    "client_secret": config["KEYCLOAK_SERVICE_ACCOUNT_SECRET"],
+                },
+                timeout=(config["OUTBOUND_CONNECT_TIMEOUT"], config["OUTBOUND_READ_TIMEOUT"]),
+            )
+            if response.status_code != HTTPStatus.OK:
+                raise BusinessError(
+                    "Error getting the service account token from keycloak",
+                    HTTPStatus.BAD_GATEWAY,
+                )
+            body = response.json()
+            _token["access_token"] = body["access_token"]
+            _token["expires_at"] = (
+                time.monotonic() + body.get("expires_in", 0) - TOKEN_EXPIRY_MARGIN
+            )
+            return _token["access_token"]
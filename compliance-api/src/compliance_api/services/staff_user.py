@@ -3,11 +3,15 @@
 from compliance_api.exceptions import ResourceExistsError, ResourceNotFoundError, UnprocessableEntityError
 from compliance_api.models import db
 from compliance_api.models.db import session_scope
+from compliance_api.models.list_query import ListQuery
+from compliance_api.models.pagination import PageRequest, page_items
 from compliance_api.models.staff_user import StaffUser as StaffUserModel
+from compliance_api.models.staff_user_group_update import StaffUserGroupUpdate as StaffUserGroupUpdateModel
 from compliance_api.utils.constant import AUTH_APP
 from compliance_api.utils.enum import PermissionEnum
 
 from .authorize_service.auth_service import AuthService
+from .staff_user_group_update import StaffUserGroupUpdateService
 
 
 class StaffUserService:
@@ -22,20 +26,15 @@ class StaffUserService:
             staff_user = _set_permission_level_in_compliance_user_obj(
                 staff_user, auth_user
             )
+            _set_pending_permissions([staff_user])
         return staff_user
 
     @classmethod
-    def get_all_staff_users(cls):
-        """Get all users."""
+    def get_all_staff_users(cls, list_query: ListQuery = None, page: PageRequest = None):
+        """Get all users matching the list query, or only the requested page."""
         # Get users from compliance database
-        users = StaffUserModel.get_all()
-        # Get compliance users from epic system
-        auth_users = AuthService.get_epic_users_by_app()
-        # Merge the two sets of users to set the permission in the result
-        index_auth_users = {user["username"]: user for user in auth_users}
-        for user in users:
-            auth_user = index_auth_users.get(user.auth_user_guid, None)
-            user = _set_permission_level_in_compliance_user_obj(user, auth_user)
+        users = StaffUserModel.get_list(list_query=list_query, page=page)
+        _set_permissions(page_items(users))
         return users
 
     @classmethod
@@ -49,13 +48,12 @@ class StaffUserService:
                 f"No user found from EPIC.Authorize corresponding to the given {auth_user_guid}"
             )
         user_obj = _create_staff_user_object(user_data, auth_user)
-        group_payload = {
-            "app_name": AUTH_APP,
-            "group_name": user_data.get("permission", None),
-        }
         with session_scope() as session:
             created_user = StaffUserModel.create_staff(user_obj, session)
-            AuthService.update_user_group(auth_user_guid, group_payload)
+            StaffUserGroupUpdateModel.add_pending(
+                auth_user_guid, AUTH_APP, user_data.get("permission", None), session
+            )
+        StaffUserGroupUpdateService.dispatch_in_background()
         return created_user
 
     @classmethod
@@ -71,16 +69,13 @@ class StaffUserService:
             raise UnprocessableEntityError(
                 f"No user found from EPIC.Authorize corresponding to the given {auth_user_guid}"
             )
-        group_payload = {
-            "app_name": AUTH_APP,
-            "group_name": user_data.get("permission", None),
-        }
         with session_scope() as session:
             permission = user_data.get("permission")
             user_data.pop("permission")
             updated_user = StaffUserModel.update_staff(user_id, user_data, session)
-            AuthService.update_user_group(auth_user_guid, group_payload)
+            StaffUserGroupUpdateModel.add_pending(auth_user_guid, AUTH_APP, permission, session)
             setattr(updated_user, "permission", permission)
+        StaffUserGroupUpdateService.dispatch_in_background()
         return updated_user
 
     @classmethod
@@ -134,6 +129,29 @@ def _set_permission_level_in_compliance_user_obj(
     return compliance_user
 
 
+def _set_permissions(users: list) -> list:
+    """Set the permission of the users from EPIC.Authorize and the pending group updates."""
+    # Get compliance users from epic system
+    auth_users = AuthService.get_epic_users_by_app()
+    # Merge the two sets of users to set the permission in the result
+    index_auth_users = {user["username"]: user for user in auth_users}
+    for user in users:
+        auth_user = index_auth_users.get(user.auth_user_guid, None)
+        user = _set_permission_level_in_compliance_user_obj(user, auth_user)
+    return _set_pending_permissions(users)
+
+
+def _set_pending_permissions(users: list) -> list:
+    """Set the permission of the users whose group update is not delivered to EPIC.Authorize yet."""
+    pending_groups = StaffUserGroupUpdateModel.get_pending_groups(
+        [user.auth_user_guid for user in users]
+    )
+    for user in users:
+        if user.auth_user_guid in pending_groups:
+            setattr(user, "permission", pending_groups[user.auth_user_guid])
+    return users
+
+
 def _validate_staff_user_existence(auth_user_guid: str, staff_user_id: int = None):
     """Check if the staff user exists."""
     existing_staff_user = StaffUserModel.get_by_auth_guid(auth_user_guid)
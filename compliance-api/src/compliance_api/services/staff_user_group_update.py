@@ -0,0 +1,176 @@
+"""Service to deliver the staff user group updates to EPIC.Authorize.
+
+The staff user service commits the staff user and a pending group update
+together, so no transaction waits on EPIC.Authorize. The updates are then
+delivered by the dispatcher: right after the commit in the background with the
+token of the request, and every AUTH_OUTBOX_DISPATCH_INTERVAL seconds by each
+worker with the service account token. A failed delivery is retried with
+exponential backoff until AUTH_OUTBOX_MAX_ATTEMPTS is reached.
+"""
+
+import random
+import threading
+import time
+from datetime import datetime, timedelta
+
+from flask import current_app, g
+from sqlalchemy import case, literal, or_, select, update
+
+from compliance_api.models import GroupUpdateStatusEnum
+from compliance_api.models import StaffUserGroupUpdate as StaffUserGroupUpdateModel
+from compliance_api.models.db import session_scope
+from compliance_api.utils import fan_out
+
+from .authorize_service.auth_service import AuthService
+from .service_account import ServiceAccountService
+
+
+DISPATCH_USER = "system"
+
+
+class StaffUserGroupUpdateService:
+    """Staff user group update service class."""
+
+    @classmethod
+    def get_group_updates(cls, status: str = None, auth_user_guid: str = None):
+        """Return the group updates, latest first."""
+        return StaffUserGroupUpdateModel.get_by_status(
+            GroupUpdateStatusEnum(status) if status else None, auth_user_guid
+        )
+
+    @classmethod
+    def dispatch(cls, token: str = None) -> dict:
+        """Deliver the pending group updates that are due and return the number delivered and failed.
+
+        Each update is claimed with a lease in a short transaction, delivered
+        outside of any transaction and its outcome recorded in a second one, so
+        no row lock or connection is held while EPIC.Authorize is called. The
+        workers never send the same update twice, an update of a user is not
+        claimed while an older one of the user is being delivered, and each
+        update is attempted at most once per run. The token of the current
+        request is used if any, else the service account token.
+        """
+        config = current_app.config
+        token = token or g.get("access_token") or ServiceAccountService.get_access_token()
+        table = StaffUserGroupUpdateModel.__table__
+        result = {"delivered": 0, "failed": 0}
+        attempted_ids = []
+        for _ in range(config["AUTH_OUTBOX_BATCH_SIZE"]):
+            with session_scope() as session:
+                group_update = _claim(session, attempted_ids)
+            if group_update is None:
+                break
+            attempted_ids.append(group_update.id)
+            values = _deliver(group_update, token)
+            with session_scope() as session:
+                # A newer update may have superseded this one while it was delivered.
+                session.execute(
+                    update(table)
+                    .where(table.c.id == group_update.id, table.c.lease_until == group_update.lease_until)
+                    .values(
+                        {
+                            **values,
+                            "status": case(
+                                (table.c.status == GroupUpdateStatusEnum.SUPERSEDED, table.c.status),
+                                else_=literal(values["status"], table.c.status.type),
+                            ),
+                        }
+                    )
+                )
+            result["delivered" if values["status"] == GroupUpdateStatusEnum.DELIVERED else "failed"] += 1
+        if any(result.values()):
+            current_app.logger.info(f"Staff user group update dispatch finished: {result}")
+        return result
+
+    @classmethod
+    def dispatch_in_background(cls):
+        """Deliver the pending group updates on the app thread pool, with the token of the request."""
+        if current_app.config["AUTH_OUTBOX_DISPATCH_ON_COMMIT"]:
+            fan_out.submit(_dispatch_logging_errors)
+
+
+def start_group_update_dispatcher(app):
+    """Run the group update dispatch every AUTH_OUTBOX_DISPATCH_INTERVAL seconds in a background thread."""
+    interval = app.config["AUTH_OUTBOX_DISPATCH_INTERVAL"]
+
+    def run():
+        while True:
+            time.sleep(interval + random.uniform(0, interval / 10))  # nosec
+            with app.app_context():
+                _dispatch_logging_errors()
+
+    thread = threading.Thread(target=run, name="group-update-dispatch", daemon=True)
+    thread.start()
+    return thread
+
+
+def _dispatch_logging_errors():
+    """Run the dispatch, logging instead of raising its errors."""
+    try:
+        StaffUserGroupUpdateService.dispatch()
+    except Exception as err:  # noqa: B902 pylint: disable=broad-except
+        current_app.logger.error(f"Staff user group update dispatch failed: {err}")
+
+
+def _claim(session, attempted_ids: list):
+    """Lease the next due group update, counting the attempt, and return it; None when there is none."""
+    table = StaffUserGroupUpdateModel.__table__
+    now = datetime.utcnow()
+    users_being_delivered = select(table.c.auth_user_guid).where(table.c.lease_until > now)
+    due_id = (
+        select(table.c.id)
+        .where(
+            table.c.status == GroupUpdateStatusEnum.PENDING,
+            table.c.next_attempt_at <= now,
+            or_(table.c.lease_until.is_(None), table.c.lease_until <= now),
+            table.c.auth_user_guid.notin_(users_being_delivered),
+            table.c.id.notin_(attempted_ids),
+        )
+        .order_by(table.c.id)
+        .limit(1)
+        .with_for_update(skip_locked=True)
+        .scalar_subquery()
+    )
+    return session.execute(
+        update(table)
+        .where(table.c.id == due_id)
+        .values(
+            attempts=table.c.attempts + 1,
+            lease_until=now + timedelta(seconds=current_app.config["AUTH_OUTBOX_LEASE"]),
+            updated_by=DISPATCH_USER,
+            updated_date=now,
+        )
+        .returning(*table.c)
+    ).first()
+
+
+def _deliver(group_update, token: str) -> dict:
+    """Send the claimed group update to EPIC.Authorize and return the column values recording the outcome."""
+    config = current_app.config
+    now = datetime.utcnow()
+    attempts = group_update.attempts
+    values = {"lease_until": None, "updated_by": DISPATCH_USER, "updated_date": now}
+    try:
+        AuthService.update_user_group(
+            group_update.auth_user_guid,
+            {"app_name": group_update.app_name, "group_name": group_update.group_name},
+            token,
+        )
+    except Exception as err:  # noqa: B902 pylint: disable=broad-except
+        current_app.logger.warning(
+            f"Delivering the group update {group_update.id} to EPIC.Authorize failed: {err}"
+        )
+        backoff = min(
+            config["AUTH_OUTBOX_RETRY_BACKOFF"] * 2 ** (attempts - 1), config["AUTH_OUTBOX_MAX_BACKOFF"]
+        )
+        return {
+            **values,
+            "status": (
+                GroupUpdateStatusEnum.FAILED
+                if attempts >= config["AUTH_OUTBOX_MAX_ATTEMPTS"]
+                else GroupUpdateStatusEnum.PENDING
+            ),
+            "next_attempt_at": now + timedelta(seconds=backoff),
+            "last_error": str(err)[:1000],
+        }
+    return {**values, "status": GroupUpdateStatusEnum.DELIVERED, "delivered_at": now, "last_error": None}
@@ -2,6 +2,8 @@
 
 from compliance_api.exceptions import ResourceExistsError
 from compliance_api.models import db
+from compliance_api.models.list_query import ListQuery
+from compliance_api.models.pagination import PageRequest
 from compliance_api.models.topic import Topic as TopicModel
 
 
@@ -15,10 +17,9 @@ class TopicService:
         return topic
 
     @classmethod
-    def get_all(cls):
-        """Get all topics."""
-        users = TopicModel.get_all(default_filters=False)
-        return users
+    def get_all(cls, list_query: ListQuery = None, page: PageRequest = None):
+        """Get all topics matching the list query, or only the requested page."""
+        return TopicModel.get_list(default_filters=False, list_query=list_query, page=page)
 
     @classmethod
     def create(cls, topic_data: dict, commit=True):
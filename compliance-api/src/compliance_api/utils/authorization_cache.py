@@ -0,0 +1,73 @@
+# Copyright © 2024 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Per-worker cache of the officer assignment decisions of the permission checks.
+
+Whether a user is assigned to a case file, inspection or complaint is kept for
+AUTHORIZATION_CACHE_TTL seconds, keyed by context, record id and user. The
+services drop the decisions of a record when its officers change; the other
+workers keep theirs until the ttl runs out. At most AUTHORIZATION_CACHE_SIZE
+records are kept, the least recently used being dropped first.
+"""
+import threading
+import time
+from collections import OrderedDict
+
+from flask import current_app
+
+from compliance_api.utils import metrics
+from compliance_api.utils.enum import ContextEnum
+
+
+_decisions = OrderedDict()
+_lock = threading.Lock()
+
+
+def get_or_check(context: ContextEnum, entity_id, auth_user_guid: str, check) -> bool:
+    """Return the cached assignment decision of the user on the record, calling check() when missing or expired."""
+    ttl = current_app.config["AUTHORIZATION_CACHE_TTL"]
+    if not ttl:
+        return check()
+    key = (context, int(entity_id))
+    now = time.monotonic()
+    with _lock:
+        users = _decisions.get(key)
+        cached = users.get(auth_user_guid) if users else None
+        if cached and cached[0] > now:
+            _decisions.move_to_end(key)
+            decision = cached[1]
+        else:
+            decision = None
+    if decision is not None:
+        metrics.count_cache("authorization", "hit")
+        return decision
+    metrics.count_cache("authorization", "miss")
+    decision = bool(check())
+    with _lock:
+        _decisions.setdefault(key, {})[auth_user_guid] = (now + ttl, decision)
+        _decisions.move_to_end(key)
+        while len(_decisions) > current_app.config["AUTHORIZATION_CACHE_SIZE"]:
+            _decisions.popitem(last=False)
+    return decision
+
+
+def invalidate(context: ContextEnum, entity_id):
+    """Drop the decisions of every user on the record."""
+    with _lock:
+        _decisions.pop((context, int(entity_id)), None)
+
+
+def clear():
+    """Drop every decision."""
+    with _lock:
+        _decisions.clear()
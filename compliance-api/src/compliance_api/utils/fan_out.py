@@ -0,0 +1,83 @@
+# Copyright © 2024 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Concurrent fan-out of independent outbound lookups.
+
+The app owns a bounded thread pool (FAN_OUT_MAX_WORKERS). Each task runs in
+its own app context carrying the access token and the token claims of the
+request that submitted it, so the outbound services work as they do in the
+request thread. Tasks must not use the database session of the request.
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+from flask import current_app, g, has_app_context
+
+from compliance_api.exceptions import UpstreamUnavailableError
+
+
+EXTENSION_NAME = "fan_out"
+# Request attributes carried into the pool threads.
+CARRIED_ATTRIBUTES = ("access_token", "token_info", "jwt_oidc_token_info", "outbound_stats")
+
+
+def init_app(app):
+    """Create the thread pool of the app."""
+    app.extensions[EXTENSION_NAME] = ThreadPoolExecutor(
+        max_workers=app.config["FAN_OUT_MAX_WORKERS"], thread_name_prefix="fan-out"
+    )
+
+
+def submit(func, *args, **kwargs):
+    """Run func on the app thread pool within the context of the current request and return its future."""
+    app = current_app._get_current_object()  # pylint: disable=protected-access
+    carried = {name: g.get(name) for name in CARRIED_ATTRIBUTES}
+
+    def run():
+        with app.app_context():
+            for name, value in carried.items():
+                setattr(g, name, value)
+            g.in_fan_out = True
+            return func(*args, **kwargs)
+
+    return app.extensions[EXTENSION_NAME].submit(run)
+
+
+def fan_out(calls: dict) -> dict:
+    """Run the independent calls concurrently and return their results by key.
+
+    Each call is bounded by the deadline of its outbound client; FAN_OUT_TIMEOUT
+    bounds the whole fan-out. A single call, a call made outside of the app or
+    from a pool thread runs inline. The first error raised by a call is raised
+    again here.
+    """
+    if len(calls) <= 1 or not has_app_context() or g.get("in_fan_out"):
+        return {key: call() for key, call in calls.items()}
+    futures = {key: submit(call) for key, call in calls.items()}
+    deadline = time.monotonic() + current_app.config["FAN_OUT_TIMEOUT"]
+    return {
+        key: result(future, max(deadline - time.monotonic(), 0))
+        for key, future in futures.items()
+    }
+
+
+def result(future, timeout: float = None):
+    """Return the result of a submitted call, waiting at most timeout or FAN_OUT_TIMEOUT seconds."""
+    if timeout is None:
+        timeout = current_app.config["FAN_OUT_TIMEOUT"]
+    try:
+        return future.result(timeout=timeout)
+    except FutureTimeoutError as err:
+        future.cancel()
+        raise UpstreamUnavailableError("The upstream lookups did not finish in time") from err
@@ -0,0 +1,198 @@
+# Copyright © 2024 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""JWT manager verifying each token once per worker.
+
+The claims of a verified token are kept, keyed by the hash of the token, until
+the token expires; the next requests carrying the same token read the claims
+instead of checking the signature again. Tokens without an expiry are verified
+on every request. The cache holds at most JWT_CLAIMS_CACHE_SIZE tokens, the
+least recently used being dropped first.
+
+The JWKS is loaded when the app is created and reloaded by a background thread
+every JWT_OIDC_JWKS_CACHE_TIMEOUT seconds, keeping the last loaded keys when the
+identity server cannot be reached, so verifying a token does not wait on the
+network. Only a token signed with a key missing from the JWKS (a key rotation)
+triggers a reload, at most once every JWKS_MIN_RELOAD_INTERVAL seconds. When
+gunicorn preloads the app the workers inherit the loaded keys, and each worker
+starts its own reload thread.
+"""
+import hashlib
+import os
+import random
+import threading
+import time
+from collections import OrderedDict
+
+import requests
+from flask import current_app, g
+from flask.globals import request_ctx
+from flask_jwt_oidc import JwtManager
+
+
+# A token signed with an unknown key reloads the JWKS at most this often, in seconds.
+JWKS_MIN_RELOAD_INTERVAL = 30
+# Seconds before retrying a failed background reload.
+JWKS_RETRY_INTERVAL = 30
+
+
+class CachedJwtManager(JwtManager):
+    """JwtManager with a per-worker cache of the verified claims."""
+
+    def __init__(self, app=None):
+        """Create the manager with an empty claims cache and no keys."""
+        self._claims = OrderedDict()
+        self._claims_lock = threading.Lock()
+        self._jwks = None
+        self._jwks_loaded_at = 0
+        self._jwks_lock = threading.Lock()
+        self._refresher_lock = threading.Lock()
+        self._jwks_refresh_interval = None
+        self._jwks_timeout = None
+        self._refresher_pid = None
+        self._logger = None
+        super().__init__(app)
+
+    def init_app(self, app):
+        """Initialize the extension; the JWKS store of this class replaces the cache of the base class."""
+        super().init_app(app)
+        self.caching_enabled = False
+        self._jwks_refresh_interval = app.config["JWT_OIDC_JWKS_CACHE_TIMEOUT"]
+        self._jwks_timeout = (app.config["OUTBOUND_CONNECT_TIMEOUT"], app.config["OUTBOUND_READ_TIMEOUT"])
+        self._logger = app.logger
+
+    def prefetch_jwks(self):
+        """Load the JWKS and start the background reload, logging instead of failing when it cannot be loaded."""
+        if self.jwt_oidc_test_mode:
+            return
+        try:
+            self._load_jwks()
+        except Exception as err:  # noqa: B902 pylint: disable=broad-except
+            self._logger.error(f"Prefetching the JWKS failed: {err}")
+        self._start_refresher()
+
+    def get_jwks(self):
+        """Return the loaded JWKS, loading it only if the prefetch did not."""
+        if self.jwt_oidc_test_mode:
+            return self.jwt_oidc_test_keys
+        self._start_refresher()
+        jwks = self._jwks
+        if jwks is None:
+            jwks = self._load_jwks()
+        return jwks
+
+    def get_rsa_key(self, jwks, kid):
+        """Return the key of the kid, reloading the JWKS once if the key is unknown."""
+        rsa_key = JwtManager.get_rsa_key(jwks, kid)
+        if rsa_key or self.jwt_oidc_test_mode:
+            return rsa_key
+        return JwtManager.get_rsa_key(self._load_jwks(min_age=JWKS_MIN_RELOAD_INTERVAL), kid)
+
+    def get_verified_claims(self, token: str) -> dict:
+        """Return the claims of the token, checking its signature unless it was verified before."""
+        self._validate_token(token)
+        return g.jwt_oidc_token_info
+
+    def contains_role(self, roles):
+        """Check that one of the roles is in the verified claims of the token of the request."""
+        claims = self.get_verified_claims(self.get_token_auth_header())
+        roles_in_token = current_app.config["JWT_ROLE_CALLBACK"](claims)
+        return any(role in roles_in_token for role in roles)
+
+    def validate_roles(self, required_roles):
+        """Check that all the roles are in the verified claims of the token of the request."""
+        claims = self.get_verified_claims(self.get_token_auth_header())
+        roles_in_token = current_app.config["JWT_ROLE_CALLBACK"](claims)
+        return all(role in roles_in_token for role in required_roles)
+
+    def clear_claims(self):
+        """Drop every cached claims."""
+        with self._claims_lock:
+            self._claims.clear()
+
+    def _validate_token(self, token):
+        """Verify the token, or read its claims from the cache when it was verified before."""
+        key = hashlib.sha256(token.encode("utf-8")).hexdigest()
+        now = time.time()
+        with self._claims_lock:
+            cached = self._claims.get(key)
+            if cached and cached[0] > now:
+                self._claims.move_to_end(key)
+                claims = cached[1]
+            else:
+                claims = None
+        if claims is None:
+            super()._validate_token(token)
+            claims = g.jwt_oidc_token_info
+            self._cache_claims(key, claims, now)
+        request_ctx.current_user = g.jwt_oidc_token_info = dict(claims)
+
+    def _fetch_jwks_from_url(self):
+        """Fetch the JWKS from the identity server."""
+        response = requests.get(self.jwks_uri, timeout=self._jwks_timeout)
+        response.raise_for_status()
+        return response.json()
+
+    def _load_jwks(self, min_age: float = None) -> dict:
+        """Fetch the JWKS and replace the loaded keys.
+
+        Only one thread loads at a time. With min_age, keys loaded less than
+        min_age seconds ago are returned instead of loading them again.
+        """
+        with self._jwks_lock:
+            if (
+                min_age is not None
+                and self._jwks is not None
+                and time.monotonic() - self._jwks_loaded_at < min_age
+            ):
+                return self._jwks
+            self._logger.info(f"Loading the JWKS from {self.jwks_uri}")
+            jwks = self._fetch_jwks_from_url()
+            self._jwks = jwks
+            self._jwks_loaded_at = time.monotonic()
+        return jwks
+
+    def _start_refresher(self):
+        """Start the background reload of the current process, once."""
+        pid = os.getpid()
+        if self._refresher_pid == pid or not self._jwks_refresh_interval:
+            return
+        with self._refresher_lock:
+            if self._refresher_pid == pid:
+                return
+            self._refresher_pid = pid
+        threading.Thread(target=self._refresh_jwks, name="jwks-refresh", daemon=True).start()
+
+    def _refresh_jwks(self):
+        """Reload the JWKS every refresh interval, retrying sooner after a failure."""
+        delay = self._jwks_refresh_interval
+        while True:
+            # Jitter so that the workers do not all ask the identity server at the same moment.
+            time.sleep(delay + random.uniform(0, delay / 10))  # nosec
+            try:
+                self._load_jwks()
+                delay = self._jwks_refresh_interval
+            except Exception as err:  # noqa: B902 pylint: disable=broad-except
+                self._logger.error(f"Reloading the JWKS failed, keeping the loaded keys: {err}")
+                delay = min(JWKS_RETRY_INTERVAL, self._jwks_refresh_interval)
+
+    def _cache_claims(self, key: str, claims: dict, now: float):
+        """Keep the claims until the token expires."""
+        expires_at = claims.get("exp")
+        if not isinstance(expires_at, (int, float)) or expires_at <= now:
+            return
+        with self._claims_lock:
+            self._claims[key] = (expires_at, claims)
+            self._claims.move_to_end(key)
+            while len(self._claims) > current_app.config["JWT_CLAIMS_CACHE_SIZE"]:
+                self._claims.popitem(last=False)
@@ -0,0 +1,206 @@
+# Copyright © 2024 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""In-process metrics of the API and its outbound calls.
+
+The outbound client records the latency, status and bytes of every call to an
+upstream by endpoint; the caches record their hits and misses; the app records
+the latency of every request by route. The metrics are kept per worker process
+and rendered in the Prometheus text format by the ops metrics endpoint.
+
+The outbound calls of the current request are also summed on flask.g, so the
+request log line shows how much of the request was spent on each upstream.
+"""
+import threading
+from collections import defaultdict
+
+from flask import g, has_app_context
+
+
+# Upper bounds, in seconds, of the latency histogram buckets.
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+OUTBOUND_DURATION = "compliance_outbound_request_duration_seconds"
+OUTBOUND_REQUESTS = "compliance_outbound_requests_total"
+OUTBOUND_SENT_BYTES = "compliance_outbound_request_bytes_total"
+OUTBOUND_RECEIVED_BYTES = "compliance_outbound_response_bytes_total"
+CACHE_REQUESTS = "compliance_cache_requests_total"
+HTTP_DURATION = "compliance_http_request_duration_seconds"
+
+_DESCRIPTIONS = {
+    OUTBOUND_DURATION: ("histogram", "Latency of the calls to the upstream services."),
+    OUTBOUND_REQUESTS: ("counter", "Calls to the upstream services by status."),
+    OUTBOUND_SENT_BYTES: ("counter", "Bytes sent to the upstream services."),
+    OUTBOUND_RECEIVED_BYTES: ("counter", "Bytes received from the upstream services."),
+    CACHE_REQUESTS: ("counter", "Cache lookups by result."),
+    HTTP_DURATION: ("histogram", "Latency of the requests served by route."),
+}
+
+
+class _Registry:
+    """Counters and histograms keyed by metric name and label values."""
+
+    def __init__(self):
+        """Create an empty registry."""
+        self._counters = defaultdict(float)
+        self._histograms = {}
+        self._lock = threading.Lock()
+
+    def increment(self, name: str, labels: tuple, amount: float = 1):
+        """Add the amount to the counter."""
+        with self._lock:
+            self._counters[(name, labels)] += amount
+
+    def observe(self, name: str, labels: tuple, value: float):
+        """Add the value to the histogram."""
+        with self._lock:
+            histogram = self._histograms.get((name, labels))
+            if histogram is None:
+                histogram = self._histograms[(name, labels)] = [[0] * len(LATENCY_BUCKETS), 0.0, 0]
+            buckets = histogram[0]
+            for index, bound in enumerate(LATENCY_BUCKETS):
+                if value <= bound:
+                    buckets[index] += 1
+            histogram[1] += value
+            histogram[2] += 1
+
+    def render(self) -> str:
+        """Return the metrics in the Prometheus text format."""
+        with self._lock:
+            counters = dict(self._counters)
+            histograms = {key: (list(value[0]), value[1], value[2]) for key, value in self._histograms.items()}
+        lines = []
+        for name, (metric_type, description) in _DESCRIPTIONS.items():
+            lines.append(f"# HELP {name} {description}")
+            lines.append(f"# TYPE {name} {metric_type}")
+            if metric_type == "counter":
+                for (metric, labels), value in sorted(counters.items()):
+                    if metric == name:
+                        lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+                continue
+            for (metric, labels), (buckets, total, count) in sorted(histograms.items()):
+                if metric != name:
+                    continue
+                for bound, bucket_count in zip(LATENCY_BUCKETS, buckets):
+                    lines.append(
+                        f"{name}_bucket{_format_labels(labels + (('le', _format_value(bound)),))} {bucket_count}"
+                    )
+                lines.append(f"{name}_bucket{_format_labels(labels + (('le', '+Inf'),))} {count}")
+                lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(total)}")
+                lines.append(f"{name}_count{_format_labels(labels)} {count}")
+        return "\n".join(lines) + "\n"
+
+    def clear(self):
+        """Drop every metric."""
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+
+REGISTRY = _Registry()
+
+
+def observe_outbound(
+    upstream: str, endpoint: str, method: str, status, seconds: float, sent_bytes: int = 0, received_bytes: int = 0
+):  # pylint: disable=too-many-arguments
+    """Record a call to an upstream, and add it to the outbound time of the current request.
+
+    Args:
+        upstream (str): Name of the upstream, e.g. epic_track.
+        endpoint (str): The endpoint called, with the resource ids left out.
+        method (str): The HTTP method.
+        status: The response status code, or the kind of failure, e.g. "error".
+        seconds (float): Time spent on the call.
+        sent_bytes (int): Size of the request body.
+        received_bytes (int): Size of the response body.
+    """
+    labels = (("upstream", upstream), ("endpoint", endpoint))
+    REGISTRY.observe(OUTBOUND_DURATION, labels, seconds)
+    REGISTRY.increment(OUTBOUND_REQUESTS, labels + (("method", method), ("status", str(status))))
+    if sent_bytes:
+        REGISTRY.increment(OUTBOUND_SENT_BYTES, labels, sent_bytes)
+    if received_bytes:
+        REGISTRY.increment(OUTBOUND_RECEIVED_BYTES, labels, received_bytes)
+    request_stats = g.get("outbound_stats") if has_app_context() else None
+    if request_stats is not None:
+        request_stats.add(upstream, seconds, sent_bytes + received_bytes)
+
+
+def count_cache(cache: str, result: str, amount: int = 1):
+    """Record cache lookups; result is hit, miss, stale or fallback."""
+    if amount:
+        REGISTRY.increment(CACHE_REQUESTS, (("cache", cache), ("result", result)), amount)
+
+
+def observe_request(method: str, route: str, status: int, seconds: float):
+    """Record a request served by the API."""
+    REGISTRY.observe(
+        HTTP_DURATION, (("method", method), ("route", route), ("status", str(status))), seconds
+    )
+
+
+def render() -> str:
+    """Return the metrics of this worker in the Prometheus text format."""
+    return REGISTRY.render()
+
+
+class OutboundStats:
+    """Outbound calls of one request by upstream; shared with the fan-out threads of the request."""
+
+    def __init__(self):
+        """Create empty stats."""
+        self._upstreams = {}
+        self._lock = threading.Lock()
+
+    def add(self, upstream: str, seconds: float, transferred_bytes: int):
+        """Add a call to the upstream."""
+        with self._lock:
+            calls, total_seconds, total_bytes = self._upstreams.get(upstream, (0, 0.0, 0))
+            self._upstreams[upstream] = (calls + 1, total_seconds + seconds, total_bytes + transferred_bytes)
+
+    def summary(self) -> str:
+        """Return the calls, time and bytes by upstream for the log line, e.g. 'epic_track=2/35ms/1024B'."""
+        with self._lock:
+            upstreams = dict(self._upstreams)
+        return " ".join(
+            f"{upstream}={calls}/{seconds * 1000:.0f}ms/{transferred_bytes}B"
+            for upstream, (calls, seconds, transferred_bytes) in sorted(upstreams.items())
+        )
+
+
+def start_request():
+    """Start summing the outbound calls of the request."""
+    g.outbound_stats = OutboundStats()
+
+
+def get_request_summary() -> str:
+    """Return the outbound summary of the request."""
+    request_stats = g.get("outbound_stats")
+    return request_stats.summary() if request_stats else ""
+
+
+def _format_labels(labels: tuple) -> str:
+    """Return the labels in the Prometheus text format."""
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels) + "}"
+
+
+def _escape(value) -> str:
+    """Escape a label value."""
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    """Return the value without a trailing .0 for whole numbers."""
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
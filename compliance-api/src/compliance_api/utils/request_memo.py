@@ -0,0 +1,76 @@
+# Copyright © 2024 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Request-scoped memo of lookups.
+
+Results are kept on flask.g for the current request only, keyed by
+(service, resource, id), so a request never repeats the same upstream call or
+primary key query. Outside of a request the loader is always called.
+"""
+from collections import Counter
+
+from flask import g, has_request_context
+
+from compliance_api.utils import metrics
+
+
+def memoize(service: str, resource: str, identifier, loader):
+    """Return the memoized result of the lookup, calling loader() on the first use."""
+    if not has_request_context():
+        return loader()
+    memo = _get_memo()
+    key = (service, resource, identifier)
+    if key in memo:
+        g.request_memo_hits[key] += 1
+        metrics.count_cache(f"request_memo:{service}:{resource}", "hit")
+        return memo[key]
+    metrics.count_cache(f"request_memo:{service}:{resource}", "miss")
+    value = loader()
+    memo[key] = value
+    return value
+
+
+def forget(service: str, resource: str = None, identifier=None):
+    """Drop the memoized results of a service, a resource or a single id."""
+    if not has_request_context():
+        return
+    memo = _get_memo()
+    for key in list(memo):
+        if key[0] != service:
+            continue
+        if resource is not None and key[1] != resource:
+            continue
+        if identifier is not None and key[2] != identifier:
+            continue
+        memo.pop(key)
+
+
+def reset():
+    """Start an empty memo for the request."""
+    g.request_memo = {}
+    g.request_memo_hits = Counter()
+
+
+def get_hit_counts() -> dict:
+    """Return the number of memo hits of the request by 'service:resource'."""
+    hits = Counter()
+    for (service, resource, _), count in g.get("request_memo_hits", Counter()).items():
+        hits[f"{service}:{resource}"] += count
+    return dict(hits)
+
+
+def _get_memo() -> dict:
+    """Return the memo of the request."""
+    if "request_memo" not in g:
+        reset()
+    return g.request_memo
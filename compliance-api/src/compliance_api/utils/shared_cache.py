@@ -0,0 +1,267 @@
+# Copyright © 2024 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Node-local cache shared by all the workers of the API.
+
+Entries are stored as JSON in a SQLite file (SHARED_CACHE_PATH), so every
+gunicorn worker on the node sees the same entries. An entry is fresh for its
+ttl; after that it is served stale for up to stale ttl seconds while one worker,
+holding a short lease, reloads it in the background. Older entries are loaded
+synchronously; they are only served again when the upstream is unavailable.
+
+Invalidating a key bumps its generation. A load records the generation when
+it starts, and its value is only stored if the key was not invalidated since,
+so a load racing an invalidation never stores the value it read before.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from flask import current_app
+
+from compliance_api.exceptions import UpstreamUnavailableError
+from compliance_api.utils import metrics
+
+
+REVALIDATE_LEASE = 30
+# Expired entries are kept this many seconds to be served when the upstream is unavailable.
+FALLBACK_RETENTION = 86400
+
+_CREATE_TABLE = """
+CREATE TABLE IF NOT EXISTS cache_entry (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    expires_at REAL NOT NULL,
+    stale_until REAL NOT NULL,
+    lease_until REAL NOT NULL DEFAULT 0,
+    PRIMARY KEY (namespace, key)
+)
+"""
+_CREATE_GENERATION_TABLE = """
+CREATE TABLE IF NOT EXISTS cache_generation (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    generation INTEGER NOT NULL,
+    PRIMARY KEY (namespace, key)
+)
+"""
+# The generation key of the whole namespace, bumped by clear.
+_NAMESPACE_KEY = ""
+_GENERATION_QUERY = (
+    "SELECT COALESCE(SUM(generation), 0) FROM cache_generation "
+    "WHERE namespace = ? AND key IN (?, ?)"
+)
+
+
+class SharedCache:
+    """A namespace in the node-local shared cache."""
+
+    def __init__(self, namespace: str, ttl_config: str, stale_ttl_config: str, path: str = None):
+        """Create the cache.
+
+        Args:
+            namespace (str): Namespace of the keys, so caches can share the file.
+            ttl_config (str): The app config key holding the fresh period in seconds.
+            stale_ttl_config (str): The app config key holding how long, after the fresh
+                period, an entry may still be served while it is revalidated.
+            path (str): The SQLite file; defaults to the SHARED_CACHE_PATH config.
+        """
+        self.namespace = namespace
+        self.ttl_config = ttl_config
+        self.stale_ttl_config = stale_ttl_config
+        self._path = path
+        self._local = threading.local()
+
+    def get_or_load(self, key, loader):
+        """Return the cached value of the key, calling loader() when it is missing or expired.
+
+        The loader must not depend on the request, as it may run in a background
+        thread to revalidate a stale entry.
+        """
+        key = str(key)
+        now = time.time()
+        try:
+            entry = self._read(key)
+            generation = self._get_generation(key)
+        except sqlite3.Error as err:
+            current_app.logger.error(f"Reading the shared cache failed: {err}")
+            metrics.count_cache(self.namespace, "miss")
+            return loader()
+        if entry:
+            value, expires_at, stale_until = entry
+            if now < expires_at:
+                metrics.count_cache(self.namespace, "hit")
+                return value
+            if now < stale_until:
+                metrics.count_cache(self.namespace, "stale")
+                if self._acquire_lease(key, now):
+                    self._revalidate_in_background(key, loader, generation)
+                return value
+        try:
+            value = loader()
+        except UpstreamUnavailableError:
+            if not entry:
+                metrics.count_cache(self.namespace, "miss")
+                raise
+            metrics.count_cache(self.namespace, "fallback")
+            current_app.logger.warning(
+                f"Serving expired {self.namespace}:{key} as the upstream is unavailable"
+            )
+            return entry[0]
+        metrics.count_cache(self.namespace, "miss")
+        self.set(key, value, generation)
+        return value
+
+    def set(self, key, value, generation: int = None):
+        """Store the value of the key.
+
+        When generation is given, the generation of the key when the value was
+        loaded, the value is not stored if the key was invalidated since.
+        """
+        config = current_app.config
+        now = time.time()
+        expires_at = now + config[self.ttl_config]
+        stale_until = expires_at + config[self.stale_ttl_config]
+        key = str(key)
+        try:
+            connection = self._connection()
+            cursor = connection.execute(
+                "INSERT OR REPLACE INTO cache_entry "
+                "(namespace, key, value, expires_at, stale_until, lease_until) "
+                "SELECT ?, ?, ?, ?, ?, 0 "
+                f"WHERE ? IS NULL OR ({_GENERATION_QUERY}) = ?",
+                (
+                    self.namespace,
+                    key,
+                    json.dumps(value),
+                    expires_at,
+                    stale_until,
+                    generation,
+                    self.namespace,
+                    key,
+                    _NAMESPACE_KEY,
+                    generation,
+                ),
+            )
+            if cursor.rowcount == 0:
+                current_app.logger.debug(
+                    f"Not storing {self.namespace}:{key}, invalidated while it was loaded"
+                )
+            connection.execute(
+                "DELETE FROM cache_entry WHERE namespace = ? AND stale_until < ?",
+                (self.namespace, now - FALLBACK_RETENTION),
+            )
+        except sqlite3.Error as err:
+            current_app.logger.error(f"Writing the shared cache failed: {err}")
+
+    def invalidate(self, key):
+        """Remove the key for every worker, discarding the loads of the key in progress."""
+        try:
+            connection = self._connection()
+            self._bump_generation(connection, str(key))
+            connection.execute(
+                "DELETE FROM cache_entry WHERE namespace = ? AND key = ?",
+                (self.namespace, str(key)),
+            )
+        except sqlite3.Error as err:
+            current_app.logger.error(f"Invalidating {self.namespace}:{key} in the shared cache failed: {err}")
+
+    def clear(self):
+        """Remove every key of the namespace, discarding the loads in progress."""
+        try:
+            connection = self._connection()
+            self._bump_generation(connection, _NAMESPACE_KEY)
+            connection.execute(
+                "DELETE FROM cache_entry WHERE namespace = ?", (self.namespace,)
+            )
+        except sqlite3.Error as err:
+            current_app.logger.error(f"Clearing {self.namespace} in the shared cache failed: {err}")
+
+    def _get_generation(self, key) -> int:
+        """Return the generation of the key, counting the invalidations of the key and of the namespace."""
+        return (
+            self._connection()
+            .execute(_GENERATION_QUERY, (self.namespace, key, _NAMESPACE_KEY))
+            .fetchone()[0]
+        )
+
+    def _bump_generation(self, connection, key):
+        """Increment the generation of the key, or of the namespace for _NAMESPACE_KEY."""
+        connection.execute(
+            "INSERT INTO cache_generation (namespace, key, generation) VALUES (?, ?, 1) "
+            "ON CONFLICT (namespace, key) DO UPDATE SET generation = generation + 1",
+            (self.namespace, key),
+        )
+
+    def _read(self, key):
+        """Return the (value, expires_at, stale_until) of the key if present."""
+        row = (
+            self._connection()
+            .execute(
+                "SELECT value, expires_at, stale_until FROM cache_entry "
+                "WHERE namespace = ? AND key = ?",
+                (self.namespace, key),
+            )
+            .fetchone()
+        )
+        if row is None:
+            return None
+        return json.loads(row[0]), row[1], row[2]
+
+    def _acquire_lease(self, key, now) -> bool:
+        """Take the revalidation lease of the key; only one worker gets it."""
+        try:
+            cursor = self._connection().execute(
+                "UPDATE cache_entry SET lease_until = ? "
+                "WHERE namespace = ? AND key = ? AND lease_until < ?",
+                (now + REVALIDATE_LEASE, self.namespace, key, now),
+            )
+        except sqlite3.Error as err:
+            current_app.logger.error(f"Leasing the shared cache entry failed: {err}")
+            return False
+        return cursor.rowcount == 1
+
+    def _revalidate_in_background(self, key, loader, generation: int):
+        """Reload the key in a background thread."""
+        app = current_app._get_current_object()  # pylint: disable=protected-access
+        threading.Thread(
+            target=self._revalidate, args=(app, key, loader, generation), daemon=True
+        ).start()
+
+    def _revalidate(self, app, key, loader, generation: int):
+        """Reload the key within the app context, keeping the stale value on failure."""
+        with app.app_context():
+            try:
+                self.set(key, loader(), generation)
+            except Exception as err:  # noqa: B902 pylint: disable=broad-except
+                current_app.logger.error(
+                    f"Revalidating {self.namespace}:{key} in the shared cache failed: {err}"
+                )
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return the SQLite connection of the current thread and process."""
+        local = self._local
+        pid = os.getpid()
+        if getattr(local, "pid", None) != pid:
+            path = self._path or current_app.config["SHARED_CACHE_PATH"]
+            connection = sqlite3.connect(path, timeout=5, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(_CREATE_TABLE)
+            connection.execute(_CREATE_GENERATION_TABLE)
+            local.connection = connection
+            local.pid = pid
+        return local.connection
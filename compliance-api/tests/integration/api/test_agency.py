@@ -3,11 +3,16 @@ import json
 from http import HTTPStatus
 from urllib.parse import urljoin
 
+from faker import Faker
+
 from compliance_api.models.agency import Agency as AgencyModel
+from compliance_api.models.pagination import PageRequest, decode_cursor
 from tests.utilities.factory_scenario import AgencyScenario
+from tests.utilities.factory_utils import generate_abbreviation
 
 
 API_BASE_URL = "/api/"
+fake = Faker()
 
 
 def test_get_agencies(app, client, auth_header):
@@ -73,3 +78,79 @@ def test_delete_agency(client, auth_header):
     agency_get = AgencyModel.find_by_id(agency.id)
     print(agency.is_deleted)
     assert agency_get is None
+
+
+def test_get_agencies_by_page(app, client, auth_header):
+    """Walk the agencies page by page; the pages hold every agency once, in the order of the list."""
+    for _ in range(3):
+        AgencyScenario.create({"name": fake.name(), "abbreviation": generate_abbreviation(4)})
+    url = urljoin(API_BASE_URL, "agencies")
+    all_ids = [agency["id"] for agency in client.get(url, headers=auth_header).json]
+    page_ids = []
+    cursor = None
+    while True:
+        query = f"?limit=3&after={cursor}" if cursor else "?limit=3"
+        result = client.get(url + query, headers=auth_header)
+        assert result.status_code == HTTPStatus.OK
+        assert len(result.json["items"]) <= 3
+        page_ids.extend(agency["id"] for agency in result.json["items"])
+        cursor = result.json["next"]
+        if not cursor:
+            break
+    assert page_ids == sorted(all_ids)
+
+    for limit in ("0", "abc", "\u00b2"):
+        result = client.get(url + f"?limit={limit}", headers=auth_header)
+        assert result.status_code == HTTPStatus.BAD_REQUEST
+    result = client.get(url + "?after=not-a-cursor", headers=auth_header)
+    assert result.status_code == HTTPStatus.BAD_REQUEST
+
+
+def test_agencies_page_documented(client):
+    """Assert that the list response is documented as the page envelope."""
+    spec = client.get(urljoin(API_BASE_URL, "swagger.json")).json
+    response = spec["paths"]["/agencies"]["get"]["responses"]["200"]
+    assert response["schema"] == {"$ref": "#/definitions/AgencyPage"}
+    assert set(spec["definitions"]["AgencyPage"]["properties"]) == {"items", "next"}
+
+
+def test_agency_pages_sorted_on_duplicate_values(app):
+    """Assert that sorting on a column with duplicate values still returns every agency once."""
+    all_ids = sorted(agency.id for agency in AgencyModel.get_all(default_filters=False))
+    for sort_by, descending in (("created_by", False), ("created_date", True)):
+        page_ids = []
+        page = PageRequest(limit=2, sort_by=sort_by, descending=descending)
+        while True:
+            result = AgencyModel.get_list(default_filters=False, page=page)
+            page_ids.extend(agency.id for agency in result.items)
+            if not result.next_cursor:
+                break
+            page.after = decode_cursor(result.next_cursor)[1:]
+        assert sorted(page_ids) == all_ids
+        assert len(page_ids) == len(all_ids)
+
+
+def test_get_agencies_filtered_and_sorted(client, auth_header):
+    """Assert that the agencies are filtered by name prefix and sorted by name."""
+    url = urljoin(API_BASE_URL, "agencies")
+    prefix = fake.uuid4()[:8]
+    names = [f"{prefix} {suffix}" for suffix in ("b", "a", "c")]
+    for name in names:
+        AgencyModel(name=name, abbreviation=name[:10]).save()
+
+    result = client.get(url + f"?name__prefix={prefix}&sort=-name", headers=auth_header)
+    assert result.status_code == HTTPStatus.OK
+    assert [agency["name"] for agency in result.json] == sorted(names, reverse=True)
+
+    result = client.get(url + f"?name__prefix={prefix}&sort=name&limit=2", headers=auth_header)
+    assert [agency["name"] for agency in result.json["items"]] == sorted(names)[:2]
+    cursor = result.json["next"]
+    result = client.get(url + f"?name__prefix={prefix}&sort=name&limit=2&after={cursor}", headers=auth_header)
+    assert [agency["name"] for agency in result.json["items"]] == sorted(names)[2:]
+    result = client.get(url + f"?name__prefix={prefix}&sort=-name&after={cursor}", headers=auth_header)
+    assert result.status_code == HTTPStatus.BAD_REQUEST
+
+    result = client.get(url + "?sort=created_date", headers=auth_header)
+    assert result.status_code == HTTPStatus.BAD_REQUEST
+    result = client.get(url + "?name=exact", headers=auth_header)
+    assert result.status_code == HTTPStatus.BAD_REQUEST
@@ -8,10 +8,15 @@ from urllib.parse import urljoin
 
 import pytest
 from faker import Faker
+from sqlalchemy import event
 
+from compliance_api.models import db
 from compliance_api.models.case_file import CaseFileStatusEnum
+from compliance_api.models.inspection.inspection_enum import InspectionAttendanceOptionEnum
 from compliance_api.services.case_file import CaseFileService
-from tests.utilities.factory_scenario import CasefileScenario, StaffScenario
+from compliance_api.services.inspection import InspectionService
+from tests.utilities.factory_scenario import CasefileScenario, StaffScenario, TokenJWTClaims
+from tests.utilities.factory_utils import factory_auth_header
 
 
 API_BASE_URL = "/api/"
@@ -217,3 +222,212 @@ def test_case_file_update(client, auth_header, created_staff):
     assert result.json["primary_officer_id"] == new_user.id
     officers = CaseFileService.get_other_officers(result.json["id"])
     assert len(officers) == 0
+
+
+def test_case_file_is_assigned_user(client, auth_header, created_staff):
+    """Check the assigned users of a case file, the removed officers being no longer assigned."""
+    user_data = StaffScenario.default_data.value
+    user_data["auth_user_guid"] = fake.uuid4()
+    other_officer = StaffScenario.create(user_data)
+    case_file_data = copy.copy(CasefileScenario.default_value.value)
+    case_file_data["case_file_number"] = fake.uuid4()
+    case_file_data["primary_officer_id"] = created_staff.id
+    case_file_data["officer_ids"] = [other_officer.id]
+    created_case_file = CaseFileService.create(case_file_data)
+
+    assert CaseFileService.is_assigned_user(created_case_file.id, created_staff.auth_user_guid)
+    assert CaseFileService.is_assigned_user(created_case_file.id, other_officer.auth_user_guid)
+    assert not CaseFileService.is_assigned_user(created_case_file.id, fake.uuid4())
+    assert not CaseFileService.is_assigned_user(0, created_staff.auth_user_guid)
+
+    case_file_data["officer_ids"] = []
+    url = urljoin(API_BASE_URL, f"case-files/{created_case_file.id}")
+    result = client.patch(url, data=json.dumps(case_file_data), headers=auth_header)
+    assert result.status_code == HTTPStatus.OK
+    assert not CaseFileService.is_assigned_user(created_case_file.id, other_officer.auth_user_guid)
+
+
+def test_get_case_files_assigned_to_officer(client, jwt, auth_header):
+    """Get the case files of an officer, as primary or one of the other officers."""
+    officers = []
+    for _ in range(2):
+        user_data = copy.copy(StaffScenario.default_data.value)
+        user_data["auth_user_guid"] = fake.uuid4()
+        officers.append(StaffScenario.create(user_data))
+    first, second = officers
+    case_file_data = copy.copy(CasefileScenario.default_value.value)
+    case_file_data["case_file_number"] = fake.uuid4()
+    case_file_data["primary_officer_id"] = first.id
+    case_file_data["officer_ids"] = [second.id]
+    shared_case_file = CaseFileService.create(case_file_data)
+    case_file_data = copy.copy(CasefileScenario.default_value.value)
+    case_file_data["case_file_number"] = fake.uuid4()
+    case_file_data["primary_officer_id"] = second.id
+    own_case_file = CaseFileService.create(case_file_data)
+
+    result = client.get(urljoin(API_BASE_URL, f"case-files?officer_id={first.id}"), headers=auth_header)
+    assert result.status_code == HTTPStatus.OK
+    assert [case_file["id"] for case_file in result.json] == [shared_case_file.id]
+
+    headers = factory_auth_header(
+        jwt, {**TokenJWTClaims.default, "preferred_username": second.auth_user_guid}
+    )
+    result = client.get(urljoin(API_BASE_URL, "case-files?assigned_to=me"), headers=headers)
+    assert result.status_code == HTTPStatus.OK
+    assert {case_file["id"] for case_file in result.json} == {shared_case_file.id, own_case_file.id}
+
+    result = client.get(urljoin(API_BASE_URL, "case-files?assigned_to=everyone"), headers=auth_header)
+    assert result.status_code == HTTPStatus.BAD_REQUEST
+    for officer_id in ("abc", "\u00b2"):
+        result = client.get(urljoin(API_BASE_URL, f"case-files?officer_id={officer_id}"), headers=auth_header)
+        assert result.status_code == HTTPStatus.BAD_REQUEST
+
+
+def test_get_case_files_sparse_fields(client, auth_header, created_staff):
+    """Get the case files with only the requested fields."""
+    case_file_data = copy.copy(CasefileScenario.default_value.value)
+    case_file_data["case_file_number"] = fake.uuid4()
+    case_file_data["primary_officer_id"] = created_staff.id
+    case_file = CaseFileService.create(case_file_data)
+    url = urljoin(API_BASE_URL, f"case-files?officer_id={created_staff.id}")
+
+    result = client.get(
+        url + "&fields=id,case_file_number,case_file_status,primary_officer.full_name", headers=auth_header
+    )
+    assert result.status_code == HTTPStatus.OK
+    assert result.json == [
+        {
+            "id": case_file.id,
+            "case_file_number": case_file.case_file_number,
+            "case_file_status": CaseFileStatusEnum.OPEN.value,
+            "primary_officer": {"full_name": f"{created_staff.first_name} {created_staff.last_name}"},
+        }
+    ]
+
+    result = client.get(url + "&fields=id,unknown", headers=auth_header)
+    assert result.status_code == HTTPStatus.BAD_REQUEST
+    result = client.get(url + "&fields=primary_officer.unknown", headers=auth_header)
+    assert result.status_code == HTTPStatus.BAD_REQUEST
+
+
+def test_get_case_files_streamed(client, auth_header):
+    """Get the case files streamed as a JSON array."""
+    url = urljoin(API_BASE_URL, "case-files")
+    expected = client.get(url + "?sort=-date_created", headers=auth_header).json
+
+    result = client.get(url + "?sort=-date_created&stream=true", headers=auth_header)
+    assert result.status_code == HTTPStatus.OK
+    assert result.is_streamed
+    assert result.json == expected
+
+    result = client.get(url + "?stream=true&limit=2", headers=auth_header)
+    assert result.status_code == HTTPStatus.BAD_REQUEST
+    result = client.get(url + "?stream=yes", headers=auth_header)
+    assert result.status_code == HTTPStatus.BAD_REQUEST
+
+
+def test_get_case_files_constant_queries(client, auth_header):
+    """Get the case files with their officers, supervisors and deputy directors in the same number of queries."""
+    prefix = fake.uuid4()[:8]
+    for index in range(1, 4):
+        supervisor = StaffScenario.create(_staff_data())
+        deputy_director = StaffScenario.create(_staff_data())
+        officer = StaffScenario.create(
+            {**_staff_data(), "supervisor_id": supervisor.id, "deputy_director_id": deputy_director.id}
+        )
+        case_file_data = copy.copy(CasefileScenario.default_value.value)
+        case_file_data["case_file_number"] = f"{prefix}-{index}"
+        case_file_data["primary_officer_id"] = officer.id
+        CaseFileService.create(case_file_data)
+    url = urljoin(API_BASE_URL, "case-files?case_file_number__prefix=")
+
+    client.get(url + f"{prefix}-1", headers=auth_header)
+    result, one_row_queries = _get_counting_queries(client, url + f"{prefix}-1", auth_header)
+    assert len(result.json) == 1
+    result, three_rows_queries = _get_counting_queries(client, url + prefix, auth_header)
+    assert len(result.json) == 3
+    assert all(case_file["primary_officer"]["supervisor"] for case_file in result.json)
+    assert all(case_file["primary_officer"]["deputy_director"] for case_file in result.json)
+    assert three_rows_queries == one_row_queries
+
+
+def test_get_case_file_inspection_attendances(client, auth_header, created_staff):
+    """Get the attendance of all the inspections of a case file in the same number of queries."""
+    one_inspection = _create_case_file_with_inspections(created_staff, 1)
+    three_inspections = _create_case_file_with_inspections(created_staff, 3)
+    url = urljoin(API_BASE_URL, "case-files/{}/inspection-attendance-options")
+
+    client.get(url.format(one_inspection.id), headers=auth_header)
+    result, one_inspection_queries = _get_counting_queries(client, url.format(one_inspection.id), auth_header)
+    assert len(result.json) == 4
+    result, three_inspections_queries = _get_counting_queries(
+        client, url.format(three_inspections.id), auth_header
+    )
+    assert three_inspections_queries == one_inspection_queries
+    assert len(result.json) == 12
+    attendance = {entry["attendance_option_id"]: entry for entry in result.json[:4]}
+    assert attendance[InspectionAttendanceOptionEnum.AGENCIES.value]["data"][0]["id"] == 1
+    assert attendance[InspectionAttendanceOptionEnum.ATTENDING_OFFICERS.value]["data"] == [
+        {"id": created_staff.id, "name": f"{created_staff.first_name} {created_staff.last_name}"}
+    ]
+    assert attendance[InspectionAttendanceOptionEnum.MUNICIPAL.value]["data"] == "Municipal"
+    assert attendance[InspectionAttendanceOptionEnum.OTHER.value]["data"] == "Other"
+    assert attendance[InspectionAttendanceOptionEnum.OTHER.value]["attendance_option"]["name"]
+
+    inspection_url = urljoin(API_BASE_URL, f"inspections/{result.json[0]['inspection_id']}/attendance-options")
+    assert client.get(inspection_url, headers=auth_header).json == result.json[:4]
+
+    result = client.get(url.format(0), headers=auth_header)
+    assert result.status_code == HTTPStatus.NOT_FOUND
+
+
+def _create_case_file_with_inspections(officer, count: int):
+    """Create a case file without project and its inspections attended by agencies, officers and others."""
+    case_file_data = copy.copy(CasefileScenario.default_value.value)
+    case_file_data["case_file_number"] = fake.uuid4()
+    case_file_data["primary_officer_id"] = officer.id
+    case_file_data["project_id"] = None
+    case_file = CaseFileService.create(case_file_data)
+    for _ in range(count):
+        InspectionService.create(
+            {
+                "case_file_id": case_file.id,
+                "primary_officer_id": officer.id,
+                "initiation_id": 1,
+                "start_date": datetime(2024, 10, 1),
+                "end_date": datetime(2024, 10, 2),
+                "inspection_type_ids": [1],
+                "attendance_option_ids": [
+                    InspectionAttendanceOptionEnum.AGENCIES.value,
+                    InspectionAttendanceOptionEnum.MUNICIPAL.value,
+                    InspectionAttendanceOptionEnum.OTHER.value,
+                    InspectionAttendanceOptionEnum.ATTENDING_OFFICERS.value,
+                ],
+                "agency_attendance_ids": [1],
+                "inspection_officer_ids": [officer.id],
+                "attendance_municipal": "Municipal",
+                "attendance_other": "Other",
+            }
+        )
+    return case_file
+
+
+def _get_counting_queries(client, url, headers):
+    """Return the response of the GET and the number of SQL statements it ran."""
+    statements = []
+
+    def count(*args):  # pylint: disable=unused-argument
+        statements.append(1)
+
+    event.listen(db.engine, "before_cursor_execute", count)
+    try:
+        result = client.get(url, headers=headers)
+    finally:
+        event.remove(db.engine, "before_cursor_execute", count)
+    assert result.status_code == HTTPStatus.OK
+    return result, len(statements)
+
+
+def _staff_data() -> dict:
+    """Return the data of a staff user with a unique auth user guid."""
+    return {**StaffScenario.default_data.value, "auth_user_guid": fake.uuid4()}
@@ -13,3 +13,10 @@ def test_get_complaint_sources(client, auth_header):
     result = client.get(url, headers=auth_header)
     assert len(result.json) == 4
     assert result.status_code == HTTPStatus.OK
+
+
+def test_get_complaints_with_unknown_enrich(client, auth_header):
+    """Get complaints with an unsupported enrich value."""
+    url = urljoin(API_BASE_URL, "complaints?enrich=project,officers")
+    result = client.get(url, headers=auth_header)
+    assert result.status_code == HTTPStatus.BAD_REQUEST
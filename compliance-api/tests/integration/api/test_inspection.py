@@ -0,0 +1,93 @@
+"""Test suite for inspection."""
+
+import copy
+from datetime import datetime
+from http import HTTPStatus
+from urllib.parse import urljoin
+
+import pytest
+from faker import Faker
+
+from compliance_api.models.inspection.inspection_enum import InspectionAttendanceOptionEnum
+from compliance_api.services.case_file import CaseFileService
+from compliance_api.services.inspection import InspectionService
+from compliance_api.utils.constant import UNAPPROVED_PROJECT_NAME
+from tests.utilities.factory_scenario import CasefileScenario, StaffScenario
+
+
+API_BASE_URL = "/api/"
+fake = Faker()
+
+
+@pytest.fixture
+def created_staff():
+    """Create staff."""
+    user_data = {**StaffScenario.default_data.value, "auth_user_guid": fake.uuid4()}
+    return StaffScenario.create(user_data)
+
+
+@pytest.fixture
+def created_inspection(created_staff):  # pylint: disable=redefined-outer-name
+    """Create an inspection of an unapproved project, attended by an agency and an officer."""
+    case_file_data = copy.copy(CasefileScenario.default_value.value)
+    case_file_data["case_file_number"] = fake.uuid4()
+    case_file_data["primary_officer_id"] = created_staff.id
+    case_file_data["project_id"] = None
+    case_file = CaseFileService.create(case_file_data)
+    return InspectionService.create(
+        {
+            "case_file_id": case_file.id,
+            "primary_officer_id": created_staff.id,
+            "initiation_id": 1,
+            "start_date": datetime(2024, 10, 1),
+            "end_date": datetime(2024, 10, 2),
+            "inspection_type_ids": [1, 2],
+            "attendance_option_ids": [
+                InspectionAttendanceOptionEnum.AGENCIES.value,
+                InspectionAttendanceOptionEnum.ATTENDING_OFFICERS.value,
+            ],
+            "agency_attendance_ids": [1],
+            "inspection_officer_ids": [created_staff.id],
+            "unapproved_project_authorization": "EAC-1",
+            "unapproved_project_regulated_party": "Proponent Ltd.",
+        }
+    )
+
+
+def test_get_inspection_profile(client, auth_header, created_staff, created_inspection):
+    """Get the inspection and its sections in one request."""
+    # pylint: disable=redefined-outer-name
+    url = urljoin(API_BASE_URL, f"inspections/{created_inspection.id}")
+
+    result = client.get(url + "/profile", headers=auth_header)
+    assert result.status_code == HTTPStatus.OK
+    profile = result.json
+    assert list(profile) == ["inspection", "attendance", "types", "officers", "unapproved_project"]
+    assert profile["inspection"] == client.get(url, headers=auth_header).json
+    assert profile["inspection"]["authorization"] == "EAC-1"
+    assert profile["attendance"] == client.get(url + "/attendance-options", headers=auth_header).json
+    assert [inspection_type["id"] for inspection_type in profile["types"]] == ["1", "2"]
+    assert [officer["id"] for officer in profile["officers"]] == [created_staff.id]
+    assert profile["unapproved_project"]["name"] == UNAPPROVED_PROJECT_NAME
+    assert profile["unapproved_project"]["regulated_party"] == "Proponent Ltd."
+
+
+def test_get_inspection_profile_sections(client, auth_header, created_inspection):
+    """Get only the requested sections of the inspection profile."""
+    # pylint: disable=redefined-outer-name
+    url = urljoin(API_BASE_URL, f"inspections/{created_inspection.id}/profile")
+
+    result = client.get(url + "?include=officers,attendance", headers=auth_header)
+    assert result.status_code == HTTPStatus.OK
+    assert list(result.json) == ["attendance", "officers"]
+    officers = next(
+        entry["data"]
+        for entry in result.json["attendance"]
+        if entry["attendance_option_id"] == InspectionAttendanceOptionEnum.ATTENDING_OFFICERS.value
+    )
+    assert [officer["id"] for officer in officers] == [officer["id"] for officer in result.json["officers"]]
+
+    result = client.get(url + "?include=unknown", headers=auth_header)
+    assert result.status_code == HTTPStatus.BAD_REQUEST
+    result = client.get(urljoin(API_BASE_URL, "inspections/0/profile"), headers=auth_header)
+    assert result.status_code == HTTPStatus.NOT_FOUND
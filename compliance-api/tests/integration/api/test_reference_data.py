@@ -0,0 +1,51 @@
+"""Test suite for reference data."""
+from http import HTTPStatus
+from urllib.parse import urljoin
+
+from faker import Faker
+
+from compliance_api.services.reference_data import REFERENCE_DATA, ReferenceDataService
+from tests.utilities.factory_scenario import AgencyScenario
+from tests.utilities.factory_utils import generate_abbreviation
+
+
+API_BASE_URL = "/api/"
+fake = Faker()
+
+
+def test_get_reference_data(client, auth_header):
+    """Get all the reference data lists, as their own endpoints return them."""
+    url = urljoin(API_BASE_URL, "reference-data")
+
+    result = client.get(url, headers=auth_header)
+    assert result.status_code == HTTPStatus.OK
+    assert result.headers["ETag"]
+    assert set(result.json) == set(REFERENCE_DATA)
+    for name, endpoint in (
+        ("inspection_type_options", "inspections/type-options"),
+        ("attendance_options", "inspections/attendance-options"),
+        ("case_file_initiation_options", "case-files/initiation-options"),
+        ("complaint_sources", "complaints/sources"),
+        ("positions", "positions"),
+        ("agencies", "agencies"),
+    ):
+        assert result.json[name] == client.get(urljoin(API_BASE_URL, endpoint), headers=auth_header).json
+
+
+def test_get_reference_data_not_modified(client, auth_header, mocker):
+    """Get the reference data again only when a table changed."""
+    url = urljoin(API_BASE_URL, "reference-data")
+    etag = client.get(url, headers=auth_header).headers["ETag"]
+    get_all = mocker.spy(ReferenceDataService, "get_all")
+
+    result = client.get(url, headers={**auth_header, "If-None-Match": etag})
+    assert result.status_code == HTTPStatus.NOT_MODIFIED
+    assert not result.data
+    assert get_all.call_count == 0
+
+    agency = AgencyScenario.create({"name": fake.uuid4(), "abbreviation": generate_abbreviation(4)})
+    result = client.get(url, headers={**auth_header, "If-None-Match": etag})
+    assert result.status_code == HTTPStatus.OK
+    assert result.headers["ETag"] != etag
+    assert agency.id in [item["id"] for item in result.json["agencies"]]
+    assert get_all.call_count == 1
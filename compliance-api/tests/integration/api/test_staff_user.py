@@ -224,3 +224,23 @@ def test_delete_user(mock_auth_service, client, auth_header):
     result = client.get(url, headers=auth_header)
 
     assert result.status_code == HTTPStatus.NOT_FOUND
+
+
+def test_create_staff_user_queues_group_update(mock_auth_service, client, auth_header):
+    """Create a user and find its group update pending in the outbox."""
+    mock_get_user_by_guid, mock_update_user_group = mock_auth_service
+    username = fake.uuid4()
+    mock_get_user_by_guid.return_value = {"first_name": "first", "last_name": "last", "username": username}
+    staff_user_data = {"auth_user_guid": username, "permission": "SUPERUSER", "position_id": 1}
+
+    result = client.post(urljoin(API_BASE_URL, "staff-users"), data=json.dumps(staff_user_data), headers=auth_header)
+    assert result.status_code == HTTPStatus.CREATED
+    mock_update_user_group.assert_not_called()
+
+    url = urljoin(API_BASE_URL, f"staff-users/group-updates?status=PENDING&auth_user_guid={username}")
+    result = client.get(url, headers=auth_header)
+    assert result.status_code == HTTPStatus.OK
+    assert [(update["group_name"], update["status"]) for update in result.json] == [("SUPERUSER", "PENDING")]
+
+    result = client.get(urljoin(API_BASE_URL, "staff-users/group-updates?status=UNKNOWN"), headers=auth_header)
+    assert result.status_code == HTTPStatus.BAD_REQUEST
@@ -0,0 +1,90 @@
+# Copyright © 2024 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests to assure the EPIC.Authorize user cache.
+
+Test-Suite to ensure that the user lookups are cached and dropped when a user group is updated.
+"""
+import pytest
+import requests
+from flask import g
+
+from compliance_api.services.authorize_service import auth_service
+from compliance_api.services.authorize_service.auth_service import AuthService
+from compliance_api.utils import request_memo
+from compliance_api.utils.shared_cache import SharedCache
+
+
+GUID = "0f6d5c4b3a2910f6d5c4b3a2910f6d5c"
+
+
+@pytest.fixture
+def auth_upstream(app, mocker, tmp_path, monkeypatch):
+    """Serve the users from a mocked EPIC.Authorize, with empty user caches."""
+    for name in ("USER_CACHE", "APP_USERS_CACHE"):
+        cache = getattr(auth_service, name)
+        monkeypatch.setattr(
+            auth_service,
+            name,
+            SharedCache(cache.namespace, cache.ttl_config, cache.stale_ttl_config, str(tmp_path / "cache.db")),
+        )
+    state = {"group": "Viewer", "calls": []}
+
+    def request(relative_url, http_method, headers, data):  # pylint: disable=unused-argument
+        state["calls"].append(relative_url)
+        response = requests.Response()
+        if relative_url.endswith("/groups"):
+            state["group"] = data["group_name"]
+            response.status_code = 204
+            return response
+        user = {"username": GUID, "groups": [{"name": state["group"], "level": 1}]}
+        response.status_code = 200
+        response._content = requests.compat.json.dumps(  # pylint: disable=protected-access
+            user if relative_url.startswith("users/") else [user]
+        ).encode()
+        return response
+
+    mocker.patch.object(auth_service.AUTH_CLIENT, "request", side_effect=request)
+    return state
+
+
+def _new_request(app):
+    """Return the context of a new request with an access token."""
+    context = app.test_request_context()
+    context.push()
+    request_memo.reset()
+    g.access_token = "token"
+    return context
+
+
+def test_users_are_cached_across_requests(app, auth_upstream):
+    """Assert that the user and the app user list are fetched once for many requests."""
+    for _ in range(3):
+        context = _new_request(app)
+        assert AuthService.get_epic_user_by_guid(GUID)["groups"][0]["name"] == "Viewer"
+        assert AuthService.get_epic_users_by_app()[0]["username"] == GUID
+        context.pop()
+    assert auth_upstream["calls"] == [f"users/{GUID}", "users?app_name=COMPLIANCE"]
+
+
+def test_update_user_group_invalidates(app, auth_upstream):
+    """Assert that the next lookups after a group update see the new group."""
+    context = _new_request(app)
+    AuthService.get_epic_user_by_guid(GUID)
+    AuthService.get_epic_users_by_app()
+    AuthService.update_user_group(GUID, {"app_name": "COMPLIANCE", "group_name": "Admin"})
+    assert AuthService.get_epic_user_by_guid(GUID)["groups"][0]["name"] == "Admin"
+    assert AuthService.get_epic_users_by_app()[0]["groups"][0]["name"] == "Admin"
+    context.pop()
+    assert auth_upstream["calls"].count(f"users/{GUID}") == 2
+    assert auth_upstream["calls"].count("users?app_name=COMPLIANCE") == 2
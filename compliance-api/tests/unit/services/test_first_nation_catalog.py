@@ -0,0 +1,81 @@
+# Copyright © 2024 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests to assure the EPIC.Track first nation catalog.
+
+Test-Suite to ensure that nations are resolved from a single cached catalog.
+"""
+import time
+
+from compliance_api.services.epic_track_service.first_nation_catalog import FirstNationCatalog
+
+
+TRACK_SERVICE = "compliance_api.services.epic_track_service.first_nation_catalog.TrackService"
+NATIONS = [{"id": 1, "name": "Nation One"}, {"id": 2, "name": "Nation Two"}]
+
+
+def test_resolve_loads_catalog_once(app, mocker):
+    """Assert that any number of ids are resolved with a single catalog load."""
+    get_all = mocker.patch(f"{TRACK_SERVICE}.get_first_nations", return_value=NATIONS)
+    get_one = mocker.patch(f"{TRACK_SERVICE}.get_first_nation_by_id")
+    catalog = FirstNationCatalog()
+
+    result = catalog.resolve([1, 2, None])
+    assert result == {1: NATIONS[0], 2: NATIONS[1]}
+    assert catalog.get(2) == NATIONS[1]
+    assert get_all.call_count == 1
+    get_one.assert_not_called()
+
+
+def test_resolve_fetches_unknown_nation(app, mocker):
+    """Assert that a nation missing from the catalog is fetched and kept."""
+    mocker.patch(f"{TRACK_SERVICE}.get_first_nations", return_value=NATIONS)
+    get_one = mocker.patch(
+        f"{TRACK_SERVICE}.get_first_nation_by_id",
+        return_value={"id": 3, "name": "Nation Three", "is_active": True},
+    )
+    catalog = FirstNationCatalog()
+
+    assert catalog.resolve([1, 3]) == {1: NATIONS[0], 3: {"id": 3, "name": "Nation Three"}}
+    assert catalog.get(3) == {"id": 3, "name": "Nation Three"}
+    get_one.assert_called_once_with(3)
+
+
+def test_expired_catalog_is_reloaded(app, mocker, monkeypatch):
+    """Assert that the catalog is reloaded once the ttl has passed."""
+    get_all = mocker.patch(f"{TRACK_SERVICE}.get_first_nations", return_value=NATIONS)
+    catalog = FirstNationCatalog()
+    catalog.resolve([1])
+
+    monkeypatch.setitem(app.config, "FIRST_NATION_CACHE_TTL", 0)
+    catalog.resolve([1])
+    assert get_all.call_count == 2
+
+
+def test_stale_catalog_is_refreshed_in_background(app, mocker, monkeypatch):
+    """Assert that a stale catalog is served while it is refreshed in the background."""
+    get_all = mocker.patch(f"{TRACK_SERVICE}.get_first_nations", return_value=NATIONS)
+    catalog = FirstNationCatalog()
+    catalog.resolve([1])
+
+    renamed = [{"id": 1, "name": "Renamed"}]
+    get_all.return_value = renamed
+    monkeypatch.setitem(app.config, "FIRST_NATION_CACHE_REFRESH_AGE", 0)
+    assert catalog.resolve([1]) == {1: NATIONS[0]}
+
+    for _ in range(50):
+        if not catalog._refreshing:  # pylint: disable=protected-access
+            break
+        time.sleep(0.01)
+    monkeypatch.setitem(app.config, "FIRST_NATION_CACHE_REFRESH_AGE", 3600)
+    assert catalog.resolve([1]) == {1: renamed[0]}
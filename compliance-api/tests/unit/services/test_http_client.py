@@ -0,0 +1,152 @@
+# Copyright © 2024 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests to assure the pooled outbound HTTP client.
+
+Test-Suite to ensure that the upstream sessions are pooled per worker process.
+"""
+import pytest
+import requests
+
+from compliance_api.exceptions import UpstreamUnavailableError
+from compliance_api.services.http_client import OutboundClient, get_endpoint
+from compliance_api.services.http_client.circuit_breaker import BreakerState
+from compliance_api.utils.enum import HttpMethod
+
+
+def test_session_is_reused_within_process():
+    """Assert that the same keep-alive session is returned for repeated calls."""
+    client = OutboundClient("test", "EPIC_TRACK_URL", "api/v1")
+    assert client.session is client.session
+
+
+def test_session_is_recreated_after_fork(monkeypatch):
+    """Assert that a forked worker does not re-use the parent session."""
+    client = OutboundClient("test", "EPIC_TRACK_URL", "api/v1")
+    parent_session = client.session
+    monkeypatch.setattr("compliance_api.services.http_client.client.os.getpid", lambda: -1)
+    assert client.session is not parent_session
+
+
+def test_pool_size_from_config(app):
+    """Assert that the adapter pool is sized from the configuration."""
+    client = OutboundClient("test", "EPIC_TRACK_URL", "api/v1")
+    adapter = client.session.get_adapter("https://track.example.com")
+    assert adapter._pool_connections == app.config["OUTBOUND_POOL_CONNECTIONS"]  # pylint: disable=protected-access
+    assert adapter._pool_maxsize == app.config["OUTBOUND_POOL_MAXSIZE"]  # pylint: disable=protected-access
+
+
+def test_request_uses_base_url_and_timeouts(app, mocker, monkeypatch):
+    """Assert that the request is sent to the upstream with the connect and read timeouts."""
+    monkeypatch.setitem(app.config, "EPIC_TRACK_URL", "https://track.example.com")
+    client = OutboundClient("test", "EPIC_TRACK_URL", "api/v1")
+    mock_request = mocker.patch.object(client.session, "request", return_value=_response(200))
+
+    client.request("projects/1", HttpMethod.GET, {"Authorization": "Bearer x"})
+
+    mock_request.assert_called_once_with(
+        "GET",
+        "https://track.example.com/api/v1/projects/1",
+        headers={"Authorization": "Bearer x"},
+        json=None,
+        timeout=mocker.ANY,
+    )
+    connect_timeout, read_timeout = mock_request.call_args.kwargs["timeout"]
+    assert connect_timeout == app.config["OUTBOUND_CONNECT_TIMEOUT"]
+    assert 0 < read_timeout <= min(app.config["OUTBOUND_READ_TIMEOUT"], app.config["OUTBOUND_DEADLINE"])
+
+
+def test_get_endpoint():
+    """Assert that resource ids and the query are left out of the endpoint."""
+    assert get_endpoint("projects/12") == "projects/{id}"
+    assert get_endpoint("users/f1e2d3c4b5a6f1e2d3c4b5a6f1e2d3c4/groups") == "users/{id}/groups"
+    assert get_endpoint("users?app_name=COMPLIANCE") == "users"
+
+
+def test_get_is_retried_on_unavailable(app, mocker, monkeypatch):
+    """Assert that a GET is retried on 503 and a PUT is not."""
+    monkeypatch.setitem(app.config, "OUTBOUND_RETRY_BACKOFF", 0)
+    client = OutboundClient("test-retry", "EPIC_TRACK_URL", "api/v1")
+    mock_request = mocker.patch.object(
+        client.session, "request", side_effect=[_response(503), _response(200)]
+    )
+    assert client.request("projects/1").status_code == 200
+    assert mock_request.call_count == 2
+
+    mock_request = mocker.patch.object(client.session, "request", return_value=_response(503))
+    assert client.request("projects/1", HttpMethod.PUT, data={}).status_code == 503
+    assert mock_request.call_count == 1
+
+
+def test_connection_errors_raise_unavailable(app, mocker, monkeypatch):
+    """Assert that a call failing on every attempt raises UpstreamUnavailableError."""
+    monkeypatch.setitem(app.config, "OUTBOUND_RETRY_BACKOFF", 0)
+    client = OutboundClient("test-errors", "EPIC_TRACK_URL", "api/v1")
+    mock_request = mocker.patch.object(
+        client.session, "request", side_effect=requests.ConnectionError("refused")
+    )
+    with pytest.raises(UpstreamUnavailableError):
+        client.request("projects/1")
+    assert mock_request.call_count == 1 + app.config["OUTBOUND_MAX_RETRIES"]
+
+
+def test_circuit_breaker_opens_and_recovers(app, client, mocker, monkeypatch):
+    """Assert that the breaker fails fast once open and closes after a successful trial."""
+    monkeypatch.setitem(app.config, "OUTBOUND_MAX_RETRIES", 0)
+    monkeypatch.setitem(app.config, "CIRCUIT_BREAKER_FAILURE_THRESHOLD", 2)
+    outbound = OutboundClient("test-breaker", "EPIC_TRACK_URL", "api/v1")
+    mock_request = mocker.patch.object(
+        outbound.session, "request", side_effect=requests.Timeout("slow")
+    )
+    for _ in range(3):
+        with pytest.raises(UpstreamUnavailableError):
+            outbound.request("projects/1")
+    assert mock_request.call_count == 2
+    assert outbound.breaker.state == BreakerState.OPEN
+
+    states = client.get("/ops/circuit-breakers").json["circuit_breakers"]
+    assert {"name": "test-breaker", "state": "open"}.items() <= next(
+        state for state in states if state["name"] == "test-breaker"
+    ).items()
+
+    monkeypatch.setitem(app.config, "CIRCUIT_BREAKER_RESET_TIMEOUT", 0)
+    mocker.patch.object(outbound.session, "request", return_value=_response(200))
+    assert outbound.request("projects/1").status_code == 200
+    assert outbound.breaker.state == BreakerState.CLOSED
+
+
+def test_failed_trial_reopens_breaker(app, mocker, monkeypatch):
+    """Assert that a half-open trial failing with any request error re-opens the breaker."""
+    monkeypatch.setitem(app.config, "OUTBOUND_MAX_RETRIES", 0)
+    monkeypatch.setitem(app.config, "CIRCUIT_BREAKER_FAILURE_THRESHOLD", 1)
+    monkeypatch.setitem(app.config, "CIRCUIT_BREAKER_RESET_TIMEOUT", 0)
+    outbound = OutboundClient("test-trial", "EPIC_TRACK_URL", "api/v1")
+    mocker.patch.object(
+        outbound.session, "request", side_effect=requests.exceptions.ChunkedEncodingError("broken")
+    )
+    for _ in range(2):
+        with pytest.raises(UpstreamUnavailableError):
+            outbound.request("projects/1")
+    assert outbound.breaker.state == BreakerState.HALF_OPEN
+
+    mock_request = mocker.patch.object(outbound.session, "request", return_value=_response(200))
+    assert outbound.request("projects/1").status_code == 200
+    assert mock_request.call_count == 1
+    assert outbound.breaker.state == BreakerState.CLOSED
+
+
+def _response(status_code):
+    """Return a response with the status code."""
+    response = requests.Response()
+    response.status_code = status_code
+    return response
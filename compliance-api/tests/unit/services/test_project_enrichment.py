@@ -0,0 +1,80 @@
+# Copyright © 2024 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests to assure the bulk project enrichment.
+
+Test-Suite to ensure that the project parameters are set with one lookup per project.
+"""
+from types import SimpleNamespace
+
+from compliance_api.services import project_enrichment
+from compliance_api.services.project_enrichment import set_project_parameters
+
+
+def _project(synced, **kwargs):
+    return SimpleNamespace(is_synced=synced, **kwargs)
+
+
+def test_set_project_parameters(app, monkeypatch):
+    """Assert that every source is read and unsynced projects are fetched once."""
+    fetched = []
+
+    def get_project_by_id(project_id):
+        fetched.append(project_id)
+        return {
+            "ea_certificate": "T-1",
+            "type": {"name": "Mines"},
+            "sub_type": None,
+            "proponent": {"name": "Track Ltd."},
+        }
+
+    monkeypatch.setattr(
+        project_enrichment.TrackService, "get_project_by_id", get_project_by_id
+    )
+    synced = _project(
+        True, ea_certificate="S-1", type="Energy", sub_type="Pipelines", proponent="Synced Inc."
+    )
+    unsynced = _project(False)
+    entities = [
+        SimpleNamespace(id=1, project_id=10, project=synced),
+        SimpleNamespace(id=2, project_id=20, project=unsynced),
+        SimpleNamespace(id=3, project_id=20, project=unsynced),
+        SimpleNamespace(id=4, project_id=None, project=None),
+        SimpleNamespace(id=5, project_id=None, project=None),
+    ]
+    requested_ids = []
+
+    def get_unapproved_projects(entity_ids):
+        requested_ids.append(entity_ids)
+        return {
+            4: SimpleNamespace(
+                authorization="U-1", type="Other", sub_type=None, regulated_party="Unapproved Co."
+            )
+        }
+
+    with app.test_request_context():
+        set_project_parameters(entities, get_unapproved_projects)
+
+    assert fetched == [20]
+    assert requested_ids == [[4, 5]]
+    parameters = [
+        (entity.authorization, entity.type, entity.sub_type, entity.regulated_party)
+        for entity in entities[:4]
+    ]
+    assert parameters == [
+        ("S-1", "Energy", "Pipelines", "Synced Inc."),
+        ("T-1", "Mines", None, "Track Ltd."),
+        ("T-1", "Mines", None, "Track Ltd."),
+        ("U-1", "Other", None, "Unapproved Co."),
+    ]
+    assert not hasattr(entities[4], "authorization")
@@ -0,0 +1,137 @@
+# Copyright © 2024 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests to assure the EPIC.Track project sync.
+
+Test-Suite to ensure that the projects are mirrored from a local EPIC.Track stub.
+"""
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+
+from compliance_api import start_background_jobs
+from compliance_api.models import Project as ProjectModel
+from compliance_api.models import db
+from compliance_api.services.project_sync import ProjectSyncService
+
+
+TRACK_PROJECTS = [
+    {
+        "id": 990001,
+        "name": "Stub Mine",
+        "abbreviation": "STUBM",
+        "ea_certificate": "M99-01",
+        "type": {"id": 1, "name": "Mines"},
+        "sub_type": {"id": 2, "name": "Coal Mines"},
+        "proponent": {"id": 3, "name": "Stub Mining Ltd."},
+    },
+    {
+        "id": 990002,
+        "name": "Stub Pipeline",
+        "abbreviation": "STUBP",
+        "ea_certificate": None,
+        "type": {"id": 4, "name": "Energy-Petroleum & Natural Gas"},
+        "sub_type": {"id": 5, "name": "Transmission Pipelines"},
+        "proponent": {"id": 6, "name": "Stub Energy Inc."},
+    },
+]
+
+
+@pytest.fixture
+def track_stub(app, monkeypatch):
+    """Serve the projects list of EPIC.Track from a local HTTP server."""
+    state = {"projects": [dict(project) for project in TRACK_PROJECTS], "tokens": []}
+
+    class Handler(BaseHTTPRequestHandler):
+        """Stub of the EPIC.Track projects endpoint."""
+
+        def do_GET(self):  # noqa: N802 pylint: disable=invalid-name
+            """Return the projects."""
+            state["tokens"].append(self.headers.get("Authorization"))
+            body = json.dumps(state["projects"]).encode("utf-8")
+            self.send_response(200 if self.path == "/api/v1/projects" else 404)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):  # pylint: disable=arguments-differ
+            """Keep the test output quiet."""
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setitem(app.config, "EPIC_TRACK_URL", f"http://127.0.0.1:{server.server_port}")
+    yield state
+    server.shutdown()
+    server.server_close()
+
+
+def test_sync_creates_and_updates_projects(track_stub):
+    """Assert that new projects are inserted and only changed ones are updated."""
+    result = ProjectSyncService.sync(token="stub-token")
+    assert result == {"created": 2, "updated": 0, "unchanged": 0, "skipped": False}
+    assert track_stub["tokens"] == ["Bearer stub-token"]
+
+    db.session.expire_all()
+    project = ProjectModel.find_by_id(990001)
+    assert project.is_synced
+    assert project.abbreviation == "STUBM"
+    assert project.type == "Mines"
+    assert project.sub_type == "Coal Mines"
+    assert project.proponent == "Stub Mining Ltd."
+    assert project.created_by == "system"
+
+    track_stub["projects"][1]["proponent"] = {"id": 7, "name": "New Owner Corp."}
+    result = ProjectSyncService.sync(token="stub-token")
+    assert result == {"created": 0, "updated": 1, "unchanged": 1, "skipped": False}
+
+    db.session.expire_all()
+    assert ProjectModel.find_by_id(990002).proponent == "New Owner Corp."
+
+
+def test_sync_invalidates_cached_project(track_stub, mocker):
+    """Assert that updated projects are dropped from the shared project cache."""
+    ProjectSyncService.sync(token="stub-token")
+    invalidate = mocker.patch(
+        "compliance_api.services.project_sync.TrackService.invalidate_project"
+    )
+    track_stub["projects"][0]["ea_certificate"] = "M99-02"
+
+    ProjectSyncService.sync(token="stub-token")
+    invalidate.assert_called_once_with(990001)
+
+
+def test_sync_skipped_when_synced_recently(app, track_stub, monkeypatch):
+    """Assert that a sync within the interval of the last one does not call EPIC.Track."""
+    monkeypatch.setitem(app.config, "PROJECT_SYNC_INTERVAL", 900)
+    assert not ProjectSyncService.sync(token="stub-token", force=True)["skipped"]
+    assert ProjectSyncService.sync(token="stub-token")["skipped"]
+    assert track_stub["tokens"] == ["Bearer stub-token"]
+
+    monkeypatch.setitem(app.config, "PROJECT_SYNC_INTERVAL", 0)
+    assert not ProjectSyncService.sync(token="stub-token")["skipped"]
+    assert len(track_stub["tokens"]) == 2
+
+
+def test_background_jobs_not_started_by_default(app, mocker, monkeypatch):
+    """Assert that the scheduled jobs only start when the process enables them."""
+    start_scheduler = mocker.patch("compliance_api.services.project_sync.start_project_sync_scheduler")
+    monkeypatch.setitem(app.config, "PROJECT_SYNC_INTERVAL", 900)
+    start_background_jobs(app)
+    start_scheduler.assert_not_called()
+
+    monkeypatch.setitem(app.config, "BACKGROUND_JOBS_ENABLED", True)
+    start_background_jobs(app)
+    start_scheduler.assert_called_once_with(app)
@@ -0,0 +1,140 @@
+# Copyright © 2024 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests to assure the outbox of the staff user group updates.
+
+Test-Suite to ensure that the group updates are delivered to EPIC.Authorize with retries.
+"""
+from datetime import datetime
+
+import pytest
+from faker import Faker
+from sqlalchemy import select
+
+from compliance_api.exceptions import UpstreamUnavailableError
+from compliance_api.models import GroupUpdateStatusEnum
+from compliance_api.models import StaffUserGroupUpdate as StaffUserGroupUpdateModel
+from compliance_api.models import db
+from compliance_api.services import StaffUserGroupUpdateService
+
+
+fake = Faker()
+UPDATE_USER_GROUP = "compliance_api.services.authorize_service.auth_service.AuthService.update_user_group"
+
+
+@pytest.fixture
+def pending_update():
+    """Add a pending group update, superseding an older one of the same user."""
+    auth_user_guid = fake.uuid4()
+    older = StaffUserGroupUpdateModel.add_pending(auth_user_guid, "COMPLIANCE", "VIEWER")
+    latest = StaffUserGroupUpdateModel.add_pending(auth_user_guid, "COMPLIANCE", "ADMIN")
+    db.session.commit()
+    yield older.id, latest.id
+    StaffUserGroupUpdateModel.query.filter_by(auth_user_guid=auth_user_guid).delete()
+    db.session.commit()
+
+
+def test_dispatch_delivers_latest_group(app, mocker, pending_update):
+    """Assert that only the latest pending update of a user is delivered."""
+    older_id, latest_id = pending_update
+    mock_update = mocker.patch(UPDATE_USER_GROUP, return_value={})
+
+    result = StaffUserGroupUpdateService.dispatch(token="token")
+
+    assert result["delivered"] >= 1
+    db.session.expire_all()
+    older, latest = db.session.get(StaffUserGroupUpdateModel, older_id), db.session.get(
+        StaffUserGroupUpdateModel, latest_id
+    )
+    assert older.status == GroupUpdateStatusEnum.SUPERSEDED
+    assert latest.status == GroupUpdateStatusEnum.DELIVERED
+    assert latest.attempts == 1
+    assert latest.delivered_at is not None
+    mock_update.assert_any_call(
+        latest.auth_user_guid, {"app_name": "COMPLIANCE", "group_name": "ADMIN"}, "token"
+    )
+    assert all(call.args[0] != latest.auth_user_guid or call.args[1]["group_name"] == "ADMIN"
+               for call in mock_update.call_args_list)
+
+
+def test_dispatch_retries_later_then_fails(app, mocker, monkeypatch, pending_update):
+    """Assert that a failed delivery is retried after a backoff until the last attempt."""
+    _, latest_id = pending_update
+    monkeypatch.setitem(app.config, "AUTH_OUTBOX_MAX_ATTEMPTS", 2)
+    monkeypatch.setitem(app.config, "AUTH_OUTBOX_RETRY_BACKOFF", 0)
+    mocker.patch(UPDATE_USER_GROUP, side_effect=UpstreamUnavailableError("epic_authorize is unavailable"))
+
+    StaffUserGroupUpdateService.dispatch(token="token")
+    db.session.expire_all()
+    latest = db.session.get(StaffUserGroupUpdateModel, latest_id)
+    assert latest.status == GroupUpdateStatusEnum.PENDING
+    assert latest.attempts == 1
+    assert latest.next_attempt_at <= datetime.utcnow()
+    assert "unavailable" in latest.last_error
+
+    StaffUserGroupUpdateService.dispatch(token="token")
+    db.session.expire_all()
+    latest = db.session.get(StaffUserGroupUpdateModel, latest_id)
+    assert latest.status == GroupUpdateStatusEnum.FAILED
+    assert latest.attempts == 2
+
+    assert latest_id in [
+        group_update.id for group_update in StaffUserGroupUpdateService.get_group_updates("FAILED")
+    ]
+
+
+def test_dispatch_delivers_outside_the_transaction(app, mocker, pending_update):
+    """Assert that the update is leased and committed, not locked, while EPIC.Authorize is called."""
+    _, latest_id = pending_update
+    table = StaffUserGroupUpdateModel.__table__
+    seen = {}
+
+    def update_user_group(*_):
+        with db.engine.connect() as connection:
+            seen["lease_until"] = connection.execute(
+                select(table.c.lease_until).where(table.c.id == latest_id).with_for_update(nowait=True)
+            ).scalar_one()
+        return {}
+
+    mocker.patch(UPDATE_USER_GROUP, side_effect=update_user_group)
+
+    StaffUserGroupUpdateService.dispatch(token="token")
+
+    assert seen["lease_until"] > datetime.utcnow()
+    db.session.expire_all()
+    latest = db.session.get(StaffUserGroupUpdateModel, latest_id)
+    assert latest.status == GroupUpdateStatusEnum.DELIVERED
+    assert latest.lease_until is None
+
+
+def test_dispatch_keeps_update_superseded_while_delivered(app, mocker, pending_update):
+    """Assert that an update superseded during its delivery is not marked delivered."""
+    _, latest_id = pending_update
+    newer = {}
+
+    def update_user_group(auth_user_guid, *_):
+        if not newer:
+            newer["update"] = StaffUserGroupUpdateModel.add_pending(auth_user_guid, "COMPLIANCE", "VIEWER")
+            db.session.commit()
+        return {}
+
+    mocker.patch(UPDATE_USER_GROUP, side_effect=update_user_group)
+
+    StaffUserGroupUpdateService.dispatch(token="token")
+
+    db.session.expire_all()
+    latest = db.session.get(StaffUserGroupUpdateModel, latest_id)
+    assert latest.status == GroupUpdateStatusEnum.SUPERSEDED
+    assert latest.delivered_at is not None
+    assert latest.lease_until is None
+    assert db.session.get(StaffUserGroupUpdateModel, newer["update"].id).status == GroupUpdateStatusEnum.DELIVERED
@@ -0,0 +1,81 @@
+# Copyright © 2024 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests to assure the authorization decision cache.
+
+Test-Suite to ensure that the assignment decisions are reused until invalidated.
+"""
+import pytest
+
+from compliance_api.utils import authorization_cache
+from compliance_api.utils.enum import ContextEnum
+
+
+@pytest.fixture(autouse=True)
+def empty_cache(app):
+    """Start every test with an empty cache."""
+    authorization_cache.clear()
+    yield
+    authorization_cache.clear()
+
+
+class _Check:
+    """Assignment check counting its calls."""
+
+    def __init__(self, decision):
+        self.decision = decision
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.decision
+
+
+def test_decision_is_reused(app):
+    """Assert that the check runs once per user and record."""
+    check = _Check(False)
+    for _ in range(3):
+        assert authorization_cache.get_or_check(ContextEnum.INSPECTION, 1, "user", check) is False
+    assert check.calls == 1
+    authorization_cache.get_or_check(ContextEnum.INSPECTION, "1", "other", check)
+    authorization_cache.get_or_check(ContextEnum.CASE_FILE, 1, "user", check)
+    assert check.calls == 3
+
+
+def test_invalidate_drops_the_decisions_of_the_record(app):
+    """Assert that the decisions of the record are checked again after an invalidation."""
+    check = _Check(True)
+    authorization_cache.get_or_check(ContextEnum.CASE_FILE, 7, "user", check)
+    authorization_cache.get_or_check(ContextEnum.CASE_FILE, 8, "user", check)
+    authorization_cache.invalidate(ContextEnum.CASE_FILE, 7)
+    authorization_cache.get_or_check(ContextEnum.CASE_FILE, 7, "user", check)
+    authorization_cache.get_or_check(ContextEnum.CASE_FILE, 8, "user", check)
+    assert check.calls == 3
+
+
+def test_cache_is_bounded(app, monkeypatch):
+    """Assert that the least recently used records are dropped."""
+    monkeypatch.setitem(app.config, "AUTHORIZATION_CACHE_SIZE", 2)
+    check = _Check(True)
+    for entity_id in (1, 2, 3, 1):
+        authorization_cache.get_or_check(ContextEnum.COMPLAINT, entity_id, "user", check)
+    assert check.calls == 4
+
+
+def test_zero_ttl_disables_the_cache(app, monkeypatch):
+    """Assert that every check runs when the ttl is 0."""
+    monkeypatch.setitem(app.config, "AUTHORIZATION_CACHE_TTL", 0)
+    check = _Check(True)
+    for _ in range(2):
+        authorization_cache.get_or_check(ContextEnum.INSPECTION, 1, "user", check)
+    assert check.calls == 2
@@ -0,0 +1,58 @@
+# Copyright © 2024 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests to assure the compiled schemas.
+
+Test-Suite to ensure that the compiled schemas dump exactly what the marshmallow schemas dump.
+"""
+import json
+
+import pytest
+
+from compliance_api.schemas import CaseFileSchema, ComplaintSchema, InspectionSchema, StaffUserSchema
+from compliance_api.schemas.compiled_schema import compile_schema
+from tests.utilities.transient_models import build_case_file, build_complaint, build_inspection, build_staff_user
+
+
+@pytest.mark.parametrize(
+    "schema_class, build, only",
+    [
+        (InspectionSchema, build_inspection, None),
+        (InspectionSchema, build_inspection, ("id", "ir_number", "inspection_status", "primary_officer.full_name")),
+        (ComplaintSchema, build_complaint, None),
+        (ComplaintSchema, build_complaint, ("id", "status", "source_first_nation", "requirement_detail")),
+        (CaseFileSchema, build_case_file, None),
+        (CaseFileSchema, build_case_file, ("case_file_number", "project", "date_created")),
+        (StaffUserSchema, build_staff_user, None),
+    ],
+)
+def test_compiled_dump_matches_schema(schema_class, build, only):
+    """Assert that the compiled schema output is byte for byte the one of the schema."""
+    rows = [build(index) for index in range(1, 7)]
+    context = {"sparse_fields": True} if only else {}
+    expected = schema_class(many=True, only=only, context=context).dump(rows)
+    compiled = compile_schema(schema_class, only=only, context=context)
+    assert json.dumps(compiled.dump(rows)) == json.dumps(expected)
+    assert json.dumps(compiled.dump(rows[0], many=False)) == json.dumps(
+        schema_class(only=only, context=context).dump(rows[0])
+    )
+
+
+def test_compiled_schemas_are_cached():
+    """Assert that a schema is compiled once for the same fields and context."""
+    first = compile_schema(CaseFileSchema, only=["id", "case_file_number"])
+    assert compile_schema(CaseFileSchema, only=("id", "case_file_number", "id")) is first
+    assert compile_schema(CaseFileSchema, only=("id", "case_file_number"), context={"sparse_fields": True}) is not first
+    assert compile_schema(CaseFileSchema) is not first
+    with pytest.raises(ValueError):
+        compile_schema(CaseFileSchema, only=["primary_officer.unknown"])
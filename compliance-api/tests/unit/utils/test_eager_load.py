@@ -0,0 +1,64 @@
+# Copyright © 2024 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests to assure the eager loading plans.
+
+Test-Suite to ensure that the plans load the relationships the schemas dump.
+"""
+import pytest
+from marshmallow import fields
+
+from compliance_api.models import CaseFile, Inspection
+from compliance_api.schemas import CaseFileSchema, InspectionSchema
+from compliance_api.schemas.base_schema import AutoSchemaBase
+from compliance_api.schemas.eager_load import eager_load_options
+
+
+def _planned_paths(options) -> set:
+    """Return the relationship paths of the options and of their sub-options, as dotted names."""
+    return {
+        ".".join(str(token.key) for token in context.path.path[1::2])
+        for option in options
+        for context in option.context
+    }
+
+
+def test_plan_of_nested_and_method_fields():
+    """Assert that the nested relationships and the ones declared by the Method fields are planned."""
+    paths = _planned_paths(eager_load_options(InspectionSchema()))
+    assert {"types", "types.type", "case_file", "primary_officer"} <= paths
+
+    paths = _planned_paths(eager_load_options(CaseFileSchema()))
+    assert {"primary_officer.deputy_director", "primary_officer.supervisor"} <= paths
+    assert eager_load_options(CaseFileSchema(only=("id", "case_file_number")), CaseFile) == []
+
+
+def test_plan_of_unknown_path():
+    """Assert that a Method field declaring an unknown relationship is rejected."""
+
+    class BrokenSchema(AutoSchemaBase):  # pylint: disable=too-many-ancestors
+        """Schema declaring a column as a relationship."""
+
+        class Meta(AutoSchemaBase.Meta):  # pylint: disable=too-few-public-methods
+            """Meta."""
+
+            model = Inspection
+
+        names = fields.Method("get_names", metadata={"loads": ("types.name",)})
+
+        def get_names(self, obj):  # pylint: disable=no-self-use
+            """Get the names."""
+            return [inspection_type.name for inspection_type in obj.types]
+
+    with pytest.raises(ValueError):
+        eager_load_options(BrokenSchema())
@@ -0,0 +1,68 @@
+# Copyright © 2024 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests to assure the concurrent fan-out of outbound lookups.
+
+Test-Suite to ensure that lookups run concurrently within the request context.
+"""
+import threading
+import time
+
+import pytest
+from flask import g
+
+from compliance_api.exceptions import UpstreamUnavailableError
+from compliance_api.utils.fan_out import fan_out
+
+
+def test_calls_run_concurrently_with_request_token(app):
+    """Assert that the calls overlap and see the access token of the request."""
+    barrier = threading.Barrier(3, timeout=5)
+
+    def lookup(name):
+        barrier.wait()
+        return name, g.access_token, threading.current_thread().name
+
+    with app.test_request_context():
+        g.access_token = "request-token"
+        started = time.monotonic()
+        results = fan_out({key: (lambda key=key: lookup(key)) for key in ("a", "b", "c")})
+        assert time.monotonic() - started < 5
+
+    assert {key: value[:2] for key, value in results.items()} == {
+        "a": ("a", "request-token"),
+        "b": ("b", "request-token"),
+        "c": ("c", "request-token"),
+    }
+    assert all(value[2].startswith("fan-out") for value in results.values())
+
+
+def test_errors_are_raised(app):
+    """Assert that an error raised by a call is raised by the fan-out."""
+    def failing():
+        raise UpstreamUnavailableError("epic_track is unavailable")
+
+    with app.test_request_context():
+        with pytest.raises(UpstreamUnavailableError):
+            fan_out({"ok": lambda: 1, "failing": failing})
+
+
+def test_fan_out_timeout(app, monkeypatch):
+    """Assert that a fan-out not finished in time raises UpstreamUnavailableError."""
+    monkeypatch.setitem(app.config, "FAN_OUT_TIMEOUT", 0.05)
+    release = threading.Event()
+
+    with app.test_request_context():
+        with pytest.raises(UpstreamUnavailableError):
+            fan_out({"slow": lambda: release.wait(5), "fast": lambda: 1})
+    release.set()
@@ -0,0 +1,103 @@
+# Copyright © 2024 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests to assure the JWKS prefetch and background reload.
+
+Test-Suite to ensure that verifying a token does not wait on the identity server.
+"""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+from flask import Flask
+
+from compliance_api.utils.jwt_manager import CachedJwtManager
+
+
+def _key(kid):
+    return {"kid": kid, "kty": "RSA", "use": "sig", "n": "n", "e": "AQAB"}
+
+
+@pytest.fixture
+def jwks_stub():
+    """Serve a JWKS from a local HTTP server, counting the fetches."""
+    state = {"keys": [_key("first")], "fetches": 0}
+
+    class Handler(BaseHTTPRequestHandler):
+        """Stub of the JWKS endpoint of the identity server."""
+
+        def do_GET(self):  # noqa: N802 pylint: disable=invalid-name
+            """Return the keys."""
+            state["fetches"] += 1
+            body = json.dumps({"keys": state["keys"]}).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):  # pylint: disable=arguments-differ
+            """Keep the test output quiet."""
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    state["url"] = f"http://127.0.0.1:{server.server_port}/certs"
+    yield state
+    server.shutdown()
+    server.server_close()
+
+
+def _create_manager(jwks_uri, refresh_interval):
+    """Return a manager set up like the app does, against the stub."""
+    app = Flask(__name__)
+    app.config.update(
+        JWT_OIDC_JWKS_URI=jwks_uri,
+        JWT_OIDC_ISSUER="issuer",
+        JWT_OIDC_JWKS_CACHE_TIMEOUT=refresh_interval,
+        OUTBOUND_CONNECT_TIMEOUT=1,
+        OUTBOUND_READ_TIMEOUT=1,
+    )
+    manager = CachedJwtManager()
+    manager.init_app(app)
+    manager.prefetch_jwks()
+    return manager
+
+
+def test_keys_are_prefetched_and_reloaded_for_unknown_kid(jwks_stub):
+    """Assert that the keys are loaded once up front and reloaded only for a new key."""
+    manager = _create_manager(jwks_stub["url"], 3600)
+    assert jwks_stub["fetches"] == 1
+    assert manager.get_rsa_key(manager.get_jwks(), "first")["kid"] == "first"
+    assert jwks_stub["fetches"] == 1
+
+    jwks_stub["keys"].append(_key("rotated"))
+    assert not manager.get_rsa_key(manager.get_jwks(), "rotated")
+    assert jwks_stub["fetches"] == 1
+
+    manager._jwks_loaded_at -= 60  # pylint: disable=protected-access
+    assert manager.get_rsa_key(manager.get_jwks(), "rotated")["kid"] == "rotated"
+    assert jwks_stub["fetches"] == 2
+
+
+def test_keys_are_reloaded_in_background(jwks_stub):
+    """Assert that the keys are reloaded without a request asking for them."""
+    manager = _create_manager(jwks_stub["url"], 0.05)
+    jwks_stub["keys"] = [_key("rotated")]
+    deadline = time.monotonic() + 5
+    while not manager.get_rsa_key(manager.get_jwks(), "rotated") and time.monotonic() < deadline:
+        time.sleep(0.05)
+    manager._jwks_refresh_interval = 3600  # pylint: disable=protected-access
+    assert manager.get_rsa_key(manager.get_jwks(), "rotated")
+    assert jwks_stub["fetches"] >= 2
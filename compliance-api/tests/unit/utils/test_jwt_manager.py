@@ -0,0 +1,58 @@
+# Copyright © 2024 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests to assure the verified claims cache of the JWT manager.
+
+Test-Suite to ensure that a token is verified once for its lifetime.
+"""
+import time
+from http import HTTPStatus
+
+import pytest
+from flask_jwt_oidc import jwt_manager
+
+from tests.utilities.factory_scenario import TokenJWTClaims
+from tests.utilities.factory_utils import factory_auth_header
+
+
+URL = "/api/staff-users/permissions"
+
+
+@pytest.fixture
+def decode_spy(jwt, mocker):
+    """Spy on the signature verification, starting with an empty claims cache."""
+    jwt.clear_claims()
+    return mocker.spy(jwt_manager.jwt, "decode")
+
+
+def test_token_is_verified_once(jwt, client, decode_spy):
+    """Assert that the signature of a token is checked once for many requests."""
+    headers = factory_auth_header(jwt, {**TokenJWTClaims.default, "exp": int(time.time()) + 300})
+    for _ in range(3):
+        assert client.get(URL, headers=headers).status_code == HTTPStatus.OK
+    assert decode_spy.call_count == 1
+
+
+def test_token_without_expiry_is_not_cached(jwt, client, decode_spy):
+    """Assert that a token without expiry is verified on every request."""
+    headers = factory_auth_header(jwt, TokenJWTClaims.default)
+    for _ in range(2):
+        assert client.get(URL, headers=headers).status_code == HTTPStatus.OK
+    assert decode_spy.call_count >= 2
+
+
+def test_tampered_token_is_rejected(jwt, client, decode_spy):  # pylint: disable=unused-argument
+    """Assert that a token whose signature does not match is rejected before the group check."""
+    headers = factory_auth_header(jwt, {**TokenJWTClaims.default, "exp": int(time.time()) + 300})
+    headers["Authorization"] = headers["Authorization"][:-4] + "AAAA"
+    assert client.get(URL, headers=headers).status_code == HTTPStatus.UNAUTHORIZED
@@ -0,0 +1,99 @@
+# Copyright © 2024 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests to assure the list query specs.
+
+Test-Suite to ensure that the query arguments are parsed into conditions and sorts, and invalid ones are rejected.
+"""
+from datetime import datetime
+
+import pytest
+from sqlalchemy import select
+from werkzeug.datastructures import MultiDict
+
+from compliance_api.models import CaseFile
+from compliance_api.models.case_file import CaseFileStatusEnum
+from compliance_api.models.list_query import EQ, IN, PREFIX, RANGE, FilterField, ListQuerySpec
+
+
+SPEC = ListQuerySpec(
+    CaseFile,
+    filters=[
+        FilterField("case_file_number", (EQ, PREFIX)),
+        FilterField("case_file_status", (EQ, IN)),
+        FilterField("date_created", (RANGE,)),
+    ],
+    sorts=("id", "date_created"),
+    fields=("id", "case_file_number", "case_file_status", "primary_officer", "project"),
+)
+
+
+def test_parse_operators():
+    """Assert that each operator is parsed into its condition with converted values."""
+    query = SPEC.parse(
+        MultiDict(
+            [
+                ("case_file_status__in", "OPEN,CLOSED"),
+                ("date_created__gte", "2024-01-01"),
+                ("date_created__lt", "2024-02-01T00:00:00"),
+                ("case_file_number__prefix", "CF_1%"),
+                ("unrelated", "ignored"),
+                ("sort", "-date_created"),
+            ]
+        )
+    )
+    status, created_from, created_to, number = query.conditions
+    assert status.right.value == [CaseFileStatusEnum.OPEN, CaseFileStatusEnum.CLOSED]
+    assert created_from.right.value == datetime(2024, 1, 1)
+    assert created_to.right.value == datetime(2024, 2, 1)
+    assert number.right.value == "CF\\_1\\%%" and number.modifiers["escape"] == "\\"
+    assert query.sort_by == "date_created" and query.descending and query.sort == "-date_created"
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        {"sort": "case_file_number"},
+        {"case_file_status": "UNKNOWN"},
+        {"case_file_status__prefix": "OP"},
+        {"date_created": "2024-01-01"},
+        {"date_created__gte": "yesterday"},
+        {"case_file_status__in": ","},
+    ],
+)
+def test_parse_rejects_invalid_arguments(args):
+    """Assert that unsupported sorts, operators and values raise ValueError."""
+    with pytest.raises(ValueError):
+        SPEC.parse(MultiDict(args))
+
+
+def test_spec_rejects_sort_without_index():
+    """Assert that a sort on a column without an index is refused when the spec is created."""
+    with pytest.raises(ValueError):
+        ListQuerySpec(CaseFile, sorts=("id", "created_by"))
+
+
+def test_parse_sparse_fields():
+    """Assert that a sparse fieldset loads only its columns and relationships, and the sort column."""
+    query = SPEC.parse(MultiDict({"fields": "case_file_number,primary_officer.full_name", "sort": "date_created"}))
+    assert query.fields == ["case_file_number", "primary_officer.full_name"]
+    assert query.includes("primary_officer") and not query.includes("project")
+    statement = str(select(CaseFile).options(*query.options))
+    selected = statement.split(" FROM ")[0]
+    for column in ("id", "case_file_number", "primary_officer_id", "date_created"):
+        assert f"case_files.{column}," in f"{selected},"
+    assert "case_files.case_file_status" not in selected
+    assert "staff_users" in statement and "projects" not in statement
+
+    with pytest.raises(ValueError):
+        SPEC.parse(MultiDict({"fields": "id,initiation"}))
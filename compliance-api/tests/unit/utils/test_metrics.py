@@ -0,0 +1,66 @@
+# Copyright © 2024 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests to assure the metrics of the API and its outbound calls.
+
+Test-Suite to ensure that the outbound calls and cache lookups are exposed in the Prometheus format.
+"""
+import requests
+
+from compliance_api.services.http_client import OutboundClient
+from compliance_api.utils import metrics
+
+
+def test_outbound_call_is_recorded(app, client, mocker):
+    """Assert that an outbound call is exposed by the metrics endpoint and summed for the request."""
+    outbound = OutboundClient("test-metrics", "EPIC_TRACK_URL", "api/v1")
+    response = requests.Response()
+    response.status_code = 200
+    response._content = b'{"id": 1}'  # pylint: disable=protected-access
+    mocker.patch.object(outbound.session, "request", return_value=response)
+
+    with app.test_request_context():
+        metrics.start_request()
+        outbound.request("projects/12")
+        assert metrics.get_request_summary().startswith("test-metrics=1/")
+        assert metrics.get_request_summary().endswith("/9B")
+
+    result = client.get("/ops/metrics")
+    assert result.status_code == 200
+    assert result.mimetype == "text/plain"
+    body = result.get_data(as_text=True)
+    labels = 'upstream="test-metrics",endpoint="projects/{id}"'
+    assert f'compliance_outbound_requests_total{{{labels},method="GET",status="200"}} 1' in body
+    assert f'compliance_outbound_request_duration_seconds_bucket{{{labels},le="+Inf"}} 1' in body
+    assert f"compliance_outbound_response_bytes_total{{{labels}}} 9" in body
+
+    body = client.get("/ops/metrics").get_data(as_text=True)
+    assert 'compliance_http_request_duration_seconds_count{method="GET",route="/ops/metrics",status="200"}' in body
+
+
+def test_render_histogram_and_cache_counts():
+    """Assert the cumulative buckets of a histogram and the cache counters."""
+    registry = metrics._Registry()  # pylint: disable=protected-access
+    labels = (("upstream", "epic_track"), ("endpoint", "projects"))
+    registry.observe(metrics.OUTBOUND_DURATION, labels, 0.02)
+    registry.observe(metrics.OUTBOUND_DURATION, labels, 3)
+    registry.increment(metrics.CACHE_REQUESTS, (("cache", "projects"), ("result", "hit")), 2)
+
+    lines = registry.render().splitlines()
+    prefix = 'compliance_outbound_request_duration_seconds_bucket{upstream="epic_track",endpoint="projects"'
+    assert f'{prefix},le="0.01"}} 0' in lines
+    assert f'{prefix},le="0.025"}} 1' in lines
+    assert f'{prefix},le="5"}} 2' in lines
+    assert f'{prefix},le="+Inf"}} 2' in lines
+    assert 'compliance_outbound_request_duration_seconds_sum{upstream="epic_track",endpoint="projects"} 3.02' in lines
+    assert 'compliance_cache_requests_total{cache="projects",result="hit"} 2' in lines
@@ -0,0 +1,67 @@
+# Copyright © 2024 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests to assure the keyset pagination cursors.
+
+Test-Suite to ensure that the cursors round trip and malformed cursors are rejected.
+"""
+from datetime import datetime, timezone
+
+import pytest
+
+from compliance_api.models import pagination
+from compliance_api.models.pagination import decode_cursor, encode_cursor, for_each_batch
+
+
+@pytest.mark.parametrize(
+    "sort_value",
+    [42, "Smith", None, 1.5, True, datetime(2024, 11, 7, 14, 5, 52, 281937, tzinfo=timezone.utc)],
+)
+def test_cursor_round_trip(sort_value):
+    """Assert that the sort, sort value and id are read back from the cursor."""
+    assert decode_cursor(encode_cursor(sort_value, 7)) == ("id", sort_value, 7)
+    assert decode_cursor(encode_cursor(sort_value, 7, "-name")) == ("-name", sort_value, 7)
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "",
+        "not-a-cursor",
+        encode_cursor(1, 2)[:-2],
+        "WzEsIjIiXQ",
+        "WyJpZCIsMSwiMiJd",
+        "WyJpZCIsWzFdLDJd",
+        "WyJpZCIseyJhIjoxfSwyXQ",
+        "WzEsMSwyXQ",
+    ],
+)
+def test_malformed_cursor(cursor):
+    """Assert that malformed cursors raise ValueError."""
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
+
+
+def test_for_each_batch_on_stream(monkeypatch):
+    """Assert that a streamed result is handled in batches as it is iterated, and a list at once."""
+    monkeypatch.setattr(pagination, "STREAM_BATCH_SIZE", 2)
+    batches = []
+    rows = for_each_batch(iter(range(5)), batches.append)
+    assert not batches
+    assert next(rows) == 0 and batches == [[0, 1]]
+    assert list(rows) == [1, 2, 3, 4]
+    assert batches == [[0, 1], [2, 3], [4]]
+
+    batches = []
+    assert for_each_batch([1, 2, 3], batches.append) == [1, 2, 3]
+    assert batches == [[1, 2, 3]]
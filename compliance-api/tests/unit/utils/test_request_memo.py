@@ -0,0 +1,77 @@
+# Copyright © 2024 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests to assure the request-scoped memo.
+
+Test-Suite to ensure that lookups are done once per request.
+"""
+from sqlalchemy import event
+
+from compliance_api.models import Agency as AgencyModel
+from compliance_api.models import db
+from compliance_api.utils import request_memo
+
+
+def test_memoize_within_request(app):
+    """Assert that the loader runs once per request and hits are counted."""
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return {"id": 1}
+
+    with app.test_request_context():
+        request_memo.reset()
+        for _ in range(3):
+            assert request_memo.memoize("epic_track", "projects", 1, loader) == {"id": 1}
+        assert request_memo.get_hit_counts() == {"epic_track:projects": 2}
+
+        request_memo.forget("epic_track", "projects", 1)
+        request_memo.memoize("epic_track", "projects", 1, loader)
+    assert len(calls) == 2
+
+    with app.test_request_context():
+        request_memo.reset()
+        request_memo.memoize("epic_track", "projects", 1, loader)
+    assert len(calls) == 3
+
+
+def test_memoize_outside_request(app):
+    """Assert that nothing is memoized without a request."""
+    calls = []
+    for _ in range(2):
+        request_memo.memoize("epic_track", "projects", 1, lambda: calls.append(1))
+    assert len(calls) == 2
+
+
+def test_find_by_id_queries_once_per_request(app):
+    """Assert that find_by_id runs a single query until the session writes."""
+    statements = []
+
+    def count(*args):  # pylint: disable=unused-argument
+        statements.append(1)
+
+    engine = db.engine
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        with app.test_request_context():
+            request_memo.reset()
+            agency = AgencyModel.find_by_id(1)
+            assert AgencyModel.find_by_id(1) is agency
+            assert len(statements) == 1
+
+            request_memo.forget("db")
+            AgencyModel.find_by_id(1)
+            assert len(statements) == 2
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
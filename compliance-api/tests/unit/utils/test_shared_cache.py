@@ -0,0 +1,155 @@
+# Copyright © 2024 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests to assure the node-local shared cache.
+
+Test-Suite to ensure that cached entries are shared, revalidated and invalidated.
+"""
+import os
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from compliance_api.exceptions import UpstreamUnavailableError
+from compliance_api.utils.shared_cache import SharedCache
+
+
+@pytest.fixture
+def cache_config(app, monkeypatch):
+    """Set the ttl config keys used by the tests."""
+    monkeypatch.setitem(app.config, "TEST_CACHE_TTL", 300)
+    monkeypatch.setitem(app.config, "TEST_CACHE_STALE_TTL", 3600)
+    return app.config
+
+
+def _cache(tmp_path):
+    """Return a cache on the test file."""
+    return SharedCache("test", "TEST_CACHE_TTL", "TEST_CACHE_STALE_TTL", str(tmp_path / "cache.sqlite3"))
+
+
+def test_entries_are_shared_between_workers(cache_config, tmp_path):
+    """Assert that an entry loaded by one worker is served to the others."""
+    calls = []
+    first, second = _cache(tmp_path), _cache(tmp_path)
+
+    assert first.get_or_load(1, lambda: calls.append(1) or {"id": 1}) == {"id": 1}
+    assert second.get_or_load(1, lambda: calls.append(1) or {"id": 1}) == {"id": 1}
+    assert len(calls) == 1
+
+
+def test_stale_entry_is_served_while_revalidating(cache_config, tmp_path):
+    """Assert that a stale entry is returned and reloaded in the background."""
+    cache = _cache(tmp_path)
+    cache_config["TEST_CACHE_TTL"] = -1
+    cache.set(1, {"name": "old"})
+    cache_config["TEST_CACHE_TTL"] = 300
+
+    reloaded = threading.Event()
+
+    def loader():
+        reloaded.set()
+        return {"name": "new"}
+
+    assert cache.get_or_load(1, loader) == {"name": "old"}
+    assert reloaded.wait(5)
+    for _ in range(50):
+        if cache.get_or_load(1, loader) == {"name": "new"}:
+            break
+        time.sleep(0.01)
+    assert cache.get_or_load(1, loader) == {"name": "new"}
+
+
+def test_expired_entry_is_reloaded(cache_config, tmp_path):
+    """Assert that an entry past its stale period is loaded synchronously."""
+    cache = _cache(tmp_path)
+    cache_config["TEST_CACHE_TTL"] = -10
+    cache_config["TEST_CACHE_STALE_TTL"] = 5
+    cache.set(1, {"name": "old"})
+
+    assert cache.get_or_load(1, lambda: {"name": "new"}) == {"name": "new"}
+
+
+def test_invalidate(cache_config, tmp_path):
+    """Assert that an invalidated entry is loaded again."""
+    cache = _cache(tmp_path)
+    cache.set(1, {"name": "old"})
+    cache.invalidate(1)
+
+    assert cache.get_or_load(1, lambda: {"name": "new"}) == {"name": "new"}
+
+
+def test_load_racing_invalidate_is_not_stored(cache_config, tmp_path):
+    """Assert that a value loaded before an invalidation is not stored as fresh."""
+    cache = _cache(tmp_path)
+
+    def loader():
+        cache.invalidate(1)
+        return {"name": "old"}
+
+    assert cache.get_or_load(1, loader) == {"name": "old"}
+    assert cache.get_or_load(1, lambda: {"name": "new"}) == {"name": "new"}
+    assert cache.get_or_load(1, lambda: {"name": "newer"}) == {"name": "new"}
+
+
+def test_revalidation_racing_clear_is_not_stored(cache_config, tmp_path):
+    """Assert that a background revalidation that read before a clear does not store its value."""
+    cache = _cache(tmp_path)
+    cache_config["TEST_CACHE_TTL"] = -1
+    cache.set(1, {"name": "old"})
+    cache_config["TEST_CACHE_TTL"] = 300
+    loaded, cleared = threading.Event(), threading.Event()
+
+    def loader():
+        loaded.set()
+        cleared.wait(5)
+        return {"name": "stale"}
+
+    assert cache.get_or_load(1, loader) == {"name": "old"}
+    assert loaded.wait(5)
+    cache.clear()
+    cleared.set()
+    time.sleep(0.1)
+
+    assert cache.get_or_load(1, lambda: {"name": "new"}) == {"name": "new"}
+
+
+def test_expired_entry_is_served_when_upstream_unavailable(cache_config, tmp_path):
+    """Assert that an expired entry is served when the upstream can not be reached."""
+    cache = _cache(tmp_path)
+    cache_config["TEST_CACHE_TTL"] = -10
+    cache_config["TEST_CACHE_STALE_TTL"] = 5
+    cache.set(1, {"name": "old"})
+
+    def loader():
+        raise UpstreamUnavailableError("epic_track is unavailable")
+
+    assert cache.get_or_load(1, loader) == {"name": "old"}
+    with pytest.raises(UpstreamUnavailableError):
+        cache.get_or_load(2, loader)
+
+
+def test_invalidate_failure_is_logged(cache_config, tmp_path, mocker):
+    """Assert that a cache file that can not be written does not fail the invalidation."""
+    cache = _cache(tmp_path)
+    cache.set(1, {"name": "old"})
+    mocker.patch.object(cache, "_bump_generation", side_effect=sqlite3.OperationalError("database is locked"))
+
+    cache.invalidate(1)
+    cache.clear()
+
+
+def test_test_runs_use_their_own_cache_file(app):
+    """Assert that the tests do not share the cache file of the local workers."""
+    assert app.config["SHARED_CACHE_PATH"].endswith(f"compliance-api-test-cache-{os.getpid()}.sqlite3")
@@ -0,0 +1,134 @@
+# Copyright © 2024 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Test Utils.
+
+Builds model instances in memory, with their relationships, to dump them without a database.
+Every other row leaves the optional values empty, so both branches of the schemas are dumped.
+"""
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy.orm.attributes import set_committed_value
+
+from compliance_api.models import (
+    CaseFile, CaseFileInitiationOption, CaseFileStatusEnum, Complaint, ComplaintRequirementDetail, ComplaintSource,
+    ComplaintStatusEnum, Inspection, InspectionInitiationOption, InspectionStatusEnum, InspectionType,
+    InspectionTypeOption, IRStatusOption, Position, Project, ProjectStatusOption, RequirementSource, StaffUser, Topic)
+
+
+START = datetime(2024, 11, 7, 14, 5, 52, 281937, tzinfo=timezone.utc)
+
+
+def build_staff_user(index: int) -> StaffUser:
+    """Return a staff user with a position; every other one has a supervisor and a permission."""
+    user = StaffUser(
+        id=index,
+        first_name=f"First {index}",
+        last_name=f"Last {index}",
+        auth_user_guid=f"guid-{index}",
+        position_id=1,
+        position=Position(id=1, name="Compliance Officer"),
+        is_active=True,
+    )
+    if index % 2:
+        user.supervisor_id = index + 1
+        user.supervisor = StaffUser(id=index + 1, first_name="Super", last_name="Visor", is_active=True)
+        user.permission = "SUPERUSER"
+    return user
+
+
+def build_case_file(index: int) -> CaseFile:
+    """Return a case file with its officer and initiation; every other one has a project."""
+    return CaseFile(
+        id=index,
+        case_file_number=f"CF-{index:06d}",
+        case_file_status=CaseFileStatusEnum.OPEN if index % 2 else CaseFileStatusEnum.CLOSED,
+        date_created=START + timedelta(minutes=index),
+        primary_officer_id=index,
+        primary_officer=build_staff_user(index),
+        initiation_id=1,
+        initiation=CaseFileInitiationOption(id=1, name="Inspection"),
+        project_id=index if index % 2 else None,
+        project=_build_project(index) if index % 2 else None,
+        is_active=True,
+    )
+
+
+def build_inspection(index: int) -> Inspection:
+    """Return an inspection with its case file, officer, options and types; every other one has a project."""
+    inspection = Inspection(
+        id=index,
+        ir_number=f"IR-{index:06d}",
+        case_file_id=index,
+        case_file=build_case_file(index),
+        project_id=index if index % 2 else None,
+        project=_build_project(index) if index % 2 else None,
+        project_description="A long description of the project " * 5,
+        location_description=f"Location {index}" if index % 2 else None,
+        utm="10U 500000 5500000",
+        primary_officer_id=index,
+        primary_officer=build_staff_user(index),
+        start_date=START + timedelta(days=index),
+        end_date=START + timedelta(days=index, hours=8),
+        initiation_id=1,
+        initiation=InspectionInitiationOption(id=1, name="Planned"),
+        ir_status_id=1 if index % 2 else None,
+        ir_status=IRStatusOption(id=1, name="Draft") if index % 2 else None,
+        inspection_status=InspectionStatusEnum.OPEN if index % 2 else None,
+        project_status_id=1,
+        project_status=ProjectStatusOption(id=1, name="Operation"),
+        types=[InspectionType(type=InspectionTypeOption(id=1, name="Site Visit"))] if index % 2 else [],
+        is_active=True,
+    )
+    if index % 2:
+        inspection.authorization = f"EAC-{index}"
+        inspection.regulated_party = "Proponent Ltd."
+        inspection.type = "Mines"
+        inspection.sub_type = "Coal"
+    return inspection
+
+
+def build_complaint(index: int) -> Complaint:
+    """Return a complaint with its case file, officer, source and requirement; every other one has a project."""
+    complaint = Complaint(
+        id=index,
+        complaint_number=f"C-{index:06d}",
+        case_file_id=index,
+        case_file=build_case_file(index),
+        project_id=index if index % 2 else None,
+        project=_build_project(index) if index % 2 else None,
+        concern_description="A long description of the concern " * 5,
+        location_description=f"Location {index}",
+        primary_officer_id=index,
+        primary_officer=build_staff_user(index),
+        date_received=START + timedelta(hours=index),
+        source_type_id=1,
+        source_type=ComplaintSource(id=1, name="Public"),
+        requirement_source_id=1,
+        requirement_source=RequirementSource(id=1, name="Schedule B"),
+        requirement_detail=ComplaintRequirementDetail(topic=Topic(id=1, name="Dust")),
+        status=ComplaintStatusEnum.OPEN,
+        is_active=True,
+    )
+    if index % 2:
+        complaint.source_first_nation_id = 7
+        complaint.source_first_nation = {"id": 7, "name": "Nation"}
+    return complaint
+
+
+def _build_project(index: int) -> Project:
+    """Return a project, set as if loaded since the model is read-only."""
+    project = Project.__mapper__.class_manager.new_instance()
+    for key, value in {"id": index, "name": f"Project {index}", "abbreviation": f"P{index}"[:10]}.items():
+        set_committed_value(project, key, value)
+    return project